@@ -22,15 +22,15 @@ def dtype_infos(dtype):
         raise TypeError("Unknown dtype '%s' to get type info." % dtype)
 
 
-def scatter_reduce_sum(indices, values, shape):
+def scatter_reduce_sum(indices, values, shape, indices_are_sorted: bool = False):
     zeros = jnp.zeros(shape, values.dtype)
-    return zeros.at[indices].add(values)
+    return zeros.at[indices].add(values, indices_are_sorted=indices_are_sorted)
 
 
-def scatter_reduce_min(indices, values, shape):
+def scatter_reduce_min(indices, values, shape, indices_are_sorted: bool = False):
     max_of_dtype = dtype_infos(values.dtype).max
     zeros = jnp.full(shape, max_of_dtype, values.dtype)
-    out = zeros.at[indices].min(values)
+    out = zeros.at[indices].min(values, indices_are_sorted=indices_are_sorted)
     if global_safe_scatter_max_min_to_zero:
         has_scattered = jnp.zeros(shape, "bool")
         has_scattered = has_scattered.at[indices].set(jnp.ones_like(values, dtype="bool"))
@@ -38,10 +38,10 @@ def scatter_reduce_min(indices, values, shape):
     return out
 
 
-def scatter_reduce_max(indices, values, shape):
+def scatter_reduce_max(indices, values, shape, indices_are_sorted: bool = False):
     min_of_dtype = dtype_infos(values.dtype).min
     zeros = jnp.full(shape, min_of_dtype, values.dtype)
-    out = zeros.at[indices].max(values)
+    out = zeros.at[indices].max(values, indices_are_sorted=indices_are_sorted)
     if global_safe_scatter_max_min_to_zero:
         has_scattered = jnp.zeros(shape, "bool")
         has_scattered = has_scattered.at[indices].set(jnp.ones_like(values, dtype="bool"))
@@ -49,25 +49,25 @@ def scatter_reduce_max(indices, values, shape):
     return out
 
 
-def scatter_reduce_mean(indices, values, shape):
+def scatter_reduce_mean(indices, values, shape, indices_are_sorted: bool = False):
     zeros = jnp.zeros(shape, values.dtype)
     counts = jnp.zeros(shape, values.dtype)
-    counts = counts.at[indices].add(jnp.ones_like(values))
+    counts = counts.at[indices].add(jnp.ones_like(values), indices_are_sorted=indices_are_sorted)
     inverse_counts = jnp.nan_to_num(jnp.reciprocal(counts), posinf=0.0, neginf=0.0, nan=0.0)
-    return zeros.at[indices].add(values)*inverse_counts
+    return zeros.at[indices].add(values, indices_are_sorted=indices_are_sorted)*inverse_counts
 
 
-def scatter_reduce_softmax(indices, values, shape, normalize: bool = False):
+def scatter_reduce_softmax(indices, values, shape, normalize: bool = False, indices_are_sorted: bool = False):
 
     if normalize:
         zeros_min = jnp.zeros(shape, values.dtype)  # Zero is okay here
-        data_segment_max = zeros_min.at[indices].max(values)
+        data_segment_max = zeros_min.at[indices].max(values, indices_are_sorted=indices_are_sorted)
         data_max = jnp.take(data_segment_max, indices, axis=0)
         values = values - data_max
 
     values_exp = jnp.exp(values)
     zeros = jnp.zeros(shape, values.dtype)
-    values_exp_sum = zeros.at[indices].add(values_exp)
+    values_exp_sum = zeros.at[indices].add(values_exp, indices_are_sorted=indices_are_sorted)
     values_exp_sum = jnp.take(values_exp_sum, indices, axis=0)
     return values_exp / values_exp_sum
 
@@ -1,2 +1,53 @@
+import numpy as np
+from kgcnn import __safe_scatter_max_min_to_zero__ as global_safe_scatter_max_min_to_zero
+
+
+def _dtype_limit(dtype, use_max: bool):
+    info = np.finfo(dtype) if np.issubdtype(dtype, np.floating) else np.iinfo(dtype)
+    return info.max if use_max else info.min
+
+
+def _segment_reduce(ufunc, indices, values, shape, fill_value, indices_are_sorted: bool = False):
+    # Sort indices once and reduce contiguous groups, instead of unbuffered `ufunc.at` on every row.
+    out = np.full(shape, fill_value, dtype=values.dtype)
+    if len(indices) == 0:
+        return out
+    if not indices_are_sorted:
+        order = np.argsort(indices, kind="stable")
+        indices, values = indices[order], values[order]
+    starts = np.flatnonzero(np.concatenate([[True], indices[1:] != indices[:-1]]))
+    out[indices[starts]] = ufunc.reduceat(values, starts, axis=0)
+    return out
+
+
+def scatter_reduce_sum(indices, values, shape, indices_are_sorted: bool = False):
+    return _segment_reduce(np.add, indices, values, shape, 0, indices_are_sorted)
+
+
+def scatter_reduce_min(indices, values, shape, indices_are_sorted: bool = False):
+    fill_value = 0 if global_safe_scatter_max_min_to_zero else _dtype_limit(values.dtype, use_max=True)
+    return _segment_reduce(np.minimum, indices, values, shape, fill_value, indices_are_sorted)
+
+
+def scatter_reduce_max(indices, values, shape, indices_are_sorted: bool = False):
+    fill_value = 0 if global_safe_scatter_max_min_to_zero else _dtype_limit(values.dtype, use_max=False)
+    return _segment_reduce(np.maximum, indices, values, shape, fill_value, indices_are_sorted)
+
+
+def scatter_reduce_mean(indices, values, shape, indices_are_sorted: bool = False):
+    values_sum = scatter_reduce_sum(indices, values, shape, indices_are_sorted)
+    counts = np.bincount(indices, minlength=shape[0]).reshape([-1] + [1] * (len(shape) - 1))
+    return (values_sum / np.maximum(counts, 1)).astype(values.dtype)
+
+
+def scatter_reduce_softmax(indices, values, shape, normalize: bool = False, indices_are_sorted: bool = False):
+    if normalize:
+        data_segment_max = _segment_reduce(np.maximum, indices, values, shape, 0, indices_are_sorted)
+        values = values - np.take(data_segment_max, indices, axis=0)
+    values_exp = np.exp(values)
+    values_exp_sum = scatter_reduce_sum(indices, values_exp, shape, indices_are_sorted)
+    return values_exp / np.take(values_exp_sum, indices, axis=0)
+
+
 def decompose_ragged_tensor(x):
-    raise NotImplementedError("Operation not supported by this backend '%s'." % __name__)
\ No newline at end of file
+    raise NotImplementedError("Operation not supported by this backend '%s'." % __name__)
@@ -2,12 +2,24 @@ import tensorflow as tf
 from kgcnn import __safe_scatter_max_min_to_zero__ as global_safe_scatter_max_min_to_zero
 
 
-def scatter_reduce_sum(indices, values, shape):
+def _pad_segments(out, shape):
+    # Sorted segment reductions only return up to the largest index, fill up the remaining rows with zeros.
+    num_missing = tf.cast(shape[0], dtype="int64") - tf.shape(out, out_type="int64")[0]
+    paddings = [[0, num_missing]] + [[0, 0]] * (len(out.shape) - 1)
+    return tf.pad(out, paddings)
+
+
+def scatter_reduce_sum(indices, values, shape, indices_are_sorted: bool = False):
+    if indices_are_sorted:
+        return _pad_segments(tf.math.segment_sum(values, indices), shape)
     indices = tf.expand_dims(indices, axis=1)
     return tf.scatter_nd(indices, values, tf.cast(shape, dtype="int64"))
 
 
-def scatter_reduce_min(indices, values, shape):
+def scatter_reduce_min(indices, values, shape, indices_are_sorted: bool = False):
+    if indices_are_sorted and global_safe_scatter_max_min_to_zero:
+        # Empty segments are zero for sorted segment reductions.
+        return _pad_segments(tf.math.segment_min(values, indices), shape)
     indices = tf.expand_dims(indices, axis=1)
     target = tf.cast(tf.fill(shape, values.dtype.max), dtype=values.dtype)
     out = tf.tensor_scatter_nd_min(target, indices, values)
@@ -17,7 +29,9 @@ def scatter_reduce_min(indices, values, shape):
     return out
 
 
-def scatter_reduce_max(indices, values, shape):
+def scatter_reduce_max(indices, values, shape, indices_are_sorted: bool = False):
+    if indices_are_sorted and global_safe_scatter_max_min_to_zero:
+        return _pad_segments(tf.math.segment_max(values, indices), shape)
     indices = tf.expand_dims(indices, axis=1)
     target = tf.cast(tf.fill(shape, values.dtype.min), dtype=values.dtype)
     out = tf.tensor_scatter_nd_max(target, indices, values)
@@ -27,13 +41,23 @@ def scatter_reduce_max(indices, values, shape):
     return out
 
 
-def scatter_reduce_mean(indices, values, shape):
+def scatter_reduce_mean(indices, values, shape, indices_are_sorted: bool = False):
+    if indices_are_sorted:
+        return _pad_segments(tf.math.segment_mean(values, indices), shape)
     indices = tf.expand_dims(indices, axis=1)
     counts = tf.scatter_nd(indices, tf.ones_like(values), shape)
     return tf.math.divide_no_nan(tf.scatter_nd(indices, values, shape), counts)
 
 
-def scatter_reduce_softmax(indices, values, shape, normalize: bool = False):
+def scatter_reduce_softmax(indices, values, shape, normalize: bool = False, indices_are_sorted: bool = False):
+    if indices_are_sorted:
+        # Segment reductions on sorted indices. Result is only gathered at indices, so the number of segments may be
+        # smaller than the target shape.
+        if normalize:
+            values = values - tf.gather(tf.math.segment_max(values, indices), indices, axis=0)
+        values_exp = tf.math.exp(values)
+        return values_exp / tf.gather(tf.math.segment_sum(values_exp, indices), indices, axis=0)
+
     indices_scatter = tf.expand_dims(indices, axis=1)
 
     if normalize:
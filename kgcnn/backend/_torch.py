@@ -1,15 +1,26 @@
 import torch
 
 
-def scatter_reduce_sum(indices, values, shape):
-    dims_to_add = values.dim() - indices.dim()
-    for _ in range(dims_to_add):
-        indices = torch.unsqueeze(indices, dim=-1)
-    return torch.zeros(*shape, dtype=values.dtype, device=values.device).scatter_reduce(
-        0, torch.broadcast_to(indices, values.shape), values, reduce='sum')
-
-
-def scatter_reduce_min(indices, values, shape):
+def _segment_reduce(indices, values, shape, reduce: str):
+    # Reduce consecutive segments of sorted indices. Empty segments are set to zero.
+    lengths = torch.bincount(indices, minlength=shape[0])
+    out = torch.segment_reduce(values, reduce, lengths=lengths, axis=0, unsafe=True)
+    if reduce != "sum":
+        is_empty = torch.reshape(lengths == 0, [-1] + [1] * (values.dim() - 1))
+        out = torch.where(is_empty, torch.zeros_like(out), out)
+    return out
+
+
+def scatter_reduce_sum(indices, values, shape, indices_are_sorted: bool = False):
+    if indices_are_sorted:
+        return _segment_reduce(indices, values, shape, "sum")
+    # Adding whole rows with `index_add` does not require to broadcast the indices to the full shape of values.
+    return torch.zeros(*shape, dtype=values.dtype, device=values.device).index_add_(0, indices, values)
+
+
+def scatter_reduce_min(indices, values, shape, indices_are_sorted: bool = False):
+    if indices_are_sorted:
+        return _segment_reduce(indices, values, shape, "min")
     dims_to_add = values.dim() - indices.dim()
     for _ in range(dims_to_add):
         indices = torch.unsqueeze(indices, dim=-1)
@@ -17,7 +28,9 @@ def scatter_reduce_min(indices, values, shape):
         0, torch.broadcast_to(indices, values.shape), values, reduce='amin', include_self=False)
 
 
-def scatter_reduce_max(indices, values, shape):
+def scatter_reduce_max(indices, values, shape, indices_are_sorted: bool = False):
+    if indices_are_sorted:
+        return _segment_reduce(indices, values, shape, "max")
     dims_to_add = values.dim() - indices.dim()
     for _ in range(dims_to_add):
         indices = torch.unsqueeze(indices, dim=-1)
@@ -25,7 +38,9 @@ def scatter_reduce_max(indices, values, shape):
         0, torch.broadcast_to(indices, values.shape), values, reduce='amax', include_self=False)
 
 
-def scatter_reduce_mean(indices, values, shape):
+def scatter_reduce_mean(indices, values, shape, indices_are_sorted: bool = False):
+    if indices_are_sorted:
+        return _segment_reduce(indices, values, shape, "mean")
     dims_to_add = values.dim() - indices.dim()
     for _ in range(dims_to_add):
         indices = torch.unsqueeze(indices, dim=-1)
@@ -33,7 +48,17 @@ def scatter_reduce_mean(indices, values, shape):
         0, torch.broadcast_to(indices, values.shape), values, reduce='mean', include_self=False)
 
 
-def scatter_reduce_softmax(indices, values, shape, normalize: bool = False):
+def scatter_reduce_softmax(indices, values, shape, normalize: bool = False, indices_are_sorted: bool = False):
+    if indices_are_sorted:
+        # Segment reductions with lengths of consecutive indices.
+        lengths = torch.bincount(indices, minlength=shape[0])
+        if normalize:
+            data_max = torch.segment_reduce(values, "max", lengths=lengths, axis=0, unsafe=True)
+            values = values - torch.index_select(data_max, dim=0, index=indices)
+        values_exp = torch.exp(values)
+        values_exp_sum = torch.segment_reduce(values_exp, "sum", lengths=lengths, axis=0, unsafe=True)
+        return values_exp / torch.index_select(values_exp_sum, dim=0, index=indices)
+
     indices_scatter = indices
     dims_to_add = values.dim()-indices.dim()
     for _ in range(dims_to_add):
@@ -48,8 +73,7 @@ def scatter_reduce_softmax(indices, values, shape, normalize: bool = False):
 
     values_exp = torch.exp(values)
     zeros = torch.zeros(*shape, dtype=values.dtype, device=values.device)
-    values_exp_sum = zeros.scatter_reduce(
-        0, torch.broadcast_to(indices_scatter, values_exp.shape), values_exp, reduce='sum', include_self=True)
+    values_exp_sum = zeros.index_add_(0, indices, values_exp)
     values_exp_sum = torch.index_select(values_exp_sum, dim=0, index=indices)
     return values_exp / values_exp_sum
 
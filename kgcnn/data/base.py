@@ -2,6 +2,8 @@ import logging
 import numpy as np
 import pandas as pd
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from sklearn.model_selection import KFold
 from kgcnn.io.loader import tf_dataset_disjoint_generator
 # import typing as t
@@ -10,7 +12,14 @@ from typing import Union, List, Callable, Dict, Optional
 
 from kgcnn.data.utils import (
     save_pickle_file, load_pickle_file, ragged_tensor_from_nested_numpy, pad_np_array_list_batch_dim)
-from kgcnn.graph.base import GraphDict
+from kgcnn.graph.base import GraphDict, GraphPreProcessorBase
+from kgcnn.graph.serial import get_preprocessor
+
+try:
+    # Optional faster engine for reading csv files with pandas.
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 # Module logger
 logging.basicConfig()
@@ -18,6 +27,92 @@ module_logger = logging.getLogger(__name__)
 module_logger.setLevel(logging.INFO)
 
 
+def _map_method_on_graph(graph: GraphDict, method: Union[str, Callable], kwargs: dict) -> GraphDict:
+    r"""Apply a method to a single :obj:`GraphDict` . Module-level function in order to be picklable for
+    :obj:`MemoryGraphList.map_list` with multiple workers.
+
+    Args:
+        graph (GraphDict): Graph to apply method on.
+        method (str, Callable): Name of the :obj:`GraphDict` method or preprocessor, or a callable.
+        kwargs (dict): Kwargs for `method`.
+
+    Returns:
+        GraphDict: The modified graph.
+    """
+    # Preprocessor that has already been resolved.
+    if isinstance(method, GraphPreProcessorBase):
+        graph.apply_preprocessor(method)
+    # Method by name.
+    elif isinstance(method, str):
+        # If this is a class method.
+        if hasattr(graph, method):
+            getattr(graph, method)(**kwargs)
+        else:
+            # For compatibility names can refer to preprocessors.
+            graph.apply_preprocessor(name=method, **kwargs)
+    else:
+        # For any callable method to map.
+        method(graph, **kwargs)
+    return graph
+
+
+def _to_flat_value_lists(value_lists: Dict[str, list]) -> dict:
+    r"""Store lists of arrays column-wise as concatenated values and row splits, e.g. for a '.npz' file.
+
+    Args:
+        value_lists (dict): Lists of arrays for each property name. Missing values are `None` .
+
+    Returns:
+        dict: Arrays 'name/values', 'name/row_splits' and 'name/is_set' for each property and 'name/scalar' for
+        properties of scalars.
+    """
+    out = {}
+    for key, props in value_lists.items():
+        is_set = np.array([p is not None for p in props], dtype="bool")
+        valid = [np.asarray(p) for p in props if p is not None]
+        if any([p.dtype.hasobject for p in valid]):
+            raise ValueError("Can not save property '%s' of python objects to 'npz'." % key)
+        if all([len(p.shape) == 0 for p in valid]):
+            values = np.stack(valid, axis=0) if len(valid) > 0 else np.zeros((0,))
+            row_splits = np.arange(len(valid) + 1, dtype="int64")
+            out["%s/scalar" % key] = np.array(True)
+        else:
+            if not all([len(p.shape) > 0 and p.shape[1:] == valid[0].shape[1:] for p in valid]):
+                raise ValueError("Can not save property '%s' with different inner shape to 'npz'." % key)
+            values = np.concatenate(valid, axis=0)
+            row_splits = np.pad(np.cumsum([len(p) for p in valid], dtype="int64"), [1, 0])
+        out["%s/values" % key] = values
+        out["%s/row_splits" % key] = row_splits
+        out["%s/is_set" % key] = is_set
+    return out
+
+
+def _from_flat_value_lists(data) -> Dict[str, list]:
+    r"""Make lists of arrays for each property from data of :obj:`_to_flat_value_lists` .
+
+    Args:
+        data: Dictionary or loaded '.npz' file of flat arrays.
+
+    Returns:
+        dict: Lists of arrays for each property name. Missing values are `None` .
+    """
+    value_lists = {}
+    keys = [x[:-len("/values")] for x in data.keys() if x.endswith("/values")]
+    for key in keys:
+        values = data["%s/values" % key]
+        row_splits = data["%s/row_splits" % key]
+        is_set = data["%s/is_set" % key]
+        if "%s/scalar" % key in data:
+            props = [values[i] for i in range(len(values))]
+        else:
+            props = np.split(values, row_splits[1:-1]) if len(row_splits) > 1 else []
+        value_list = [None] * len(is_set)
+        for i, p in zip(np.nonzero(is_set)[0], props):
+            value_list[i] = p
+        value_lists[key] = value_list
+    return value_lists
+
+
 class MemoryGraphList(list):
     r"""Class to store a list of graph dictionaries in memory.
 
@@ -111,6 +206,50 @@ class MemoryGraphList(list):
 
         return prop_list
 
+    def obtain_property_flat(self, key: str, dtype: str = None) -> Union[tuple, None]:
+        r"""Returns the values of all graphs for property `key` concatenated along the first axis, together with the
+        number of values of each graph. The property must be defined for all graphs, consider running :obj:`clean`.
+
+        .. code-block:: python
+
+            values, row_lengths = data.obtain_property_flat("node_attributes")
+            # values[row_splits[i]:row_splits[i+1]] with row_splits = np.pad(np.cumsum(row_lengths), [1, 0])
+
+        Args:
+            key (str): The string name of the property to be retrieved for all the graphs contained in this list.
+            dtype (str): Data type of the concatenated values. Default is None.
+
+        Returns:
+            tuple: Flat values of shape `(sum(row_lengths), ...)` and row lengths of shape `(N, )` .
+        """
+        prop_list = self.obtain_property(key)
+        if prop_list is None:
+            return None
+        if any([x is None for x in prop_list]):
+            raise ValueError("Property '%s' is not defined for all graphs. Run `clean()` first." % key)
+        row_lengths = np.fromiter(map(len, prop_list), dtype="int64", count=len(prop_list))
+        values = np.concatenate(prop_list, axis=0, dtype=dtype)
+        return values, row_lengths
+
+    def assign_property_flat(self, key: str, values: np.ndarray, row_lengths: np.ndarray):
+        r"""Assign a property from values of all graphs concatenated along the first axis. The graphs hold views on
+        the flat values, which means that the property is stored in a single contiguous memory block.
+
+        Args:
+            key (str): Name of the property.
+            values (np.ndarray): Concatenated values of shape `(sum(row_lengths), ...)` .
+            row_lengths (np.ndarray): Number of values for each graph of shape `(N, )` .
+
+        Returns:
+            self
+        """
+        values = np.asarray(values)
+        row_lengths = np.asarray(row_lengths, dtype="int64")
+        row_splits = np.cumsum(row_lengths)
+        if len(row_splits) > 0 and row_splits[-1] != len(values):
+            raise ValueError("Row lengths do not match number of values for property '%s'." % key)
+        return self.assign_property(key, np.split(values, row_splits[:-1]))
+
     def __getitem__(self, item) -> Union[GraphDict, List]:
         # Does not make a copy of the data, as a python list does.
         if isinstance(item, int):
@@ -120,7 +259,8 @@ class MemoryGraphList(list):
         if isinstance(item, (list, tuple)):
             return MemoryGraphList([super(MemoryGraphList, self).__getitem__(int(i)) for i in item])
         if isinstance(item, np.ndarray):
-            return MemoryGraphList([super(MemoryGraphList, self).__getitem__(int(i)) for i in item])
+            # Convert indices to python integers at once and map the list lookup, e.g. for train/test splits.
+            return MemoryGraphList(map(super(MemoryGraphList, self).__getitem__, item.astype("int64").tolist()))
         if isinstance(item, (np.uint8, np.int32, np.int64)):
             return super(MemoryGraphList, self).__getitem__(int(item))
         raise TypeError("Unsupported type '%s' for `MemoryGraphList` items." % type(item))
@@ -223,7 +363,7 @@ class MemoryGraphList(list):
         else:
             raise TypeError("Wrong type, expected e.g. [{'name': 'edge_indices', 'ragged': True}, {...}, ...]")
 
-    def map_list(self, method: Union[str, Callable], **kwargs):
+    def map_list(self, method: Union[str, Callable], num_workers: int = 1, **kwargs):
         r"""Map a method over this list and apply on each :obj:`GraphDict`.
         For :obj:`method` being string, either a class-method or a preprocessor is chosen for backward compatibility.
 
@@ -232,29 +372,36 @@ class MemoryGraphList(list):
             for i, x in enumerate(self):
                 method(x, **kwargs)
 
+        With :obj:`num_workers` larger than one, the graphs are processed in a pool of worker processes and the
+        returned graphs replace the items of this list. Note that :obj:`method` and all `kwargs` must be picklable.
+
         Args:
             method (str): Name of the :obj:`GraphDict` method.
+            num_workers (int): Number of worker processes. If None, :obj:`os.cpu_count()` is used. Default is 1.
             kwargs: Kwargs for `method`.
 
         Returns:
             self
         """
-        # Can add progress info here.
-        # Method by name.
-        if isinstance(method, str):
-            for i, x in enumerate(self):
-                # If this is a class method.
-                if hasattr(x, method):
-                    getattr(x, method)(**kwargs)
-                else:
-                    # For compatibility names can refer to preprocessors.
-                    x.apply_preprocessor(name=method, **kwargs)
-        elif isinstance(method, dict):
+        if isinstance(method, dict):
             raise NotImplementedError("Serialization for method in `map_list` is not yet supported")
-        else:
-            # For any callable method to map.
-            for i, x in enumerate(self):
-                method(x, **kwargs)
+        if isinstance(method, str) and not hasattr(GraphDict, method):
+            # Resolve the preprocessor by name only once and not for each graph.
+            method = get_preprocessor(method, **kwargs)
+            kwargs = {}
+        if num_workers is None:
+            num_workers = os.cpu_count()
+        if num_workers > 1 and len(self) > 1:
+            chunk_size = max(int(len(self) / (4 * num_workers)), 1)
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                results = list(executor.map(
+                    _map_method_on_graph, self, repeat(method), repeat(kwargs), chunksize=chunk_size))
+            for i, x in enumerate(results):
+                self[i] = x
+            return self
+        # Can add progress info here.
+        for x in self:
+            _map_method_on_graph(x, method, kwargs)
         return self
 
     def clean(self, inputs: Union[list, str]):
@@ -273,7 +420,7 @@ class MemoryGraphList(list):
         """
         if isinstance(inputs, str):
             inputs = [inputs]
-        invalid_graphs = []
+        is_valid = np.ones(len(self), dtype="bool")
         for item in inputs:
             # If this is a list of dict, which are the config for ks.layers.Input(), we pick 'name'.
             if isinstance(item, dict):
@@ -284,27 +431,29 @@ class MemoryGraphList(list):
             if props is None:
                 self.logger.warning("Can not clean property '%s' as it was not assigned to any graph." % item)
                 continue
-            for i, x in enumerate(props):
-                # If property is neither list nor np.array
-                if x is None or not hasattr(x, "__getitem__"):
-                    self.logger.info("Property '%s' is not defined for graph '%s'." % (item_name, i))
-                    invalid_graphs.append(i)
-                elif not isinstance(x, np.ndarray):
-                    self.logger.info("Property '%s' is not a numpy array for graph '%s'." % (item_name, i))
-                    invalid_graphs.append(i)
-                elif len(x.shape) > 0:
-                    if len(x) <= 0:
-                        self.logger.info("Property '%s' is an empty list for graph '%s'." % (item_name, i))
-                        invalid_graphs.append(i)
-        invalid_graphs = np.unique(np.array(invalid_graphs, dtype="int"))
-        invalid_graphs = np.flip(invalid_graphs)  # Need descending order for pop()
+            # If property is neither list nor np.array
+            is_defined = np.fromiter(
+                (x is not None and hasattr(x, "__getitem__") for x in props), dtype="bool", count=len(props))
+            is_array = np.fromiter((isinstance(x, np.ndarray) for x in props), dtype="bool", count=len(props))
+            is_empty = np.fromiter(
+                (isinstance(x, np.ndarray) and len(x.shape) > 0 and len(x) <= 0 for x in props),
+                dtype="bool", count=len(props))
+            for mask, msg in [(np.logical_not(is_defined), "is not defined"),
+                              (np.logical_and(is_defined, np.logical_not(is_array)), "is not a numpy array"),
+                              (is_empty, "is an empty list")]:
+                if np.any(mask):
+                    self.logger.info("Property '%s' %s for graphs '%s'." % (item_name, msg, np.nonzero(mask)[0]))
+            is_valid = np.logical_and(is_valid, np.logical_and(is_array, np.logical_not(is_empty)))
+        invalid_graphs = np.nonzero(np.logical_not(is_valid))[0]
+        invalid_graphs = np.flip(invalid_graphs)  # Descending order as for pop()
         if len(invalid_graphs) > 0:
             self.logger.warning("Found invalid graphs for properties. Removing graphs '%s'." % invalid_graphs)
+            # Remove all invalid graphs at once instead of pop() for each graph.
+            valid_graphs = [x for x, v in zip(self, is_valid) if v]
+            self.clear()
+            self.extend(valid_graphs)
         else:
             self.logger.info("No invalid graphs for assigned properties found.")
-        # Remove from the end via pop().
-        for i in invalid_graphs:
-            self.pop(int(i))
         return invalid_graphs
 
     def rename_property_on_graphs(self, old_property_name: str, new_property_name: str) -> list:
@@ -397,6 +546,8 @@ class MemoryGraphDataset(MemoryGraphList):
         self.data_frame = None
         self.data_keys = None
         self.data_unit = None
+        # File stats of the table file that `data_frame` has been read from.
+        self._data_frame_source = None
 
     def _verify_data_directory(self) -> Union[str, None]:
         r"""Utility function that checks if `data_directory` is set correctly."""
@@ -437,42 +588,89 @@ class MemoryGraphDataset(MemoryGraphList):
         """Pass error to class' logger instance."""
         self.logger.error(*args, **kwargs)
 
-    def save(self, filepath: str = None):
+    def save(self, filepath: str = None, file_format: str = "pickle"):
         r"""Save all graph properties to python dictionary as pickled file. By default, saves a file named
         :obj:`dataset_name.kgcnn.pickle` in :obj:`data_directory` .
 
+        With :obj:`file_format='npz'` , each property is stored column-wise as concatenated values and row splits in a
+        compressed numpy '.npz' file, which avoids pickling python objects for each graph. The default file is then
+        :obj:`dataset_name.kgcnn.npz` in :obj:`data_directory` .
+
         Args:
             filepath (str): Full path of output file. Default is None.
+            file_format (str): Either 'pickle' or 'npz'. Default is 'pickle'.
         """
+        if file_format not in ["pickle", "npz"]:
+            raise ValueError("Unsupported file format '%s' for saving dataset." % file_format)
         if filepath is None:
-            filepath = os.path.join(self.data_directory, self.dataset_name + ".kgcnn.pickle")
+            filepath = os.path.join(self.data_directory, self.dataset_name + ".kgcnn.%s" % file_format)
+        if file_format == "npz":
+            self.info("Save dataset to compressed numpy file...")
+            np.savez_compressed(filepath, **self._to_flat_arrays())
+            return self
         self.info("Pickle dataset...")
         save_pickle_file([x.to_dict() for x in self], filepath)
         return self
 
-    def load(self, filepath: str = None):
+    def _to_flat_arrays(self) -> dict:
+        r"""Column-wise flat values and row splits of all properties for saving to file."""
+        keys = []
+        for x in self:
+            keys += [k for k in x.keys() if k not in keys]
+        out = {"num_graphs": np.array(len(self), dtype="int64")}
+        out.update(_to_flat_value_lists({key: [x[key] if key in x else None for x in self] for key in keys}))
+        return out
+
+    def _from_flat_arrays(self, data) -> list:
+        r"""Make list of graph dictionaries from data of :obj:`_to_flat_arrays` ."""
+        num_graphs = int(data["num_graphs"])
+        graphs = [{} for _ in range(num_graphs)]
+        for key, value_list in _from_flat_value_lists(data).items():
+            for i, p in enumerate(value_list):
+                if p is not None:
+                    graphs[i][key] = p
+        return graphs
+
+    def load(self, filepath: str = None, dtype: Dict[str, str] = None):
         r"""Load graph properties from a pickled file. By default, loads a file named
         :obj:`dataset_name.kgcnn.pickle` in :obj:`data_directory` .
+        Files with '.npz' extension written by :obj:`save` are loaded from column-wise storage.
 
         Args:
             filepath (str): Full path of input file.
+            dtype (dict): Optional dictionary of property names and data types to cast properties on load, to reduce
+                memory, e.g. `{"node_coordinates": "float32", "node_attributes": "float16"}` . Default is None.
         """
         if filepath is None:
             filepath = os.path.join(self.data_directory, self.dataset_name + ".kgcnn.pickle")
-        self.info("Load pickled dataset...")
-        in_list = load_pickle_file(filepath)
+        if os.path.splitext(filepath)[1] == ".npz":
+            self.info("Load dataset from compressed numpy file...")
+            with np.load(filepath) as data:
+                in_list = self._from_flat_arrays(data)
+        else:
+            self.info("Load pickled dataset...")
+            in_list = load_pickle_file(filepath)
         self.clear()
         for x in in_list:
+            if dtype is not None:
+                for key, value in dtype.items():
+                    if key in x and x[key] is not None:
+                        x[key] = np.asarray(x[key]).astype(value, copy=False)
             self.append(GraphDict(x))
         return self
 
-    def read_in_table_file(self, file_path: str = None, **kwargs):
+    def read_in_table_file(self, file_path: str = None, reload: bool = False, **kwargs):
         r"""Read a data frame in :obj:`data_frame` from file path. By default, uses :obj:`file_name` and pandas.
         Checks for a '.csv' file and then for Excel file endings. Meaning the file extension of file_path is ignored
         but must be any of the following '.csv', '.xls', '.xlsx', '.odt'.
 
+        If the same unchanged file has already been read with the same arguments into :obj:`data_frame`, the table
+        is not parsed again. If `pyarrow` is installed and no `engine` is specified, csv-files are parsed with
+        the multithreaded pyarrow engine of pandas.
+
         Args:
             file_path (str): File path to table file. Default is None.
+            reload (bool): Whether to always parse the table file again. Default is False.
             kwargs: Kwargs for pandas :obj:`read_csv` function.
 
         Returns:
@@ -485,13 +683,23 @@ class MemoryGraphDataset(MemoryGraphList):
         # file_extension_given = os.path.splitext(file_path)[1]
         file_path_base = os.path.splitext(file_path)[0]
 
-        for file_extension in [".csv"]:
-            if os.path.exists(file_path_base + file_extension):
-                self.data_frame = pd.read_csv(file_path_base + file_extension, **kwargs)
-                return self
-        for file_extension in [".xls", ".xlsx", ".xlsm", ".xlsb", ".odf", ".ods", ".odt"]:
-            if os.path.exists(file_path_base + file_extension):
-                self.data_frame = pd.read_excel(file_path_base + file_extension, **kwargs)
+        for file_extension, read_method in [(".csv", pd.read_csv)] + [
+                (x, pd.read_excel) for x in [".xls", ".xlsx", ".xlsm", ".xlsb", ".odf", ".ods", ".odt"]]:
+            table_path = file_path_base + file_extension
+            if os.path.exists(table_path):
+                stat = os.stat(table_path)
+                source = (os.path.realpath(table_path), stat.st_mtime_ns, stat.st_size, repr(sorted(kwargs.items())))
+                if not reload and self.data_frame is not None and self._data_frame_source == source:
+                    return self
+                if read_method is pd.read_csv and pyarrow is not None and "engine" not in kwargs:
+                    try:
+                        self.data_frame = pd.read_csv(table_path, engine="pyarrow", **kwargs)
+                    except (ValueError, TypeError, pyarrow.ArrowException) as e:
+                        self.info("Can not read table with pyarrow engine, fall back to default: %s" % e)
+                        self.data_frame = pd.read_csv(table_path, **kwargs)
+                else:
+                    self.data_frame = read_method(table_path, **kwargs)
+                self._data_frame_source = source
                 return self
 
         self.warning("Unsupported data extension of '%s' for table file." % file_path)
@@ -623,7 +831,7 @@ class MemoryGraphDataset(MemoryGraphList):
                 else:
                     out_list += [file_loaded]
             if i % update_counter == 0:
-                self.info("... Read {0} file {1} from {2}".format(os.path.splitext(x)[1], i, num_files))
+                self.info("... Read %s file %s from %s", os.path.splitext(x)[1], i, num_files)
 
         return out_list
 
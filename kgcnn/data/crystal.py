@@ -1,4 +1,5 @@
 import os
+import logging
 import numpy as np
 from collections import defaultdict
 from typing import Dict, Callable, List, Union
@@ -204,6 +205,8 @@ class CrystalDataset(MemoryGraphDataset):
         # The dictionaries values are lists, one for each attribute defines in "callbacks" and each value in those
         # lists corresponds to one structure in the dataset.
         value_lists = defaultdict(list)
+        # Progress is only formatted if the logger would actually emit it.
+        report_progress = self.logger.isEnabledFor(logging.INFO)
         for index, st in enumerate(structs):
             for name, callback in callbacks.items():
                 if st is None:
@@ -212,8 +215,8 @@ class CrystalDataset(MemoryGraphDataset):
                     data_dict = data.loc[index]
                     value = callback(st, data_dict)
                     value_lists[name].append(value)
-            if index % self._default_loop_update_info == 0:
-                self.info(" ... read structures {0} from {1}".format(index, len(structs)))
+            if report_progress and index % self._default_loop_update_info == 0:
+                self.info(" ... read structures %s from %s", index, len(structs))
 
         # The string key names of the original "callbacks" dict are also used as the names of the properties which are
         # assigned
@@ -278,11 +281,12 @@ class CrystalDataset(MemoryGraphDataset):
 
         pre_processor.output_graph_as_dict = True
 
+        report_progress = self.logger.isEnabledFor(logging.INFO)
         for index, s in enumerate(structs):
             g = pre_processor(s)
             self[index].update(g)
 
-            if index % self._default_loop_update_info == 0:
-                self.info(" ... preprocess structures {0} from {1}".format(index, len(structs)))
+            if report_progress and index % self._default_loop_update_info == 0:
+                self.info(" ... preprocess structures %s from %s", index, len(structs))
 
         return self
@@ -139,7 +139,7 @@ class MoleculeNetDataset2018(MoleculeNetDataset, DownloadDataset):
             verbose (int): Print progress or info for processing where 60=silent. Default is 10.
         """
         if not isinstance(dataset_name, str):
-            raise ValueError("Please provide string identifier for TUDataset.")
+            raise ValueError("Please provide string identifier for MoleculeNetDataset2018.")
 
         MoleculeNetDataset.__init__(self, verbose=verbose, dataset_name=dataset_name)
 
@@ -149,9 +149,9 @@ class MoleculeNetDataset2018(MoleculeNetDataset, DownloadDataset):
             self.download_info.update({"download_url": "https://deepchemdata.s3-us-west-1.amazonaws.com/datasets/" +
                                                        self.download_info["download_file_name"]})
         else:
-            raise ValueError("Can not resolve '%s' as a Molecule. Pick: " % dataset_name,
-                             self.datasets_download_info.keys(),
-                             "For new dataset, add to `datasets_download_info` list manually.")
+            raise ValueError(
+                "Can not resolve '%s' as a Molecule. Pick: %s. For new dataset, add to `datasets_download_info` list "
+                "manually." % (dataset_name, list(self.datasets_download_info.keys())))
 
         DownloadDataset.__init__(self, **self.download_info, reload=reload, verbose=verbose)
 
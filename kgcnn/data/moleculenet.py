@@ -1,14 +1,22 @@
 import os
+import pickle
+import hashlib
+import logging
+import queue
+import functools
+import itertools
+import threading
 import numpy as np
 import pandas as pd
 
-from typing import Dict, Callable, Union, List
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Callable, Union, List, Iterable
 from kgcnn.molecule.serial import deserialize_encoder
-from kgcnn.data.base import MemoryGraphDataset
+from kgcnn.data.base import MemoryGraphDataset, _to_flat_value_lists, _from_flat_value_lists
 from kgcnn.molecule.base import MolGraphInterface
 from kgcnn.molecule.encoder import OneHotEncoder
-from kgcnn.molecule.io import write_mol_block_list_to_sdf, read_mol_list_from_sdf_file, write_smiles_file
+from kgcnn.molecule.io import write_mol_block_list_to_sdf, read_mol_list_from_sdf_file, write_smiles_file, \
+    iter_mol_list_from_sdf_file
 from kgcnn.molecule.convert import MolConverter
 
 try:
@@ -17,17 +25,157 @@ except ModuleNotFoundError:
     MolecularGraphRDKit = None
 
 
-def map_molecule_callbacks(mol_list: List[str],
+class TableRow(dict):
+    r"""Lightweight row of a table that can be passed to molecule callbacks instead of a :obj:`pd.Series` .
+    Items can be accessed by column name like a dictionary. For compatibility with a pandas series, a list of
+    column names returns an array of values, and integer positions or slices select columns by position if they are
+    no column names.
+
+    Args:
+        columns (list): Column names of the table.
+        values (tuple): Values of the row.
+    """
+
+    def __init__(self, columns: list, values: tuple):
+        super(TableRow, self).__init__(zip(columns, values))
+        self._values = values
+
+    def __getitem__(self, item):
+        if isinstance(item, (list, tuple)):
+            return np.array([self[x] for x in item])
+        if isinstance(item, slice):
+            return np.array(self._values[item])
+        try:
+            return super(TableRow, self).__getitem__(item)
+        except (KeyError, TypeError):
+            if isinstance(item, (int, np.integer)):
+                return self._values[item]
+            raise
+
+
+class _PrefetchIterator:
+    r"""Iterate over an iterable in a background thread, which starts immediately on construction.
+    This overlaps reading and decoding of a file, e.g. of mol-blocks, with other work in the main thread.
+    At most :obj:`buffer_size` items are held in memory. Exceptions of the iterable are raised on :obj:`__next__` .
+
+    Args:
+        iterable: Iterable to prefetch, e.g. a generator that reads a file.
+        buffer_size (int): Maximum number of prefetched items. Default is 1000.
+    """
+
+    _end = object()
+
+    def __init__(self, iterable, buffer_size: int = 1000):
+        self._queue = queue.Queue(maxsize=buffer_size)
+        self._stop = threading.Event()
+        self._done = False
+        self._thread = threading.Thread(target=self._produce, args=(iterable,), daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, iterable):
+        try:
+            for x in iterable:
+                if not self._put((x, None)):
+                    return
+            self._put((self._end, None))
+        except BaseException as e:
+            self._put((self._end, e))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration
+        item, error = self._queue.get()
+        if item is self._end:
+            self._done = True
+            if error is not None:
+                raise error
+            raise StopIteration
+        return item
+
+    def close(self):
+        """Stop the background thread if not all items have been consumed."""
+        self._stop.set()
+        self._done = True
+
+
+def _identity_transform(mg: MolGraphInterface) -> MolGraphInterface:
+    return mg
+
+
+def _map_callbacks_on_mol_block(mol_block: str,
+                                data_row: Union[dict, tuple, None],
+                                callbacks: Dict[str, Callable[[MolGraphInterface, dict], None]],
+                                custom_transform: Callable = _identity_transform,
+                                add_hydrogen: bool = False,
+                                make_directed: bool = False,
+                                sanitize: Union[bool, str] = True,
+                                compute_partial_charges: str = None,
+                                mol_interface_class=None,
+                                data_columns: list = None,
+                                use_table_row: bool = False,
+                                return_mol_graph: bool = False) -> Union[dict, tuple, None]:
+    r"""Make a molecular graph from a mol-block and evaluate all callbacks on it. Module-level function in order to
+    be picklable for parallel execution in :obj:`map_molecule_callbacks` .
+    If :obj:`data_columns` are given, :obj:`data_row` is a tuple of values and the :obj:`pd.Series` or
+    :obj:`TableRow` for the callbacks is only created for valid molecules. A :obj:`MolGraphInterface` that has
+    already been parsed can be passed in place of the mol-block.
+
+    Returns:
+        dict: Values of callbacks or `None` if the molecule is not valid. With :obj:`return_mol_graph` , a tuple of
+        values and the parsed molecular graph before the custom transform.
+    """
+    if isinstance(mol_block, MolGraphInterface):
+        mg = mol_block
+    elif mol_block is not None and not isinstance(mol_block, str) and hasattr(mol_interface_class, "from_rdkit_mol"):
+        # Already parsed mol-object, e.g. from a SDF supplier.
+        mg = mol_interface_class(make_directed=make_directed).from_rdkit_mol(
+            mol_block, keep_hs=add_hydrogen, sanitize=sanitize)
+    else:
+        mg = mol_interface_class(make_directed=make_directed).from_mol_block(
+            mol_block, keep_hs=add_hydrogen, sanitize=sanitize)
+    parsed_mg = mg if mg.mol is not None else None
+
+    mg = custom_transform(mg)
+
+    if compute_partial_charges:
+        mg.compute_partial_charges(method=compute_partial_charges)
+
+    if mg.mol is None:
+        return (None, parsed_mg) if return_mol_graph else None
+    data_dict = data_row
+    if data_columns is not None and data_row is not None:
+        data_dict = TableRow(data_columns, data_row) if use_table_row else pd.Series(data_row, index=data_columns)
+    values = {name: callback(mg, data_dict) for name, callback in callbacks.items()}
+    return (values, parsed_mg) if return_mol_graph else values
+
+
+def map_molecule_callbacks(mol_list: Union[List[str], Iterable[str]],
                            data: Union[pd.Series, pd.DataFrame],
-                           callbacks: Dict[str, Callable[[MolGraphInterface, pd.Series], None]],
+                           callbacks: Dict[str, Callable[[MolGraphInterface, dict], None]],
                            custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None,
                            add_hydrogen: bool = False,
                            make_directed: bool = False,
-                           sanitize: bool = True,
+                           sanitize: Union[bool, str] = True,
                            compute_partial_charges: str = None,
                            mol_interface_class=None,
                            logger=None,
-                           loop_update_info: int = 5000
+                           loop_update_info: int = 5000,
+                           num_workers: int = 1,
+                           reuse_duplicates: bool = False,
+                           parsed_mol_graphs: list = None,
+                           use_table_row: bool = False
                            ) -> dict:
     r"""This method receive the list of molecules, as well as the data from a pandas data series.
     It then iterates over all the molecules / data rows and invokes the callbacks for each.
@@ -37,7 +185,8 @@ def map_molecule_callbacks(mol_list: List[str],
     derive that data. Those callback functions get two parameters:
 
         - mg: The :obj:`MolGraphInterface` instance for the current molecule
-        - ds: A pandas data series that match data in the CSV file for the specific molecule.
+        - ds: A pandas data series that match data in the CSV file for the specific molecule, or a :obj:`TableRow`
+          with :obj:`use_table_row` .
 
     The string keys of the "callbacks" directory are also the string names which are later used to assign the
     properties of the underlying :obj:`GraphList`. This means that each element of the dataset will then have a
@@ -73,12 +222,15 @@ def map_molecule_callbacks(mol_list: List[str],
 
 
     Args:
-        mol_list (list): List of mol strings.
+        mol_list (list): List of mol strings. Can also be an iterable or generator of mol strings, which are then
+            processed one after another without holding all of them in memory. Items can also be parsed but not
+            sanitized `RDkit` mol-objects, if :obj:`mol_interface_class` has a `from_rdkit_mol` method.
         data (pd.DataFrame): Pandas data frame or series matching list of mol-strings.
         callbacks (dict): Dictionary of callbacks to perform on MolecularGraph object and table entries.
         add_hydrogen (bool): Whether to add hydrogen when making a :obj:`MolecularGraphRDKit` instance.
         make_directed (bool): Whether to have directed or undirected bonds. Default is False.
-        sanitize (bool): Whether to sanitize molecule. Default is True.
+        sanitize (bool, str): Whether to sanitize molecule. Use 'partial' to skip the full sanitization for
+            mol-blocks that have been generated by RDKit, if supported by :obj:`mol_interface_class`. Default is True.
         custom_transform (Callable): Custom transformation function to modify the generated
             :obj:`MolecularGraphRDKit` before callbacks are carried out. The function must take a single
             :obj:`MolecularGraphRDKit` instance as argument and return a (new) :obj:`MolecularGraphRDKit` instance.
@@ -86,6 +238,21 @@ def map_molecule_callbacks(mol_list: List[str],
         mol_interface_class: Interface for molecular graphs. Must be a :obj:`MolGraphInterface`.
         logger: Logger to report error and progress.
         loop_update_info (int): Updates for processed molecules.
+        num_workers (int): Number of worker processes to process molecules in parallel. If None or -1,
+            :obj:`os.cpu_count()` is used and -2 uses all but one core. This requires that the callbacks, :obj:`custom_transform` and
+            :obj:`mol_interface_class` can be pickled, i.e. are no lambda or local functions. Otherwise, molecules
+            are processed serially. Default is 1.
+        reuse_duplicates (bool): Whether to reuse the values for identical mol-blocks, i.e. the same molecule with
+            identical atom order and coordinates, instead of parsing the molecule again. Only the title line of the
+            mol-block is ignored. Requires that callbacks do not depend on the table row. Duplicates share the
+            same value objects. Default is False.
+        parsed_mol_graphs (list): Optional list to store the parsed :obj:`MolGraphInterface` of each molecule
+            before :obj:`custom_transform` , or `None` if it is not valid. The list can be passed as
+            :obj:`mol_list` to a later call with the same settings to skip parsing. Requires serial processing.
+            Default is None.
+        use_table_row (bool): Whether to pass a lightweight :obj:`TableRow` to the callbacks instead of a
+            :obj:`pd.Series` for each row, which is faster but only supports item access by column name or position.
+            Default is False.
 
     Returns:
         dict: Values of callbacks.
@@ -98,33 +265,393 @@ def map_molecule_callbacks(mol_list: List[str],
     if mol_list is None:
         raise ValueError("Expected list of mol-string. But got '%s'." % mol_list)
 
-    value_lists = defaultdict(list)
-    for index, sm in enumerate(mol_list):
+    # Preallocate lists for all molecules and fill by index. Invalid molecules keep `None` for all callbacks.
+    # For iterables of unknown length, the number of rows in the table is used as expected size.
+    if hasattr(mol_list, "__len__"):
+        num_mols = len(mol_list)
+    else:
+        num_mols = len(data) if data is not None else 0
+    value_lists = {name: [None] * num_mols for name in callbacks.keys()}
+    num_processed = 0
+    # Progress is only reported if the logger would actually emit it.
+    report_progress = logger is not None and logger.isEnabledFor(logging.INFO)
+    next_report = 0
+
+    # Rows are passed as tuple of values and only made into a series or `TableRow` for valid molecules.
+    # For a series as data, callbacks receive the single value of each row, unless a `TableRow` is requested.
+    data_columns = None
+    if isinstance(data, pd.DataFrame):
+        data_columns = list(data.columns)
+    elif data is not None and use_table_row:
+        data_columns = [data.name]
+    # Identity instead of `None` as transform, which is module-level and can be pickled for worker processes.
+    map_kwargs = dict(
+        callbacks=callbacks,
+        custom_transform=custom_transform if custom_transform is not None else _identity_transform,
+        add_hydrogen=add_hydrogen,
+        make_directed=make_directed, sanitize=sanitize, compute_partial_charges=compute_partial_charges,
+        mol_interface_class=mol_interface_class, data_columns=data_columns, use_table_row=use_table_row)
+
+    # Like joblib, `None` or -1 means all cores and -2 all cores but one.
+    num_workers = MolConverter._resolve_num_workers(num_workers)
+    if num_workers > 1:
+        try:
+            pickle.dumps(map_kwargs)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            if logger is not None:
+                logger.warning("Can not pickle callbacks for parallel processing, use serial loop instead: %s" % e)
+            num_workers = 1
+    if num_workers > 1 and parsed_mol_graphs is not None:
+        if logger is not None:
+            logger.warning("Keeping parsed molecules requires serial processing, use serial loop instead.")
+        num_workers = 1
+
+    def data_rows():
+        # Rows of the table that match the molecules. Plain tuples instead of a pandas series per row.
+        if isinstance(data, pd.DataFrame):
+            yield from data.itertuples(index=False, name=None)
+        elif data is not None:
+            yield from (((x,) for x in data) if use_table_row else data)
+        while True:
+            yield None
+
+    # Attributes that return arrays of the same shape and dtype for each molecule, e.g. graph-level features, are
+    # written into preallocated blocks of rows per attribute and the lists hold views of these rows.
+    # Set to `False` as soon as an attribute returns a value of different shape, i.e. for node or edge attributes.
+    fixed_shape_blocks = {}
+    block_size = 1024
+
+    def assign_fixed_shape(name, index, value):
+        blocks = fixed_shape_blocks.get(name)
+        if blocks is False:
+            return value
+        if blocks is None:
+            if not isinstance(value, np.ndarray) or value.ndim == 0 or value.dtype.hasobject:
+                fixed_shape_blocks[name] = False
+                return value
+            blocks = {}
+            fixed_shape_blocks[name] = blocks
+        reference = next(iter(blocks.values()), None)
+        if isinstance(value, np.ndarray) and (
+                reference is None or (value.shape == reference.shape[1:] and value.dtype == reference.dtype)):
+            if index // block_size not in blocks:
+                blocks[index // block_size] = np.empty((block_size,) + value.shape, dtype=value.dtype)
+            block = blocks[index // block_size]
+            block[index % block_size] = value
+            return block[index % block_size]
+        # Ragged attribute. Detach previous views from the blocks, so that they can be released.
+        fixed_shape_blocks[name] = False
+        value_list, block_ids = value_lists[name], set([id(b) for b in blocks.values()])
+        for i, x in enumerate(value_list):
+            if isinstance(x, np.ndarray) and id(x.base) in block_ids:
+                value_list[i] = x.copy()
+        return value
+
+    def assign_values(index, values):
+        if values is None:
+            # Lists are already filled with `None`, only extend if the expected size was too small.
+            for value_list in value_lists.values():
+                if index >= len(value_list):
+                    value_list.extend([None] * (index + 1 - len(value_list)))
+            return
+        for name, value_list in value_lists.items():
+            if index >= len(value_list):
+                value_list.extend([None] * (index + 1 - len(value_list)))
+            value_list[index] = assign_fixed_shape(name, index, values[name])
+
+    def is_missing(mol_block):
+        # Missing molecules are not dispatched to the callbacks or worker processes at all.
+        if mol_block is None:
+            if logger is not None:
+                logger.error("Can not make mol-object for missing molecule.")
+            return True
+        return False
+
+    # Index of first occurrence of each mol-block, if duplicates are reused.
+    seen_mol_blocks = {}
+
+    def mol_block_key(mol_block):
+        if not reuse_duplicates or not isinstance(mol_block, str):
+            return None
+        return hashlib.sha1(mol_block[mol_block.find("\n") + 1:].encode()).digest()
+
+    def copy_values(index, reference):
+        assign_values(index, {name: value_list[reference] for name, value_list in value_lists.items()})
+
+    if num_workers > 1:
+        mol_and_rows = zip(mol_list, data_rows())
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            # Submit in batches to not hold all molecules in memory at once.
+            while True:
+                batch = list(itertools.islice(mol_and_rows, loop_update_info))
+                if len(batch) == 0:
+                    break
+                submit, duplicates = [], []
+                for offset, (sm, data_row) in enumerate(batch):
+                    index, key = num_processed + offset, mol_block_key(sm)
+                    if is_missing(sm):
+                        continue
+                    if key is not None and key in seen_mol_blocks:
+                        duplicates.append((index, seen_mol_blocks[key]))
+                        continue
+                    if key is not None:
+                        seen_mol_blocks[key] = index
+                    submit.append((index, sm, data_row))
+                chunk_size = max(int(len(submit) / (4 * num_workers)), 1)
+                results = executor.map(
+                    functools.partial(_map_callbacks_on_mol_block, **map_kwargs),
+                    [x[1] for x in submit], [x[2] for x in submit], chunksize=chunk_size)
+                for (index, _, _), values in zip(submit, results):
+                    assign_values(index, values)
+                for index, reference in duplicates:
+                    copy_values(index, reference)
+                num_processed += len(batch)
+                assign_values(num_processed - 1, None)
+                if report_progress:
+                    logger.info(" ... process molecules %s from %s", num_processed, num_mols)
+    else:
+        for index, (sm, data_row) in enumerate(zip(mol_list, data_rows())):
+            num_processed = index + 1
+            key = mol_block_key(sm)
+            parsed_mg = None
+            if is_missing(sm):
+                assign_values(index, None)
+            elif key is not None and key in seen_mol_blocks:
+                copy_values(index, seen_mol_blocks[key])
+                if parsed_mol_graphs is not None:
+                    parsed_mg = parsed_mol_graphs[seen_mol_blocks[key]]
+            else:
+                if key is not None:
+                    seen_mol_blocks[key] = index
+                if parsed_mol_graphs is not None:
+                    values, parsed_mg = _map_callbacks_on_mol_block(
+                        sm, data_row, return_mol_graph=True, **map_kwargs)
+                else:
+                    values = _map_callbacks_on_mol_block(sm, data_row, **map_kwargs)
+                assign_values(index, values)
+            if parsed_mol_graphs is not None:
+                parsed_mol_graphs.append(parsed_mg)
+            if report_progress and index == next_report:
+                logger.info(" ... process molecules %s from %s", index, num_mols)
+                next_report += loop_update_info
+
+    # Expected size was larger than actual number of molecules.
+    if num_processed < num_mols:
+        for name in value_lists.keys():
+            del value_lists[name][num_processed:]
 
-        mg = mol_interface_class(make_directed=make_directed).from_mol_block(
-            sm, keep_hs=add_hydrogen, sanitize=sanitize)
+    return value_lists
 
-        if custom_transform is not None:
-            mg = custom_transform(mg)
 
-        if compute_partial_charges:
-            mg.compute_partial_charges(method=compute_partial_charges)
+class _SharedMolProperty:
+    """Compute a property of a molecule once for multiple callbacks.
 
-        for name, callback in callbacks.items():
-            if mg.mol is None:
-                value_lists[name].append(None)
-            else:
-                if data is not None:
-                    data_dict = data.loc[index]
-                else:
-                    data_dict = None
-                value = callback(mg, data_dict)
-                value_lists[name].append(value)
-        if index % loop_update_info == 0:
-            if logger is not None:
-                logger.info(" ... process molecules {0} from {1}".format(index, len(mol_list)))
+    Args:
+        compute (Callable): Module-level function that computes the property from a :obj:`MolGraphInterface` .
+    """
 
-    return value_lists
+    def __init__(self, compute: Callable[[MolGraphInterface], object]):
+        self._compute = compute
+        self._mg = None
+        self._value = None
+
+    def __call__(self, mg: MolGraphInterface):
+        if self._mg is not mg:
+            self._mg, self._value = mg, self._compute(mg)
+        return self._value
+
+    def __getstate__(self):
+        # Never send a cached molecule to worker processes.
+        return {"_compute": self._compute, "_mg": None, "_value": None}
+
+
+def _edge_number_of(mg: MolGraphInterface):
+    return mg.edge_number
+
+
+def _node_symbol_and_number_of(mg: MolGraphInterface):
+    if hasattr(mg, "node_symbol_and_number"):
+        # Symbols and atomic numbers in a single pass over the atoms.
+        return mg.node_symbol_and_number
+    return mg.node_symbol, mg.node_number
+
+
+def _callback_node_symbol(mg, ds, node_info: _SharedMolProperty = None):
+    if node_info is not None:
+        return node_info(mg)[0]
+    return mg.node_symbol
+
+
+def _callback_node_number(mg, ds, node_info: _SharedMolProperty = None):
+    if node_info is not None:
+        return node_info(mg)[1]
+    return mg.node_number
+
+
+def _callback_graph_size(mg, ds, node_info: _SharedMolProperty = None):
+    if node_info is not None:
+        return len(node_info(mg)[1])
+    return len(mg.node_number)
+
+
+def _callback_edge_indices(mg, ds, edge_number: _SharedMolProperty):
+    return edge_number(mg)[0]
+
+
+def _callback_edge_number(mg, ds, edge_number: _SharedMolProperty):
+    return np.asarray(edge_number(mg)[1], dtype="int")
+
+
+def _callback_node_coordinates(mg, ds, dtype: str = "float64"):
+    return _cast_coordinates(mg.node_coordinates, dtype)
+
+
+def _callback_node_attributes(mg, ds, nodes: list, encoder: dict, dtype: str = "float32",
+                              checked: bool = False):
+    if MolecularGraphRDKit is not None and isinstance(mg, MolecularGraphRDKit):
+        # Stacked per-property arrays instead of nested lists.
+        return _cast_attributes(
+            mg.node_attributes(nodes, encoder, dtype="float32", check_properties=not checked), dtype=dtype)
+    return _cast_attributes(mg.node_attributes(nodes, encoder), dtype=dtype)
+
+
+def _callback_edge_attributes(mg, ds, edges: list, encoder: dict, dtype: str = "float32",
+                              checked: bool = False):
+    if MolecularGraphRDKit is not None and isinstance(mg, MolecularGraphRDKit):
+        return _cast_attributes(
+            mg.edge_attributes(edges, encoder, dtype="float32", check_properties=not checked)[1], dtype=dtype)
+    return _cast_attributes(mg.edge_attributes(edges, encoder)[1], dtype=dtype)
+
+
+def _callback_table_column(mg, ds, column: Union[str, list]):
+    return ds[column]
+
+
+def _callback_graph_attributes(mg, ds, graph: list, encoder: dict):
+    return np.array(mg.graph_attributes(graph, encoder), dtype="float32")
+
+
+def _cast_attributes(values: list, dtype: str = "float32") -> np.ndarray:
+    r"""Make an attribute array of `dtype` from a list of values. Casting to an integer type is only allowed if
+    values can be represented exactly, which is the case for one-hot or integer features.
+
+    Args:
+        values (list): Nested list or array of attribute values.
+        dtype (str): Data type of the array. Default is "float32".
+
+    Returns:
+        np.ndarray: Attributes of `dtype` .
+    """
+    attributes = np.asarray(values, dtype="float32")
+    if dtype == "float32":
+        return attributes
+    cast = attributes.astype(dtype)
+    if np.issubdtype(cast.dtype, np.integer) and not np.array_equal(cast, attributes):
+        raise ValueError("Attributes can not be represented as '%s' without loss, use 'float32' instead." % dtype)
+    return cast
+
+
+def _cast_coordinates(coordinates, dtype: str = "float64"):
+    """Cast coordinates to `dtype` without copy if possible. Coordinates that are `None` are kept."""
+    if coordinates is None:
+        return None
+    return np.asarray(coordinates, dtype=dtype)
+
+
+def _pack_contiguous(values: list) -> list:
+    r"""Place a list of per-graph arrays into a single contiguous buffer and return views of it per graph.
+    Entries that are `None` are kept. If the arrays can not be concatenated, the list is returned unchanged.
+
+    Args:
+        values (list): List of arrays or `None`.
+
+    Returns:
+        list: List of views on a flat buffer of all values.
+    """
+    arrays = [np.asarray(x) if x is not None else None for x in values]
+    valid = [x for x in arrays if x is not None]
+    if len(valid) == 0 or any([x.ndim == 0 for x in valid]):
+        return values
+    non_empty = [x for x in valid if len(x) > 0]
+    if len(non_empty) == 0:
+        return values
+    trailing_shape = non_empty[0].shape[1:]
+    if any([x.shape[1:] != trailing_shape for x in non_empty]):
+        return values
+    flat = np.concatenate(non_empty, axis=0)
+    row_splits = np.cumsum([len(x) if x is not None else 0 for x in arrays])
+    views = np.split(flat, row_splits[:-1])
+    return [None if x is None else v for x, v in zip(arrays, views)]
+
+
+def _attributes_cache_key(sdf_path: str, settings: dict) -> Union[str, None]:
+    r"""Hash of the SDF file state and settings of :obj:`set_attributes` to identify cached attributes.
+    Returns `None` if settings contain functions or encoders that can not be represented by their config.
+
+    Args:
+        sdf_path (str): File path of the SDF file.
+        settings (dict): Settings for computing the attributes.
+
+    Returns:
+        str: Hex digest of the hash or None.
+    """
+    def _identifier(x):
+        if isinstance(x, (str, int, float, bool, type(None))):
+            return x
+        if isinstance(x, (list, tuple)):
+            return [_identifier(y) for y in x]
+        if isinstance(x, dict):
+            return {str(k): _identifier(v) for k, v in sorted(x.items(), key=lambda kv: str(kv[0]))}
+        if isinstance(x, type) and x.__module__ == "builtins":
+            return x.__name__
+        if hasattr(x, "get_config"):
+            return [type(x).__name__, _identifier(x.get_config())]
+        raise TypeError("Can not identify '%s' for attribute cache." % x)
+
+    try:
+        identifier = _identifier(settings)
+    except TypeError:
+        return None
+    stat = os.stat(sdf_path)
+    identifier["sdf_file"] = [os.path.realpath(sdf_path), stat.st_mtime_ns, stat.st_size]
+    return hashlib.sha1(repr(identifier).encode()).hexdigest()
+
+
+def _save_value_lists(file_path: str, value_lists: dict, cache_key: str) -> bool:
+    r"""Save value lists of :obj:`map_molecule_callbacks` column-wise as flat values and row splits to a '.npz' file.
+
+    Args:
+        file_path (str): File path of the cache.
+        value_lists (dict): Lists of values per attribute, `None` for invalid molecules.
+        cache_key (str): Key of :obj:`_attributes_cache_key` .
+
+    Returns:
+        bool: Whether values could be saved.
+    """
+    try:
+        out = _to_flat_value_lists(value_lists)
+    except ValueError:
+        return False
+    np.savez(file_path, cache_key=np.array(cache_key), **out)
+    return True
+
+
+def _load_value_lists(file_path: str, cache_key: str) -> Union[dict, None]:
+    r"""Load value lists saved by :obj:`_save_value_lists` if the cache key matches.
+
+    Args:
+        file_path (str): File path of the cache.
+        cache_key (str): Key of :obj:`_attributes_cache_key` .
+
+    Returns:
+        dict: Lists of values per attribute or `None` if there is no matching cache.
+    """
+    if not os.path.exists(file_path):
+        return None
+    with np.load(file_path) as data:
+        if str(data["cache_key"]) != cache_key:
+            return None
+        return _from_flat_value_lists(data)
 
 
 class MoleculeNetDataset(MemoryGraphDataset):
@@ -194,7 +721,8 @@ class MoleculeNetDataset(MemoryGraphDataset):
                 Default is None.
             file_name_mol (str): Filename of the SDF file that is generated from the SMILES file that is generated
                 from a list of smiles given in the table file specified by :obj:`file_name` . By default, the name
-                is chosen equal to :obj:`file_name` when passed None.
+                is chosen equal to :obj:`file_name` when passed None. A file name ending with '.sdf.gz' stores
+                the mol-blocks in a gzip compressed SDF file.
             file_name_smiles (str): Filename of the SMILES file that is generated from a list of smiles given in the
                 table file specified by :obj:`file_name` . By default, the name is chosen equal to :obj:`file_name`
                 when passed None.
@@ -207,6 +735,9 @@ class MoleculeNetDataset(MemoryGraphDataset):
                                     file_name=file_name, verbose=verbose)
         self.file_name_mol = file_name_mol
         self.file_name_smiles = file_name_smiles
+        # Parsed molecular graphs kept by `set_attributes` and the settings they were parsed with.
+        self._mol_graphs = None
+        self._mol_graphs_source = None
 
     @property
     def file_path_mol(self):
@@ -229,7 +760,8 @@ class MoleculeNetDataset(MemoryGraphDataset):
     def prepare_data(self, overwrite: bool = False, smiles_column_name: str = "smiles",
                      add_hydrogen: bool = True, sanitize: bool = True,
                      make_conformers: bool = True, optimize_conformer: bool = True,
-                     external_program: dict = None, num_workers: int = None):
+                     external_program: dict = None, num_workers: int = None, use_multiprocessing: bool = False,
+                     mol_cache_path: str = None, fast_sanitize: bool = False):
         r"""Computation of molecular structure information and optionally conformers from smiles.
 
         This function reads smiles from the csv-file given by :obj:`file_name` and creates a single SDF File of
@@ -251,39 +783,62 @@ class MoleculeNetDataset(MemoryGraphDataset):
                 {"class_name": "balloon", "config": {"balloon_executable_path": ..., ...}}.
                 Note that usually the parameters like :obj:`add_hydrogen` are ignored. And you need to control the
                 SDF file generation within `config` of the :obj:`external_program`.
-            num_workers (int): Parallel execution for translating smiles.
+            num_workers (int): Parallel execution for translating smiles. If None or -1, all cores are used and -2
+                uses all but one. Default is None.
+            use_multiprocessing (bool): Whether to translate smiles in a pool of processes instead of threads, which
+                scales conformer generation with the number of cores. The pool is started once and molecules are
+                submitted in chunks with the order preserved. Default is False.
+            mol_cache_path (str): File path of a sqlite cache of mol-strings keyed by smiles, which can be
+                shared between datasets to skip conversion of known molecules. Default is None.
+            fast_sanitize (bool): Whether to skip the chirality cleanup of RDKit sanitization, which scales
+                quadratically with chain length, and assign stereochemistry explicitly afterwards. Can be used for
+                datasets with long polymer chains. Default is False.
 
         Returns:
             self
         """
-        if os.path.exists(self.file_path_mol) and not overwrite:
-            self.info("Found SDF %s of pre-computed structures." % self.file_path_mol)
+        file_path_mol, file_path_smiles = self.file_path_mol, self.file_path_smiles
+        if os.path.exists(file_path_mol) and not overwrite:
+            self.info("Found SDF %s of pre-computed structures." % file_path_mol)
             return self
 
         self.read_in_table_file()
         smiles = self.data_frame[smiles_column_name].values
         if len(smiles) == 0:
             self.error("Can not translate smiles, received empty list for '%s'." % self.dataset_name)
-        write_smiles_file(self.file_path_smiles, smiles)
+        write_smiles_file(file_path_smiles, smiles)
 
         # Make structure
-        self.info("Generating molecules and store %s to disk..." % self.file_path_mol)
+        self.info("Generating molecules and store %s to disk..." % file_path_mol)
         conv = MolConverter()
         conv.smile_to_mol(
-            self.file_path_smiles, self.file_path_mol, add_hydrogen=add_hydrogen, sanitize=sanitize,
+            file_path_smiles, file_path_mol, add_hydrogen=add_hydrogen, sanitize=sanitize,
             make_conformers=make_conformers, optimize_conformer=optimize_conformer,
             external_program=external_program, num_workers=num_workers,
-            logger=self.logger, batch_size=self._default_loop_update_info
+            logger=self.logger, batch_size=self._default_loop_update_info, use_multiprocessing=use_multiprocessing,
+            cache_path=mol_cache_path, fast_sanitize=fast_sanitize
         )
         return self
 
-    def get_mol_blocks_from_sdf_file(self):
-        if not os.path.exists(self.file_path_mol):
+    def get_mol_blocks_from_sdf_file(self, lazy: bool = False):
+        """Read the mol-blocks from the SDF file in :obj:`file_path_mol` .
+
+        Args:
+            lazy (bool): Whether to return a generator that reads mol-blocks one after another from file instead of
+                a list of all mol-blocks. Default is False.
+
+        Returns:
+            list: List or generator of mol-blocks as string.
+        """
+        file_path_mol = self.file_path_mol
+        if not os.path.exists(file_path_mol):
             raise FileNotFoundError("Can not load molecules for dataset %s" % self.dataset_name)
 
         # Loading the molecules and the csv data
         self.info("Read molecules from mol-file.")
-        return read_mol_list_from_sdf_file(self.file_path_mol)
+        if lazy:
+            return iter_mol_list_from_sdf_file(file_path_mol)
+        return read_mol_list_from_sdf_file(file_path_mol)
 
     def set_attributes(self,
                        label_column_name: Union[str, list] = None,
@@ -296,10 +851,18 @@ class MoleculeNetDataset(MemoryGraphDataset):
                        add_hydrogen: bool = False,
                        make_directed: bool = False,
                        has_conformers: bool = True,
-                       sanitize: bool = True,
+                       sanitize: Union[bool, str] = True,
                        compute_partial_charges: str = None,
                        additional_callbacks: Dict[str, Callable[[MolGraphInterface, dict], None]] = None,
-                       custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None):
+                       custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None,
+                       attributes_dtype: str = "float32",
+                       coordinates_dtype: str = "float64",
+                       num_workers: int = 1,
+                       use_attributes_cache: bool = False,
+                       use_mol_supplier: bool = False,
+                       label_dtype: str = None,
+                       keep_mols: bool = False,
+                       use_table_row: bool = False):
         """Load list of molecules from cached SDF-file in into memory. File name must be given in :obj:`file_name` and
         path information in the constructor of this class.
 
@@ -317,7 +880,8 @@ class MoleculeNetDataset(MemoryGraphDataset):
         row of the original CSV file. Those callback functions accept two parameters:
 
             * mg: The :obj:`MolecularGraphRDKit` instance of the molecule
-            * ds: A pandas data series that match data in the CSV file for the specific molecule.
+            * ds: A pandas data series that match data in the CSV file for the specific molecule, or a
+              :obj:`TableRow` with :obj:`use_table_row` .
 
         Example:
 
@@ -360,7 +924,9 @@ class MoleculeNetDataset(MemoryGraphDataset):
             add_hydrogen (bool): Whether to keep hydrogen after reading the mol-information. Default is False.
             has_conformers (bool): Whether to add node coordinates from conformer. Default is True.
             make_directed (bool): Whether to have directed or undirected bonds. Default is False.
-            sanitize (bool): Whether to sanitize molecule. Default is True.
+            sanitize (bool, str): Whether to sanitize molecule. Since the mol-blocks in the SDF file generated by
+                :obj:`prepare_data` are already sanitized by RDKit, 'partial' can be used to only set up properties,
+                rings and aromaticity, which is considerably faster. Default is True.
             compute_partial_charges (str): Whether to compute partial charges, e.g. 'gasteiger'. Default is None.
             additional_callbacks (dict): A dictionary whose keys are string attribute names which the elements of the
                 dataset are supposed to have and the elements are callback function objects which implement how those
@@ -369,6 +935,31 @@ class MoleculeNetDataset(MemoryGraphDataset):
             custom_transform (Callable): Custom transformation function to modify the generated
                 :obj:`MolecularGraphRDKit` before callbacks are carried out. The function must take a single
                 :obj:`MolecularGraphRDKit` instance as argument and return a (new) :obj:`MolecularGraphRDKit` instance.
+            attributes_dtype (str): Data type to store node and edge attributes. For one-hot and integer features,
+                'int8' or 'uint8' reduce memory by a factor of four, but must be cast to float for the model input.
+                Raises an error if attributes can not be represented exactly. Default is "float32".
+            coordinates_dtype (str): Data type to store node coordinates. All coordinates are placed in a single
+                contiguous array, which can be obtained with row lengths via :obj:`obtain_property_flat` .
+                Use "float32" to halve memory of coordinates. Default is "float64".
+            num_workers (int): Number of worker processes to compute the molecular attributes in parallel. Requires
+                that :obj:`additional_callbacks` and :obj:`custom_transform` can be pickled. Note that encoders in
+                worker processes can not report found values. Default is 1.
+            use_attributes_cache (bool): Whether to store the computed molecular attributes in a '.npz' file next to
+                the SDF file and load them in subsequent calls with the same settings, which skips RDKit entirely.
+                Only possible if properties and encoders are given by name or config and if no
+                :obj:`additional_callbacks` or :obj:`custom_transform` are used. Default is False.
+            use_mol_supplier (bool): Whether to read molecules with the SDF supplier of `RDkit` and pass mol-objects
+                to :obj:`MolecularGraphRDKit` instead of parsing each mol-block string. Identical molecules are then
+                not reused by their mol-block. Default is False.
+            label_dtype (str): Data type to cast graph labels to, e.g. 'float32' to halve memory of labels compared to
+                the default 'float64' of the table. Default is None, which keeps the data type of the table.
+            keep_mols (bool): Whether to keep the parsed molecular graphs in memory after reading, so that a
+                subsequent call with the same SDF file and reading settings, e.g. with different features, does not
+                parse all mol-blocks again. Requires serial processing. If False, kept molecules are released.
+                Molecules are neither kept nor reused with :obj:`custom_transform` or :obj:`compute_partial_charges` ,
+                since they can modify the graph in place. Default is False.
+            use_table_row (bool): Whether to pass a lightweight :obj:`TableRow` instead of a :obj:`pd.Series` of the
+                table row to :obj:`additional_callbacks` . Default is False.
 
         Returns:
             self
@@ -388,41 +979,132 @@ class MoleculeNetDataset(MemoryGraphDataset):
             for key, value in encoder.items():
                 encoder[key] = deserialize_encoder(value)
 
+        # Properties and encoders are verified once here and not again for every molecule.
+        interface = self._mol_graph_interface
+        checked = MolecularGraphRDKit is not None and isinstance(interface, type) and issubclass(
+            interface, MolecularGraphRDKit)
+        if checked:
+            atom_keys, bond_keys = sorted(interface.atom_fun_dict.keys()), sorted(interface.bond_fun_dict.keys())
+            nodes = interface._check_properties_list(nodes, atom_keys, "Atom")
+            encoder_nodes = interface._check_encoder(encoder_nodes, atom_keys)
+            edges = interface._check_properties_list(edges, bond_keys, "Bond")
+            encoder_edges = interface._check_encoder(encoder_edges, bond_keys)
+
+        # Callbacks are module-level functions, which can be pickled for parallel processing.
+        # Bond indices and types are computed once per molecule and shared by the callbacks.
+        # Likewise, atomic symbols and numbers are collected in one traversal of the atoms.
+        edge_number = _SharedMolProperty(_edge_number_of)
+        node_info = _SharedMolProperty(_node_symbol_and_number_of)
         callbacks = {
-            'node_symbol': lambda mg, ds: mg.node_symbol,
-            'node_number': lambda mg, ds: mg.node_number,
-            'edge_indices': lambda mg, ds: mg.edge_number[0],
-            'edge_number': lambda mg, ds: np.array(mg.edge_number[1], dtype='int'),
-            'graph_size': lambda mg, ds: len(mg.node_number),
+            'node_symbol': functools.partial(_callback_node_symbol, node_info=node_info),
+            'node_number': functools.partial(_callback_node_number, node_info=node_info),
+            'edge_indices': functools.partial(_callback_edge_indices, edge_number=edge_number),
+            'edge_number': functools.partial(_callback_edge_number, edge_number=edge_number),
+            'graph_size': functools.partial(_callback_graph_size, node_info=node_info),
         }
         if has_conformers:
-            callbacks.update({'node_coordinates': lambda mg, ds: mg.node_coordinates})
-        if label_column_name:
-            callbacks.update({'graph_labels': lambda mg, ds: ds[label_column_name]})
+            callbacks.update({
+                'node_coordinates': functools.partial(_callback_node_coordinates, dtype=coordinates_dtype)})
 
         # Attributes callbacks.
         callbacks.update({
-            'node_attributes': lambda mg, ds: np.array(mg.node_attributes(nodes, encoder_nodes), dtype='float32'),
-            'edge_attributes': lambda mg, ds: np.array(mg.edge_attributes(edges, encoder_edges)[1], dtype='float32'),
-            'graph_attributes': lambda mg, ds: np.array(mg.graph_attributes(graph, encoder_graph), dtype='float32')
+            'node_attributes': functools.partial(
+                _callback_node_attributes, nodes=nodes, encoder=encoder_nodes, dtype=attributes_dtype,
+                checked=checked),
+            'edge_attributes': functools.partial(
+                _callback_edge_attributes, edges=edges, encoder=encoder_edges, dtype=attributes_dtype,
+                checked=checked),
+            'graph_attributes': functools.partial(_callback_graph_attributes, graph=graph, encoder=encoder_graph)
         })
 
         # Additional callbacks. Could check for duplicate names here.
         callbacks.update(additional_callbacks)
 
-        value_lists = map_molecule_callbacks(
-            self.get_mol_blocks_from_sdf_file(),
-            self.read_in_table_file().data_frame,
-            callbacks=callbacks,
-            add_hydrogen=add_hydrogen,
-            custom_transform=custom_transform,
-            make_directed=make_directed,
-            sanitize=sanitize,
-            mol_interface_class=self._mol_graph_interface,
-            logger=self.logger,
-            loop_update_info=self._default_loop_update_info,
-            compute_partial_charges=compute_partial_charges
-        )
+        cache_key, cache_path, value_lists = None, os.path.splitext(self.file_path_mol)[0] + ".attributes.npz", None
+        if use_attributes_cache:
+            if len(additional_callbacks) > 0 or custom_transform is not None:
+                self.warning("Can not cache attributes for additional callbacks or custom transform.")
+            else:
+                cache_key = _attributes_cache_key(self.file_path_mol, {
+                    "nodes": nodes, "edges": edges, "graph": graph, "encoder_nodes": encoder_nodes,
+                    "encoder_edges": encoder_edges, "encoder_graph": encoder_graph, "add_hydrogen": add_hydrogen,
+                    "make_directed": make_directed, "has_conformers": has_conformers, "sanitize": sanitize,
+                    "compute_partial_charges": compute_partial_charges, "attributes_dtype": attributes_dtype,
+                    "coordinates_dtype": coordinates_dtype, "use_mol_supplier": use_mol_supplier,
+                    "mol_interface_class": getattr(self._mol_graph_interface, "__name__", None)})
+                if cache_key is None:
+                    self.warning("Can not cache attributes for properties or encoders without config.")
+            if cache_key is not None:
+                value_lists = _load_value_lists(cache_path, cache_key)
+                if value_lists is not None:
+                    self.info("Load molecular attributes from cache %s" % cache_path)
+
+        if value_lists is None:
+            # Mol-blocks are read from the SDF file in the background, while the table is parsed.
+            stat = os.stat(self.file_path_mol)
+            mol_graphs_source = (os.path.realpath(self.file_path_mol), stat.st_mtime_ns, stat.st_size,
+                                 add_hydrogen, make_directed, sanitize, self._mol_graph_interface)
+            # Transform and partial charges modify the parsed graphs in place, which must not be kept or reused.
+            can_keep_mols = custom_transform is None and not compute_partial_charges
+            if keep_mols and not can_keep_mols:
+                self.warning("Can not keep molecules for custom transform or partial charges.")
+            keep_mols = keep_mols and can_keep_mols
+            parsed_mol_graphs = [] if keep_mols else None
+            if can_keep_mols and self._mol_graphs is not None and self._mol_graphs_source == mol_graphs_source:
+                self.info("Using kept molecules instead of parsing SDF file again.")
+                mol_source = self._mol_graphs
+            elif use_mol_supplier and hasattr(self._mol_graph_interface, "iter_mol_from_sdf_file"):
+                mol_source = self._mol_graph_interface.iter_mol_from_sdf_file(self.file_path_mol)
+            else:
+                mol_source = self.get_mol_blocks_from_sdf_file(lazy=True)
+            if not isinstance(mol_source, list):
+                mol_blocks = _PrefetchIterator(mol_source, buffer_size=self._default_loop_update_info)
+            else:
+                mol_blocks = mol_source
+            try:
+                data_frame = self.read_in_table_file().data_frame
+                value_lists = map_molecule_callbacks(
+                    mol_blocks,
+                    data_frame,
+                    callbacks=callbacks,
+                    add_hydrogen=add_hydrogen,
+                    custom_transform=custom_transform,
+                    make_directed=make_directed,
+                    sanitize=sanitize,
+                    mol_interface_class=self._mol_graph_interface,
+                    logger=self.logger,
+                    loop_update_info=self._default_loop_update_info,
+                    compute_partial_charges=compute_partial_charges,
+                    num_workers=num_workers,
+                    # Default callbacks do not depend on the table, identical molecules can share their attributes.
+                    reuse_duplicates=(len(additional_callbacks) == 0),
+                    parsed_mol_graphs=parsed_mol_graphs,
+                    use_table_row=use_table_row
+                )
+            finally:
+                if isinstance(mol_blocks, _PrefetchIterator):
+                    mol_blocks.close()
+            if keep_mols:
+                self._mol_graphs, self._mol_graphs_source = parsed_mol_graphs, mol_graphs_source
+            else:
+                self._mol_graphs, self._mol_graphs_source = None, None
+            if cache_key is not None:
+                if _save_value_lists(cache_path, value_lists, cache_key):
+                    self.info("Stored molecular attributes in cache %s" % cache_path)
+                else:
+                    self.warning("Can not store molecular attributes with different inner shape in cache.")
+
+        if label_column_name and "graph_labels" not in additional_callbacks:
+            # Labels are extracted from the table in one go and only kept for valid molecules.
+            value_lists["graph_labels"] = self._select_graph_labels(
+                self.read_in_table_file().data_frame, label_column_name, value_lists["graph_size"],
+                label_dtype=label_dtype)
+
+        # Per-atom and per-bond properties are stored in one contiguous buffer each.
+        for name in ["node_attributes", "edge_attributes", "edge_indices", "node_coordinates", "node_number",
+                     "edge_number"]:
+            if name in value_lists:
+                value_lists[name] = _pack_contiguous(value_lists[name])
 
         for name, values in value_lists.items():
             self.assign_property(name, values)
@@ -436,3 +1118,25 @@ class MoleculeNetDataset(MemoryGraphDataset):
         return self
 
     read_in_memory = set_attributes
+
+    @staticmethod
+    def _select_graph_labels(data_frame: pd.DataFrame, label_column_name: Union[str, list, slice],
+                             valid_reference: list, label_dtype: str = None):
+        if isinstance(label_column_name, slice) or (
+                isinstance(label_column_name, (list, tuple)) and all(
+                    [isinstance(x, int) and x not in data_frame.columns for x in label_column_name])):
+            labels = data_frame.iloc[:, label_column_name].values
+        else:
+            labels = data_frame[label_column_name].values
+        if label_dtype is not None:
+            # Single cast of all labels, e.g. to 'float32' instead of the 'float64' default of pandas.
+            labels = labels.astype(label_dtype)
+        if len(labels) != len(valid_reference):
+            raise ValueError("Number of rows '%s' in table does not match molecules '%s'." % (
+                len(labels), len(valid_reference)))
+        # Select labels of valid molecules with a single mask and place them at their molecule index.
+        valid_mask = np.fromiter((x is not None for x in valid_reference), dtype="bool", count=len(valid_reference))
+        graph_labels = [None] * len(valid_reference)
+        for i, x in zip(np.flatnonzero(valid_mask), labels[valid_mask]):
+            graph_labels[i] = x
+        return graph_labels
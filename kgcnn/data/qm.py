@@ -1,4 +1,5 @@
 import os
+import functools
 import numpy as np
 import pandas as pd
 from typing import Union, Callable, List, Dict
@@ -8,10 +9,13 @@ from sklearn.preprocessing import StandardScaler
 from kgcnn.molecule.serial import deserialize_encoder
 from kgcnn.data.base import MemoryGraphDataset
 from kgcnn.molecule.io import parse_list_to_xyz_str, read_xyz_file, \
-    write_mol_block_list_to_sdf, read_mol_list_from_sdf_file, write_list_to_xyz_file
+    write_mol_block_list_to_sdf, read_mol_list_from_sdf_file, write_list_to_xyz_file, iter_mol_list_from_sdf_file
 from kgcnn.molecule.methods import global_proton_dict, inverse_global_proton_dict
 from kgcnn.molecule.convert import MolConverter
-from kgcnn.data.moleculenet import map_molecule_callbacks
+from kgcnn.data.moleculenet import map_molecule_callbacks, _SharedMolProperty, _edge_number_of, \
+    _callback_node_symbol, _callback_node_number, _callback_node_coordinates, _callback_edge_indices, \
+    _callback_edge_number, _callback_node_attributes, _callback_edge_attributes, _callback_graph_attributes, \
+    _callback_table_column, _node_symbol_and_number_of
 
 try:
     from kgcnn.molecule.graph_babel import MolecularGraphOpenBabel
@@ -118,11 +122,13 @@ class QMDataset(MemoryGraphDataset):
             file_path = self.file_path_xyz
         return read_xyz_file(file_path)
 
-    def get_mol_blocks_from_sdf_file(self, file_path: str = None) -> list:
+    def get_mol_blocks_from_sdf_file(self, file_path: str = None, lazy: bool = False) -> list:
         """Get a list of mol-blocks from file.
 
         Args:
             file_path (str): File path of SDF file. Default None uses :obj:`file_path_mol`.
+            lazy (bool): Whether to return a generator that reads mol-blocks one after another from file instead of
+                a list of all mol-blocks. Default is False.
 
         Returns:
             list: List of mol-strings.
@@ -131,6 +137,8 @@ class QMDataset(MemoryGraphDataset):
             file_path = self.file_path_mol
         if not os.path.exists(file_path):
             raise FileNotFoundError("Can not load SDF for dataset %s" % self.dataset_name)
+        if lazy:
+            return iter_mol_list_from_sdf_file(file_path)
         # Loading the molecules and the csv data
         mol_list = read_mol_list_from_sdf_file(file_path)
         if mol_list is None:
@@ -150,8 +158,9 @@ class QMDataset(MemoryGraphDataset):
         Returns:
             self
         """
-        if os.path.exists(self.file_path_mol) and not overwrite:
-            self.info("Found SDF file '%s' of pre-computed structures." % self.file_path_mol)
+        file_path_mol = self.file_path_mol
+        if os.path.exists(file_path_mol) and not overwrite:
+            self.info("Found SDF file '%s' of pre-computed structures." % file_path_mol)
             return self
 
         # Try collect single xyz files in directory
@@ -167,7 +176,7 @@ class QMDataset(MemoryGraphDataset):
         if make_sdf:
             self.info("Converting xyz to mol information.")
             converter = MolConverter()
-            converter.xyz_to_mol(self.file_path_xyz, self.file_path_mol)
+            converter.xyz_to_mol(self.file_path_xyz, file_path_mol)
         return self
 
     def read_in_memory_xyz(self, file_path: str = None,
@@ -188,8 +197,16 @@ class QMDataset(MemoryGraphDataset):
         """
         xyz_list = self.get_geom_from_xyz_file(file_path)
         symbol = [np.array(x[0]) for x in xyz_list]
-        coord = [np.array(x[1], dtype="float")[:, :3] for x in xyz_list]
-        nodes = [np.array([self._global_proton_dict[x] for x in y[0]], dtype="int") for y in xyz_list]
+        # Coordinates and atomic numbers are filled into one contiguous buffer each and split into views per molecule.
+        num_atoms = np.fromiter((len(x[0]) for x in xyz_list), dtype="int64", count=len(xyz_list))
+        atom_splits = np.concatenate([np.zeros(1, dtype="int64"), np.cumsum(num_atoms)])
+        coord_flat = np.empty((atom_splits[-1], 3), dtype="float")
+        for x, start, stop in zip(xyz_list, atom_splits[:-1], atom_splits[1:]):
+            coord_flat[start:stop] = np.asarray(x[1], dtype="float")[:, :3]
+        nodes_flat = np.fromiter(
+            (self._global_proton_dict[x] for y in xyz_list for x in y[0]), dtype="int", count=atom_splits[-1])
+        coord = [coord_flat[start:stop] for start, stop in zip(atom_splits[:-1], atom_splits[1:])]
+        nodes = [nodes_flat[start:stop] for start, stop in zip(atom_splits[:-1], atom_splits[1:])]
         for key, value in zip([atomic_coordinates, atomic_symbol, atomic_number], [coord, symbol, nodes]):
             if key is not None:
                 self.assign_property(key, value)
@@ -208,7 +225,8 @@ class QMDataset(MemoryGraphDataset):
                        sanitize: bool = False,
                        compute_partial_charges: str = None,
                        additional_callbacks: Dict[str, Callable[[MolGraphInterface, dict], None]] = None,
-                       custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None
+                       custom_transform: Callable[[MolGraphInterface], MolGraphInterface] = None,
+                       num_workers: int = 1
                        ):
         """Read SDF-file with chemical structure information into memory.
 
@@ -231,6 +249,8 @@ class QMDataset(MemoryGraphDataset):
             custom_transform (Callable): Custom transformation function to modify the generated
                 :obj:`MolecularGraphRDKit` before callbacks are carried out. The function must take a single
                 :obj:`MolecularGraphRDKit` instance as argument and return a (new) :obj:`MolecularGraphRDKit` instance.
+            num_workers (int): Number of worker processes to compute the molecular attributes in parallel. Requires
+                that :obj:`additional_callbacks` and :obj:`custom_transform` can be pickled. Default is 1.
 
         Returns:
             self
@@ -243,34 +263,39 @@ class QMDataset(MemoryGraphDataset):
                 for key, value in encoder.items():
                     encoder[key] = deserialize_encoder(value)
 
+        # Module-level callbacks, which can be pickled for parallel processing.
+        edge_number = _SharedMolProperty(_edge_number_of)
+        node_info = _SharedMolProperty(_node_symbol_and_number_of)
         callbacks = {
-            "node_symbol": lambda mg, ds: mg.node_symbol,
-            "node_number": lambda mg, ds: mg.node_number,
-            "node_coordinates": lambda mg, ds: mg.node_coordinates,
-            "edge_indices": lambda mg, ds: mg.edge_number[0],
-            "edge_number": lambda mg, ds: np.array(mg.edge_number[1], dtype='int'),
+            "node_symbol": functools.partial(_callback_node_symbol, node_info=node_info),
+            "node_number": functools.partial(_callback_node_number, node_info=node_info),
+            "node_coordinates": functools.partial(_callback_node_coordinates, dtype=None),
+            "edge_indices": functools.partial(_callback_edge_indices, edge_number=edge_number),
+            "edge_number": functools.partial(_callback_edge_number, edge_number=edge_number),
             **additional_callbacks
         }
         # Label callback.
         if label_column_name:
-            callbacks.update({'graph_labels': lambda mg, ds: ds[label_column_name]})
+            callbacks.update({'graph_labels': functools.partial(_callback_table_column, column=label_column_name)})
 
         # Attributes callbacks.
         if nodes:
             callbacks.update({
-                'node_attributes': lambda mg, ds: np.array(mg.node_attributes(nodes, encoder_nodes), dtype='float32')
+                'node_attributes': functools.partial(
+                    _callback_node_attributes, nodes=nodes, encoder=encoder_nodes, dtype="float32")
             })
         if edges:
             callbacks.update({
-                'edge_attributes': lambda mg, ds: np.array(mg.edge_attributes(edges, encoder_edges)[1], dtype='float32')
+                'edge_attributes': functools.partial(
+                    _callback_edge_attributes, edges=edges, encoder=encoder_edges, dtype="float32")
             })
         if graph:
             callbacks.update({
-                'graph_attributes': lambda mg, ds: np.array(mg.graph_attributes(graph, encoder_graph), dtype='float32')
+                'graph_attributes': functools.partial(_callback_graph_attributes, graph=graph, encoder=encoder_graph)
             })
 
         value_list = map_molecule_callbacks(
-            self.get_mol_blocks_from_sdf_file(),
+            self.get_mol_blocks_from_sdf_file(lazy=True),
             self.read_in_table_file().data_frame,
             callbacks=callbacks,
             add_hydrogen=add_hydrogen,
@@ -280,7 +305,8 @@ class QMDataset(MemoryGraphDataset):
             mol_interface_class=self._mol_graph_interface,
             logger=self.logger,
             loop_update_info=self._default_loop_update_info,
-            compute_partial_charges=compute_partial_charges
+            compute_partial_charges=compute_partial_charges,
+            num_workers=num_workers
         )
 
         for name, values in value_list.items():
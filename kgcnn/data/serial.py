@@ -1,3 +1,4 @@
+import functools
 import importlib
 import logging
 from typing import Union
@@ -14,6 +15,20 @@ global_dataset_register = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_class(module_name: str, class_name: str):
+    r"""Import module and get the dataset class. Cached, since the same class is typically resolved repeatedly.
+
+    Args:
+        module_name (str): Full name of the module, e.g. 'kgcnn.data.moleculenet'.
+        class_name (str): Name of the class in the module.
+
+    Returns:
+        type: Dataset class.
+    """
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def deserialize(dataset: Union[str, dict]):
     r"""Deserialize a dataset class from dictionary including "class_name" and "config" keys.
 
@@ -47,7 +62,7 @@ def deserialize(dataset: Union[str, dict]):
         module_name = dataset["module_name"] if "module_name" in dataset else "kgcnn.data.datasets.%s" % dataset_name
 
     try:
-        ds_class = getattr(importlib.import_module(str(module_name)), str(dataset_name))
+        ds_class = _resolve_class(str(module_name), str(dataset_name))
         config = dataset["config"] if "config" in dataset else {}
         ds_instance = ds_class(**config)
     except ModuleNotFoundError:
@@ -35,6 +35,27 @@ class _ExtensiveMolecularScalerBase:
         self._atomic_number = None
         self._sample_weight = None
 
+    def _count_atoms(self, atomic_number):
+        r"""Count the atomic numbers of each molecule at once.
+
+        Args:
+            atomic_number (list): List of arrays of atomic numbers. Example [np.array([7,1,1,1]), ...].
+
+        Returns:
+            np.ndarray: Atom counts of shape `(n_samples, max_atomic_number)` .
+        """
+        num_atoms = np.fromiter((len(x) for x in atomic_number), dtype="int64", count=len(atomic_number))
+        molecule_id = np.repeat(np.arange(len(atomic_number), dtype="int64"), num_atoms)
+        all_atoms = np.concatenate([np.asarray(x, dtype="int64").reshape(-1) for x in atomic_number] + [
+            np.zeros(0, dtype="int64")], axis=0)
+        # Out of range numbers would otherwise be counted for the wrong molecule.
+        if len(all_atoms) > 0 and (all_atoms.min() < 0 or all_atoms.max() >= self.max_atomic_number):
+            raise ValueError("Atomic numbers must be in range [0, %s) but got range [%s, %s]." % (
+                self.max_atomic_number, all_atoms.min(), all_atoms.max()))
+        counts = np.bincount(molecule_id * self.max_atomic_number + all_atoms,
+                             minlength=len(atomic_number) * self.max_atomic_number)
+        return counts.reshape((len(atomic_number), self.max_atomic_number)).astype("float64")
+
     def _fit(self, molecular_property, atomic_number, sample_weight=None):
         r"""Fit atomic number to the molecular properties.
 
@@ -52,19 +73,11 @@ class _ExtensiveMolecularScalerBase:
                     len(atomic_number), len(molecular_property))
             )
 
-        unique_number = [np.unique(x, return_counts=True) for x in atomic_number]
-        all_unique = np.unique(np.concatenate([x[0] for x in unique_number], axis=0))
-        self._fit_atom_selection = all_unique
-        atom_mask = np.zeros(self.max_atomic_number, dtype="bool")
-        atom_mask[all_unique] = True
+        atom_counts = self._count_atoms(atomic_number)
+        atom_mask = np.any(atom_counts > 0, axis=0)
+        self._fit_atom_selection = np.flatnonzero(atom_mask)
         self._fit_atom_selection_mask = atom_mask
-        total_number = []
-        for unique_per_mol, num_unique in unique_number:
-            array_atoms = np.zeros(self.max_atomic_number)
-            array_atoms[unique_per_mol] = num_unique
-            positives = array_atoms[atom_mask]
-            total_number.append(positives)
-        total_number = np.array(total_number)
+        total_number = atom_counts[:, atom_mask]
         self.ridge.fit(total_number, molecular_property, sample_weight=sample_weight)
         diff = molecular_property - self.ridge.predict(total_number)
         if self._standardize_scale:
@@ -84,16 +97,10 @@ class _ExtensiveMolecularScalerBase:
         """
         if self._fit_atom_selection_mask is None:
             raise ValueError("`ExtensiveMolecularScaler` has not been fitted yet. Can not predict.")
-        unique_number = [np.unique(x, return_counts=True) for x in atomic_number]
-        total_number = []
-        for unique_per_mol, num_unique in unique_number:
-            array_atoms = np.zeros(self.max_atomic_number)
-            array_atoms[unique_per_mol] = num_unique
-            positives = array_atoms[self._fit_atom_selection_mask]
-            if np.sum(positives) != np.sum(num_unique):
-                print("`ExtensiveMolecularScaler` got unknown atom species in transform.")
-            total_number.append(positives)
-        total_number = np.array(total_number)
+        atom_counts = self._count_atoms(atomic_number)
+        total_number = atom_counts[:, self._fit_atom_selection_mask]
+        if np.any(np.sum(total_number, axis=1) != np.sum(atom_counts, axis=1)):
+            print("`ExtensiveMolecularScaler` got unknown atom species in transform.")
         offset = self.ridge.predict(total_number)
         return offset
 
@@ -683,7 +690,7 @@ class QMGraphLabelScaler:
         Args:
             y (np.ndarray): Array of QM unscaled labels of shape `(n_samples, n_labels)`.
             X (np.ndarray): Not used.
-            copy (bool): Whether to copy or change in place.
+            copy (bool): Whether to copy or change in place. In place also changes the arrays of a list of labels.
             atomic_number (list): List of atomic numbers for each molecule. E.g. `[np.array([6,1,1,1]), ...]`.
 
         Returns:
@@ -694,11 +701,12 @@ class QMGraphLabelScaler:
         if copy:
             out_labels = []
             for i, x in enumerate(self.scaler_list):
-                out_labels.append(x.transform([d[i:i + 1] for d in labels], atomic_number=atomic_number, copy=copy))
+                out_labels.append(x.transform(labels[:, i:i + 1], atomic_number=atomic_number, copy=copy))
             out_labels = np.concatenate(out_labels, axis=-1)
         else:
             for i, x in enumerate(self.scaler_list):
-                x.transform([d[i:i + 1] for d in labels], atomic_number=atomic_number, copy=copy)
+                x.transform(labels[:, i:i + 1], atomic_number=atomic_number, copy=copy)
+            self._write_to_input(y if y is not None else X, labels)
             out_labels = labels
         return out_labels
 
@@ -721,7 +729,7 @@ class QMGraphLabelScaler:
         labels, atomic_number = self._check_input(atomic_number, X, y)
 
         for i, x in enumerate(self.scaler_list):
-            x.fit([d[i:i + 1] for d in labels], atomic_number=atomic_number, sample_weight=sample_weight)
+            x.fit(labels[:, i:i + 1], atomic_number=atomic_number, sample_weight=sample_weight)
 
         return self
 
@@ -735,7 +743,7 @@ class QMGraphLabelScaler:
         Args:
             y (np.ndarray): Array of atomic labels of shape `(n_samples, n_labels)`.
             X (np.ndarray): Not used.
-            copy (bool): Whether to copy or change in place.
+            copy (bool): Whether to copy or change in place. In place also changes the arrays of a list of labels.
             atomic_number (list): List of arrays of atomic numbers. Example [np.array([7,1,1,1]), ...].
 
         Returns:
@@ -746,11 +754,12 @@ class QMGraphLabelScaler:
         if copy:
             out_labels = []
             for i, x in enumerate(self.scaler_list):
-                out_labels.append(x.inverse_transform([d[i:i + 1] for d in labels], atomic_number=atomic_number, copy=copy))
+                out_labels.append(x.inverse_transform(labels[:, i:i + 1], atomic_number=atomic_number, copy=copy))
             out_labels = np.concatenate(out_labels, axis=-1)
         else:
             for i, x in enumerate(self.scaler_list):
-                x.inverse_transform([d[i:i + 1] for d in labels], atomic_number=atomic_number, copy=copy)
+                x.inverse_transform(labels[:, i:i + 1], atomic_number=atomic_number, copy=copy)
+            self._write_to_input(y if y is not None else X, labels)
             out_labels = labels
 
         return out_labels
@@ -759,11 +768,22 @@ class QMGraphLabelScaler:
     def _check_input(self, node_number, X, y):
         assert X is not None or y is not None, "`QMGraphLabelScaler` did not get properties or labels."
         graph_labels = X if (y is None and node_number is not None) else y
+        # Labels as array, so that each scaler gets a column view without splitting every sample.
+        graph_labels = np.asarray(graph_labels)
         node_number = node_number if node_number is not None else X
         assert len(node_number) == len(graph_labels), "`QMGraphLabelScaler` input length does not match."
         assert len(graph_labels[0]) == len(self.scaler_list), "`QMGraphLabelScaler` got wrong number of labels."
         return graph_labels, node_number
 
+    @staticmethod
+    def _write_to_input(graph_labels, labels):
+        # List input is converted to a new array in `_check_input` , write changes back into the arrays of the list.
+        if isinstance(graph_labels, np.ndarray):
+            return
+        for x, x_new in zip(graph_labels, labels):
+            if isinstance(x, np.ndarray):
+                x[...] = x_new
+
     @property
     def scale_(self):
         """Composite scale of all scaler in list."""
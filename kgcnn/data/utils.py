@@ -153,8 +153,11 @@ def ragged_tensor_from_nested_numpy(numpy_list: list, dtype: str = None, row_spl
     Returns:
         tf.RaggedTensor: Ragged tensor of former nested list of numpy arrays.
     """
+    row_lengths = np.fromiter(map(len, numpy_list), dtype=row_splits_dtype, count=len(numpy_list))
+    # Single allocation for all values. Row partition is only given by lengths.
+    flat_values = np.concatenate(numpy_list, axis=0, dtype=dtype)
     return tf.RaggedTensor.from_row_lengths(
-        np.concatenate(numpy_list, axis=0, dtype=dtype), np.array([len(x) for x in numpy_list], dtype=row_splits_dtype))
+        tf.convert_to_tensor(flat_values), tf.convert_to_tensor(row_lengths), validate=False)
 
 
 def pad_np_array_list_batch_dim(values: list, dtype: str = None):
@@ -167,7 +170,14 @@ def pad_np_array_list_batch_dim(values: list, dtype: str = None):
     Returns:
         tuple: Padded and mask :obj:`np.ndarray` of values.
     """
-    max_shape = np.amax([x.shape for x in values], axis=0)
+    shapes = [x.shape for x in values]
+    if all([x == shapes[0] for x in shapes]):
+        # No padding required, which allows to stack all values at once.
+        padded = np.stack(values, axis=0)
+        if dtype is not None:
+            padded = padded.astype(dtype=dtype, copy=False)
+        return padded, np.ones(padded.shape, dtype="bool")
+    max_shape = np.amax(shapes, axis=0)
     final_shape = np.concatenate([np.array([len(values)], dtype="int64"), np.array(max_shape, dtype="int64")])
     padded = np.zeros(final_shape, dtype=values[0].dtype)
     mask = np.zeros(final_shape, dtype="bool")
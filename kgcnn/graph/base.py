@@ -1,6 +1,7 @@
 import numpy as np
 import re
 import logging
+import functools
 import networkx as nx
 from collections.abc import MutableMapping
 from kgcnn.graph.serial import get_preprocessor
@@ -12,6 +13,12 @@ module_logger = logging.getLogger(__name__)
 module_logger.setLevel(logging.INFO)
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_search_pattern(pattern: str):
+    r"""Compiled regular expression for property search strings, which are the same for many graphs."""
+    return re.compile(pattern)
+
+
 # Base classes are collections.UserDict or collections.abc.MutableMapping. However, this comes with more
 # code to replicate dict-behaviour. Here GraphDict inherits from dict. Checking for numpy arrays can be disabled
 # in class variable. Set item is completely free.
@@ -22,7 +29,8 @@ class GraphDict(dict):
     The class is supposed to be handled just as a python dictionary.
 
     In addition, :obj:`assign_property` and :obj:`obtain_property` handles `None` values and cast into tensor format,
-    when assigning a named value.
+    when assigning a named value. Values that are already numpy arrays are stored without copy. Use :obj:`copy`
+    to obtain a graph that does not share memory with the original arrays.
 
     Graph operations that modify edges or sort indices can be applied via :obj:`apply_preprocessor` located in
     :obj:`kgcnn.graph.preprocessor`.
@@ -43,7 +51,7 @@ class GraphDict(dict):
     _require_str_key = True
     _cast_to_array = True
     _tensor_class = np.ndarray
-    _tensor_conversion = np.array
+    _tensor_conversion = np.asarray
     _require_validate = True
 
     def __init__(self, *args, **kwargs):
@@ -86,9 +94,7 @@ class GraphDict(dict):
         Returns:
             self[key].
         """
-        if key in self:
-            return self[key]
-        return None
+        return self.get(key)
 
     def validate(self):
         """Routine to check if items are set correctly, i.e. string key and np.ndarray values.
@@ -130,11 +136,12 @@ class GraphDict(dict):
         if keys is None:
             return []
         elif isinstance(keys, str):
+            pattern = _compile_search_pattern(keys)
             match_props = []
             for x in self:
-                if re.match(keys, x):
-                    if re.match(keys, x).group() == x:
-                        match_props.append(x)
+                match = pattern.match(x)
+                if match and match.group() == x:
+                    match_props.append(x)
             return sorted(match_props)
         elif isinstance(keys, (list, tuple)):
             # No pattern matching for list input.
@@ -154,7 +161,7 @@ class GraphDict(dict):
         Returns:
             bool: Key is valid. Only if `raise_error` is False.
         """
-        if key not in self or self.obtain_property(key) is None:
+        if self.get(key) is None:
             if raise_error:
                 raise AssertionError("`GraphDict` does not have '%s' key." % key)
             return False
@@ -169,9 +176,7 @@ class GraphDict(dict):
         Returns:
             bool: Key is valid. Only if `raise_error` is False.
         """
-        if key not in self or self.obtain_property(key) is None:
-            return False
-        return True
+        return self.get(key) is not None
 
     def from_networkx(self, graph: nx.Graph,
                       node_number: str = "node_number",
@@ -337,7 +342,7 @@ class GraphProcessorBase:
     """
 
     @staticmethod
-    def _obtain_properties(graph: GraphDict, to_obtain: dict, to_search, to_silent) -> dict:
+    def _obtain_properties(graph: GraphDict, to_obtain: dict, to_search, to_silent, search_cache: dict = None) -> dict:
         r"""Extract a dictionary of named properties from a :obj:`GraphDict`.
 
         Args:
@@ -347,6 +352,8 @@ class GraphProcessorBase:
                 property name(s). The keys can be used as function arguments for some transform function.
             to_search (list): A list of strings that should be considered search strings.
             to_silent (list): A list of strings that suppress 'error not found' messages.
+            search_cache (dict): Optional dictionary to store and reuse the results of search strings for the same
+                graph. Default is None.
 
         Returns:
             dict: A dictionary of resolved graph properties in tensor form.
@@ -355,26 +362,37 @@ class GraphProcessorBase:
         for key, name in to_obtain.items():
             if isinstance(name, str):
                 if name in to_search:
-                    names = graph.search_properties(name)  # Will be sorted list and existing only
+                    names = GraphProcessorBase._search_properties_cached(graph, name, search_cache)
                     obtained_properties[key] = [graph.obtain_property(x) for x in names]
                 else:
-                    if not graph.has_valid_key(name) and key not in to_silent:
+                    value = graph.obtain_property(name)
+                    if value is None and key not in to_silent:
                         module_logger.warning("Missing '%s' in '%s'" % (name, type(graph).__name__))
-                    obtained_properties[key] = graph.obtain_property(name)
+                    obtained_properties[key] = value
             elif isinstance(name, (list, tuple)):
                 prop_list = []
                 for x in name:
-                    if not graph.has_valid_key(x) and key not in to_silent:
+                    value = graph.obtain_property(x)
+                    if value is None and key not in to_silent:
                         module_logger.warning("Missing '%s' in '%s'" % (x, type(graph).__name__))
-                    prop_list.append(graph.obtain_property(x))
+                    prop_list.append(value)
                 obtained_properties[key] = prop_list
             else:
                 raise ValueError("Unsupported property identifier %s" % name)
         return obtained_properties
 
+    @staticmethod
+    def _search_properties_cached(graph: GraphDict, name: str, search_cache: dict = None) -> list:
+        r"""Search properties of a graph by search string and reuse results from :obj:`search_cache` if given."""
+        if search_cache is None:
+            return graph.search_properties(name)
+        if name not in search_cache:
+            search_cache[name] = graph.search_properties(name)  # Will be sorted list and existing only
+        return search_cache[name]
+
     @staticmethod
     def _assign_properties(graph: GraphDict, graph_properties: Union[list, np.ndarray],
-                           to_assign, to_search, in_place=False) -> Union[dict, GraphDict]:
+                           to_assign, to_search, in_place=False, search_cache: dict = None) -> Union[dict, GraphDict]:
         r"""Assign a list of arrays to a :obj:`GraphDict` by name.
 
         Args:
@@ -387,6 +405,8 @@ class GraphProcessorBase:
                 Note that in this case there must be a list of arrays in place of a single array, since search
                 strings will return a list of matching strings.
             in_place (bool): Whether to update :obj:`graph` argument.
+            search_cache (dict): Optional dictionary to store and reuse the results of search strings for the same
+                graph. Default is None.
 
         Returns:
             dict: Dictionary of arrays matched with name-keys.
@@ -402,7 +422,7 @@ class GraphProcessorBase:
         def _assign_single(name, single_graph_property):
             if isinstance(name, str):
                 if name in to_search:
-                    names = graph.search_properties(name)  # Will be sorted list and existing only
+                    names = GraphProcessorBase._search_properties_cached(graph, name, search_cache)
                     # Assume that names matches graph_properties
                     _check_list_property(names, single_graph_property)
                     for x, gp in zip(names, single_graph_property):
@@ -498,10 +518,14 @@ class GraphPreProcessorBase(GraphProcessorBase):
         Returns:
             dict: Dictionary of new properties.
         """
-        graph_properties = self._obtain_properties(graph, self._to_obtain, self._search, self._silent)
+        # Graph is not changed before assignment, so search strings only need to be resolved once.
+        search_cache = {}
+        graph_properties = self._obtain_properties(
+            graph, self._to_obtain, self._search, self._silent, search_cache=search_cache)
         # print(graph_properties)
         processed_properties = self.call(**graph_properties, **self._call_kwargs)
-        out_graph = self._assign_properties(graph, processed_properties, self._to_assign, self._search)
+        out_graph = self._assign_properties(
+            graph, processed_properties, self._to_assign, self._search, search_cache=search_cache)
         # print(out_graph)
         if self._in_place:
             graph.update(out_graph)
@@ -7,7 +7,7 @@ from ._adj import (
 from ._geom import (
     get_principal_moments_of_inertia,
     shift_coordinates_to_unit_cell, distance_for_range_indices, distance_for_range_indices_periodic,
-    coulomb_matrix_to_inverse_distance_proton, coordinates_from_distance_matrix
+    coulomb_matrix_to_inverse_distance_proton, coordinates_from_distance_matrix, range_neighbour_kdtree
 )
 from ._periodic import (
     range_neighbour_lattice
@@ -22,7 +22,7 @@ __all__ = [
     # geom
     "get_principal_moments_of_inertia",
     "shift_coordinates_to_unit_cell", "distance_for_range_indices", "distance_for_range_indices_periodic",
-    "coulomb_matrix_to_inverse_distance_proton", "coordinates_from_distance_matrix",
+    "coulomb_matrix_to_inverse_distance_proton", "coordinates_from_distance_matrix", "range_neighbour_kdtree",
     # periodic
     "range_neighbour_lattice"
 ]
@@ -133,6 +133,20 @@ def make_adjacency_undirected_logical_or(adj_mat):
         return a_out.tocoo()
 
 
+def _pack_edge_indices(edge_indices) -> np.ndarray:
+    r"""Pack index pairs `(i, j)` into single `uint64` keys `(i << 32) | j` , whose order is the lexicographic order of
+    the pairs. Indices must be non-negative and smaller than `2**32` .
+
+    Args:
+        edge_indices (np.ndarray): Index-list of edges referring to nodes of shape `(N, 2)`.
+
+    Returns:
+        np.ndarray: Keys of shape `(N, )` .
+    """
+    edge_indices = np.asarray(edge_indices)
+    return np.left_shift(edge_indices[:, 0].astype("uint64"), np.uint64(32)) | edge_indices[:, 1].astype("uint64")
+
+
 def add_self_loops_to_edge_indices(edge_indices, *args,
                                    remove_duplicates: bool = True, sort_indices: bool = True,
                                    fill_value: int = 0, return_nested: bool = False):
@@ -170,7 +184,7 @@ def add_self_loops_to_edge_indices(edge_indices, *args,
         edge_loops = np.full(edge_loops_shape, fill_value=fill_value, dtype=x.dtype)
         clean_edge[i] = np.concatenate([x, edge_loops], axis=0)
     if remove_duplicates:
-        un, unis = np.unique(clean_index, return_index=True, axis=0)
+        un, unis = np.unique(_pack_edge_indices(clean_index), return_index=True)
         mask_all = np.zeros(clean_index.shape[0], dtype="bool")
         mask_all[unis] = True
         mask_all[:edge_indices.shape[0]] = True  # keep old indices untouched
@@ -181,14 +195,10 @@ def add_self_loops_to_edge_indices(edge_indices, *args,
             clean_edge[i] = x[mask_all]
     # Sort indices
     if sort_indices:
-        order1 = np.argsort(clean_index[:, 1], axis=0, kind='mergesort')  # stable!
-        ind1 = clean_index[order1]
-        for i, x in enumerate(clean_edge):
-            clean_edge[i] = x[order1]
-        order2 = np.argsort(ind1[:, 0], axis=0, kind='mergesort')
-        clean_index = ind1[order2]
+        order = np.argsort(_pack_edge_indices(clean_index), axis=0, kind='stable')
+        clean_index = clean_index[order]
         for i, x in enumerate(clean_edge):
-            clean_edge[i] = x[order2]
+            clean_edge[i] = x[order]
     if return_nested:
         return clean_index, clean_edge
     if len(clean_edge) > 0:
@@ -214,14 +224,14 @@ def add_edges_reverse_indices(edge_indices, *args, remove_duplicates: bool = Tru
     """
     clean_edge = [x for x in args]
     edge_index_flip = np.concatenate([edge_indices[:, 1:2], edge_indices[:, 0:1]], axis=-1)
-    edge_index_flip_ij = edge_index_flip[edge_index_flip[:, 1] != edge_index_flip[:, 0]]  # Do not flip self loops
+    is_not_self_loop = edge_index_flip[:, 1] != edge_index_flip[:, 0]  # Do not flip self loops
+    edge_index_flip_ij = edge_index_flip[is_not_self_loop]
     clean_index = np.concatenate([edge_indices, edge_index_flip_ij], axis=0)
     for i, x in enumerate(clean_edge):
-        edge_to_add = x[edge_index_flip[:, 1] != edge_index_flip[:, 0]]
-        clean_edge[i] = np.concatenate([x, edge_to_add], axis=0)
+        clean_edge[i] = np.concatenate([x, x[is_not_self_loop]], axis=0)
 
     if remove_duplicates:
-        un, unis = np.unique(clean_index, return_index=True, axis=0)
+        un, unis = np.unique(_pack_edge_indices(clean_index), return_index=True)
         mask_all = np.zeros(clean_index.shape[0], dtype="bool")
         mask_all[unis] = True
         mask_all[:edge_indices.shape[0]] = True  # keep old indices untouched
@@ -231,14 +241,10 @@ def add_edges_reverse_indices(edge_indices, *args, remove_duplicates: bool = Tru
             clean_edge[i] = x[mask_all]
 
     if sort_indices:
-        order1 = np.argsort(clean_index[:, 1], axis=0, kind='mergesort')  # stable!
-        ind1 = clean_index[order1]
+        order = np.argsort(_pack_edge_indices(clean_index), axis=0, kind='stable')
+        clean_index = clean_index[order]
         for i, x in enumerate(clean_edge):
-            clean_edge[i] = x[order1]
-        order2 = np.argsort(ind1[:, 0], axis=0, kind='mergesort')
-        clean_index = ind1[order2]
-        for i, x in enumerate(clean_edge):
-            clean_edge[i] = x[order2]
+            clean_edge[i] = x[order]
     if return_nested:
         return clean_index, clean_edge
     if len(clean_edge) > 0:
@@ -259,12 +265,10 @@ def sort_edge_indices(edge_indices, *args, return_nested: bool = False):
     Returns:
         np.ndarray: `edge_indices` or `(edge_indices, *args)`. Or `(edge_indices, args)` if `return_nested`.
     """
-    order1 = np.argsort(edge_indices[:, 1], axis=0, kind='mergesort')  # stable!
-    ind1 = edge_indices[order1]
-    args1 = [x[order1] for x in args]
-    order2 = np.argsort(ind1[:, 0], axis=0, kind='mergesort')
-    ind2 = ind1[order2]
-    args2 = [x[order2] for x in args1]
+    # Single stable sort of packed keys is equivalent to sorting for second and then first index.
+    order = np.argsort(_pack_edge_indices(edge_indices), axis=0, kind='stable')
+    ind2 = edge_indices[order]
+    args2 = [x[order] for x in args]
     if return_nested:
         return ind2, args2
     if len(args2) > 0:
@@ -301,6 +305,8 @@ def get_angle_indices(idx, check_sorted: bool = True, allow_multi_edges: bool =
                       allow_self_edges: bool = False, allow_reverse_edges: bool = False,
                       edge_pairing: str = "jk"):
     r"""Compute index list for edge-pairs forming an angle. Not for batches, only for single instance.
+    However, a disjoint graph with node indices shifted by offsets per graph can be passed to process many graphs in a
+    single call, since edges of different graphs never share a node.
 
     Args:
         idx (np.ndarray): List of edge indices referring to nodes of shape `(N, 2)`
@@ -325,8 +331,7 @@ def get_angle_indices(idx, check_sorted: bool = True, allow_multi_edges: bool =
         return None, None, None
     if len(idx) == 0:
         return np.array([]), np.array([]), np.array([])
-    # Labeling edges.
-    label_ij = np.expand_dims(np.arange(len(idx)), axis=-1)
+    idx = np.asarray(idx)
     # Find edge pairing indices.
     if "k" not in edge_pairing:
         raise ValueError("Edge pairing must have index 'k'.")
@@ -336,43 +341,35 @@ def get_angle_indices(idx, check_sorted: bool = True, allow_multi_edges: bool =
     pos_fix = 0 if edge_pairing[0] != "k" else 1
     pos_ij = 0 if "i" in edge_pairing else 1
 
-    idx_ijk = []  # index triples that form an angle as (i, j, k)
-    idx_ij_k = []  # New indices that refer to edges to form an angle as ij, `edge_pairing`
-    for n, ij in enumerate(idx):
-        matching_edges = idx
-        matching_labels = label_ij
-
-        # Condition to find matching xk or kx.
-        mask = matching_edges[:, pos_fix] == ij[pos_ij]
-
-        if not allow_multi_edges:
-            mask = np.logical_and(mask, np.logical_or(matching_edges[:, 0] != ij[0], matching_edges[:, 1] != ij[1]))
-
-        if not allow_reverse_edges:
-            mask = np.logical_and(mask, np.logical_or(matching_edges[:, 0] != ij[1], matching_edges[:, 1] != ij[0]))
-
-        if allow_self_edges:
-            mask[n] = True
-        else:
-            mask[n] = False
-
-        matching_edges, matching_labels = matching_edges[mask], matching_labels[mask]  # apply mask
-
-        if len(matching_edges) == 0:
-            idx_ijk.append(np.empty((0, 3), dtype=idx.dtype))
-            idx_ij_k.append(np.empty((0, 2), dtype=idx.dtype))
-            continue
-
-        # All combos for edge ij
-        combos_ik = np.concatenate(
-            [np.repeat([ij], len(matching_edges), axis=0), np.expand_dims(matching_edges[:, pos_k], axis=-1)], axis=-1)
-        combos_label = np.concatenate(
-            [np.repeat([[n]], len(matching_labels), axis=0), matching_labels], axis=-1)
-        idx_ijk.append(combos_ik)
-        idx_ij_k.append(combos_label)
-
-    idx_ijk = np.concatenate(idx_ijk, axis=0)
-    idx_ij_k = np.concatenate(idx_ij_k, axis=0)
+    # Condition to find matching xk or kx for all edges at once. Instead of comparing each edge with all other edges,
+    # edges are sorted by their fixed index and matching ranges are found by binary search.
+    num_edges = len(idx)
+    order = np.argsort(idx[:, pos_fix], kind="stable")  # stable keeps edges with same index in original order.
+    sorted_fix = idx[order, pos_fix]
+    left = np.searchsorted(sorted_fix, idx[:, pos_ij], side="left")
+    right = np.searchsorted(sorted_fix, idx[:, pos_ij], side="right")
+    counts = right - left
+    label_n = np.repeat(np.arange(num_edges), counts)
+    # Ragged range from left to right for each edge.
+    offsets = np.repeat(left - (np.cumsum(counts) - counts), counts)
+    label_m = order[np.arange(len(label_n)) + offsets]
+
+    mask = label_m != label_n
+    if not allow_multi_edges:
+        mask = np.logical_and(mask, np.any(idx[label_m] != idx[label_n], axis=-1))
+    if not allow_reverse_edges:
+        mask = np.logical_and(mask, np.any(idx[label_m] != np.flip(idx[label_n], axis=-1), axis=-1))
+    label_n, label_m = label_n[mask], label_m[mask]
+
+    if allow_self_edges:
+        label_self = np.arange(num_edges)
+        label_n = np.concatenate([label_n, label_self], axis=0)
+        label_m = np.concatenate([label_m, label_self], axis=0)
+        order_nm = np.lexsort((label_m, label_n))
+        label_n, label_m = label_n[order_nm], label_m[order_nm]
+
+    idx_ijk = np.concatenate([idx[label_n], idx[label_m, pos_k:pos_k+1]], axis=-1)  # (i, j, k)
+    idx_ij_k = np.stack([label_n, label_m], axis=-1)  # ij, `edge_pairing`
 
     if check_sorted:
         order1 = np.argsort(idx_ij_k[:, 1], axis=0, kind='mergesort')  # stable!
@@ -463,27 +460,42 @@ def get_index_matrix(shape, flatten=False):
     return ind_array
 
 
-def coordinates_to_distancematrix(coord3d: np.ndarray):
+def coordinates_to_distancematrix(coord3d: np.ndarray, array_module=np):
     r"""Transform coordinates to distance matrix. Will apply transformation on last dimension.
     Changing of shape from `(..., N, 3)` to `(..., N, N)`. This also works for more than 3 coordinates.
     Note: We could extend this to other metrics.
 
+    The squared distances are computed from :math:`|x-y|^2 = |x|^2 + |y|^2 - 2 x \cdot y` with a single matrix
+    product, which avoids the intermediate `(..., N, N, 3)` difference array of a broadcast implementation.
+    Coordinates are centered on their mean before the product to avoid loss of precision from cancellation for points
+    far from the origin. Negative values from floating point cancellation are clipped and the diagonal is set to
+    exactly zero.
+
     Arg:
         coord3d (np.ndarray): Coordinates of shape `(..., N, 3)` for cartesian coordinates `(x, y, z)`
             and `N` the number of nodes or points. Coordinates are stored in the last dimension.
+        array_module: Numpy compatible array module to compute distance matrix with, e.g. `cupy` to run on GPU.
+            The returned array then belongs to this module. Default is `numpy`.
 
     Returns:
         np.ndarray: Distance matrix as numpy array with shape `(..., N, N)` where N is the number of nodes.
     """
-    shape_3d = len(coord3d.shape)
-    a = np.expand_dims(coord3d, axis=shape_3d - 2)
-    b = np.expand_dims(coord3d, axis=shape_3d - 1)
-    c = b - a
-    d = np.sqrt(np.sum(np.square(c), axis=shape_3d))
+    xp = array_module
+    coord3d = xp.asarray(coord3d)
+    if not np.issubdtype(coord3d.dtype, np.floating):
+        coord3d = coord3d.astype("float")
+    coord3d = coord3d - xp.mean(coord3d, axis=-2, keepdims=True)
+    gram = xp.matmul(coord3d, xp.swapaxes(coord3d, -1, -2))
+    sq_norm = xp.einsum("...ij,...ij->...i", coord3d, coord3d)
+    d2 = xp.expand_dims(sq_norm, axis=-1) + xp.expand_dims(sq_norm, axis=-2) - 2 * gram
+    xp.maximum(d2, 0, out=d2)
+    ind_diag = xp.arange(d2.shape[-1])
+    d2[..., ind_diag, ind_diag] = 0
+    d = xp.sqrt(d2)
     return d
 
 
-def invert_distance(d, nan=0, pos_inf=0, neg_inf=0):
+def invert_distance(d, nan=0, pos_inf=0, neg_inf=0, copy: bool = True):
     r"""Invert distance array, e.g. distance matrix. Inversion is done for all entries.
     Keeps the shape of input distance array, since operation is done element-wise.
 
@@ -492,15 +504,19 @@ def invert_distance(d, nan=0, pos_inf=0, neg_inf=0):
         nan (float): Replacement for np.nan after division. Default is 0.
         pos_inf (float): Replacement for np.inf after division. Default is 0.
         neg_inf (float): Replacement for -np.inf after division. Default is 0.
+        copy (bool): Whether to create a new array or to invert a floating point array `d` in place. Default is True.
 
     Returns:
         np.array: Inverted distance array as np.array of identical shape and
             replaces `np.nan` and `np.inf` with e.g. 0.0.
     """
     with np.errstate(divide='ignore', invalid='ignore'):
-        c = np.true_divide(1, d)
+        if not copy and isinstance(d, np.ndarray) and np.issubdtype(d.dtype, np.floating):
+            c = np.true_divide(1, d, out=d)
+        else:
+            c = np.true_divide(1, d)
         # c[c == np.inf] = 0
-        c = np.nan_to_num(c, nan=nan, posinf=pos_inf, neginf=neg_inf)
+        c = np.nan_to_num(c, copy=False, nan=nan, posinf=pos_inf, neginf=neg_inf)
     return c
 
 
@@ -553,18 +569,13 @@ def define_adjacency_from_distance(distance_matrix, max_distance=np.inf, max_nei
             - graph_indices (np.array): Flatten indices from former array that have `True` as entry in the
                 returned adjacency matrix.
     """
-    distance_matrix = np.array(distance_matrix)
+    distance_matrix = np.asarray(distance_matrix)
     num_atoms = distance_matrix.shape[-1]
     if exclusive:
         graph_adjacency = np.ones_like(distance_matrix, dtype="bool")
     else:
         graph_adjacency = np.zeros_like(distance_matrix, dtype="bool")
     inddiag = np.arange(num_atoms)
-    # Make Indix Matrix
-    indarr = np.indices(distance_matrix.shape)
-    re_order = np.append(np.arange(1, len(distance_matrix.shape) + 1), 0)
-    graph_indices = indarr.transpose(re_order)
-    # print(graph_indices.shape)
     # Add Max Radius
     if max_distance is not None:
         temp = distance_matrix < max_distance
@@ -589,7 +600,8 @@ def define_adjacency_from_distance(distance_matrix, max_distance=np.inf, max_nei
     if not self_loops:
         graph_adjacency[..., inddiag, inddiag] = False
 
-    graph_indices = graph_indices[graph_adjacency]
+    # Indices of the adjacency in row-major order, without making a full index matrix.
+    graph_indices = np.argwhere(graph_adjacency)
     return graph_adjacency, graph_indices
 
 
@@ -609,13 +621,17 @@ def compute_reverse_edges_index_map(edge_idx: np.ndarray):
     if len(edge_idx) == 0:
         return np.array([], dtype="int")
 
-    edge_idx_rev = np.flip(edge_idx, axis=-1)
-    edge_pos, rev_pos = np.where(
-        np.all(np.expand_dims(edge_idx, axis=1) == np.expand_dims(edge_idx_rev, axis=0), axis=-1))
-    # May have duplicates, find unique.
-    ege_pos_uni, uni_pos = np.unique(edge_pos, return_index=True)
-    rev_pos_uni = rev_pos[uni_pos]
+    edge_idx = np.asarray(edge_idx, dtype="int64")
+    # Pack each index pair into a single integer key. Sorting keys instead of comparing all pairs of edges
+    # reduces the cost from O(N^2) to O(N log N).
+    num_nodes = int(np.amax(edge_idx)) + 1
+    keys = edge_idx[:, 0] * num_nodes + edge_idx[:, 1]
+    keys_rev = edge_idx[:, 1] * num_nodes + edge_idx[:, 0]
+    # May have duplicates, `np.unique` returns position of first encounter.
+    keys_uni, first_pos = np.unique(keys, return_index=True)
+    search_pos = np.minimum(np.searchsorted(keys_uni, keys_rev), len(keys_uni) - 1)
+    has_rev = keys_uni[search_pos] == keys_rev
     edge_map = np.empty(len(edge_idx), dtype="int")
     edge_map.fill(np.iinfo(edge_map.dtype).min)
-    edge_map[ege_pos_uni] = rev_pos_uni
+    edge_map[has_rev] = first_pos[search_pos[has_rev]]
     return edge_map
@@ -1,5 +1,6 @@
 import numpy as np
 from typing import Union
+from scipy.spatial import cKDTree
 
 
 def coulomb_matrix_to_inverse_distance_proton(coulomb_mat: np.ndarray,
@@ -235,8 +236,9 @@ def distance_for_range_indices(coordinates: np.ndarray, indices: np.ndarray,
     Returns:
         np.ndarray: Distances of shape `(M, )` or `(M, 1)` if `require_distance_dimension` .
     """
-    pos12 = coordinates[indices]
-    dist = np.sqrt(np.sum(np.square(pos12[:, 0] - pos12[:, 1]), axis=-1))
+    indices = np.asarray(indices)
+    diff = coordinates[indices[:, 0]] - coordinates[indices[:, 1]]
+    dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
     if require_distance_dimension:
         if len(dist.shape) <= 1:
             dist = np.expand_dims(dist, axis=-1)
@@ -276,3 +278,77 @@ def distance_for_range_indices_periodic(coordinates: np.ndarray,
             dist = np.expand_dims(dist, axis=-1)
     return dist
 
+
+def range_neighbour_kdtree(coordinates: np.ndarray, max_distance: float = np.inf, max_neighbours: int = np.inf,
+                           exclusive: bool = True, self_loops: bool = False):
+    r"""Find range connections from a cutoff radius and a maximum number of neighbours with a
+    :obj:`scipy.spatial.cKDTree` , without computing a dense distance matrix.
+    Selection follows :obj:`define_adjacency_from_distance` , i.e. the nearest `max_neighbours + 1` nodes including
+    the node itself are considered, distances must be strictly smaller than `max_distance` and self-loops are removed
+    afterwards, if not requested.
+
+    Args:
+        coordinates (np.ndarray): Positions of shape `(N, 3)` .
+        max_distance (float, optional): Maximum distance to allow connections, can also be None. Defaults to `np.inf`.
+        max_neighbours (int, optional): Maximum number of neighbours, can also be None. Defaults to `np.inf`.
+        exclusive (bool, optional): Whether both max distance and Neighbours must be fulfilled. Defaults to True.
+        self_loops (bool, optional): Allow self-loops. Defaults to False.
+
+    Returns:
+        tuple: Range indices of shape `(M, 2)` sorted by first and second index and distances of shape `(M, )` .
+    """
+    coordinates = np.asarray(coordinates)
+    num_nodes = len(coordinates)
+    if num_nodes == 0:
+        return np.zeros((0, 2), dtype="int"), np.zeros((0, ), dtype=coordinates.dtype)
+    tree = cKDTree(coordinates)
+
+    def _pairs_to_keys(i, j):
+        return np.asarray(i, dtype="int64") * num_nodes + np.asarray(j, dtype="int64")
+
+    # Unbounded constraints connect all pairs. For exclusive selection they do not restrict the intersection and are
+    # skipped, so that only the sparse keys of the remaining constraint are used.
+    is_all_neighbours = max_neighbours is not None and min(max_neighbours + 1, num_nodes) >= num_nodes
+    is_all_distance = max_distance is not None and np.isposinf(max_distance)
+    use_all_pairs = not exclusive and (is_all_neighbours or is_all_distance)
+
+    # Connections by number of neighbours, including node itself.
+    keys_neighbours = None
+    if max_neighbours is not None and not is_all_neighbours and not use_all_pairs:
+        k = int(max_neighbours + 1)
+        _, j_nn = tree.query(coordinates, k=k)
+        j_nn = np.reshape(j_nn, (num_nodes, k))
+        keys_neighbours = np.unique(_pairs_to_keys(np.repeat(np.arange(num_nodes), k), j_nn.flatten()))
+
+    # Connections by distance.
+    keys_distance = None
+    if max_distance is not None and not is_all_distance and not use_all_pairs:
+        j_r = tree.query_ball_point(coordinates, r=max_distance)
+        row_lengths = np.fromiter(map(len, j_r), dtype="int64", count=num_nodes)
+        i_r = np.repeat(np.arange(num_nodes), row_lengths)
+        j_r = np.concatenate([np.asarray(x, dtype="int64") for x in j_r])
+        # Ball query includes boundary, but connections require distance strictly smaller than cutoff.
+        diff = coordinates[i_r] - coordinates[j_r]
+        is_inside = np.sqrt(np.einsum("ij,ij->i", diff, diff)) < max_distance
+        keys_distance = np.unique(_pairs_to_keys(i_r[is_inside], j_r[is_inside]))
+
+    if use_all_pairs:
+        keys = np.arange(num_nodes * num_nodes, dtype="int64")
+    elif keys_neighbours is not None and keys_distance is not None:
+        if exclusive:
+            keys = np.intersect1d(keys_neighbours, keys_distance, assume_unique=True)
+        else:
+            keys = np.union1d(keys_neighbours, keys_distance)
+    elif keys_neighbours is not None:
+        keys = keys_neighbours
+    elif keys_distance is not None:
+        keys = keys_distance
+    else:
+        keys = np.arange(num_nodes * num_nodes, dtype="int64") if exclusive else np.zeros((0, ), dtype="int64")
+
+    indices = np.stack([keys // num_nodes, keys % num_nodes], axis=-1)
+    if not self_loops:
+        indices = indices[indices[:, 0] != indices[:, 1]]
+    diff = coordinates[indices[:, 0]] - coordinates[indices[:, 1]]
+    dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+    return indices, dist
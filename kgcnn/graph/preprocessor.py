@@ -8,6 +8,11 @@ logging.basicConfig()  # Module logger
 module_logger = logging.getLogger(__name__)
 module_logger.setLevel(logging.INFO)
 
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
 
 class MakeUndirectedEdges(GraphPreProcessorBase):
     r"""Add edges :math:`(j, i)` for :math:`(i, j)` if there is no edge :math:`(j, i)`.
@@ -239,9 +244,8 @@ class SetRangeFromEdges(GraphPreProcessorBase):
         range_indices = np.array(edge_indices, dtype="int")  # Makes copy
         if node_coordinates is None:
             return range_indices, None
-        dist = np.sqrt(np.sum(
-            np.square(node_coordinates[range_indices[:, 0]] - node_coordinates[range_indices[:, 1]]),
-            axis=-1, keepdims=True))
+        diff = node_coordinates[range_indices[:, 0]] - node_coordinates[range_indices[:, 1]]
+        dist = np.expand_dims(np.sqrt(np.einsum("ij,ij->i", diff, diff)), axis=-1)
         if do_invert_distance:
             dist = invert_distance(dist)
         return range_indices, dist
@@ -262,19 +266,24 @@ class SetRange(GraphPreProcessorBase):
         self_loops (bool): If also self-interactions with distance 0 should be considered. Default is False.
         exclusive (bool): Whether both max_neighbours and max_distance must be fulfilled. Default is True.
         overwrite (bool): Whether to overwrite existing range indices. Default is True.
+        use_kdtree (bool): Whether to search neighbours with a :obj:`scipy.spatial.cKDTree` instead of computing a
+            dense distance matrix, which is preferable for large graphs. Default is False.
+        use_gpu (bool): Whether to compute the dense distance matrix on GPU with `cupy` , if installed.
+            Default is False.
     """
 
     def __init__(self, *, range_indices: str = "range_indices", node_coordinates: str = "node_coordinates",
                  range_attributes: str = "range_attributes", max_distance: float = 4.0, max_neighbours: int = 15,
                  do_invert_distance: bool = False, self_loops: bool = False, exclusive: bool = True, name="set_range",
-                 overwrite: bool = True,
+                 overwrite: bool = True, use_kdtree: bool = False, use_gpu: bool = False,
                  **kwargs):
         super().__init__(name=name, **kwargs)
         self._to_obtain.update({"node_coordinates": node_coordinates, "range_indices": range_indices})
         self._silent = ["range_indices"]
         self._call_kwargs = {
             "max_distance": max_distance, "max_neighbours": max_neighbours, "do_invert_distance": do_invert_distance,
-            "self_loops": self_loops, "exclusive": exclusive, "overwrite": overwrite}
+            "self_loops": self_loops, "exclusive": exclusive, "overwrite": overwrite, "use_kdtree": use_kdtree,
+            "use_gpu": use_gpu}
         self._to_assign = [range_indices, range_attributes]
         self._config_kwargs.update({
             "node_coordinates": node_coordinates, "range_indices": range_indices, "range_attributes": range_attributes,
@@ -282,7 +291,7 @@ class SetRange(GraphPreProcessorBase):
 
     def call(self, *, node_coordinates: np.ndarray, range_indices: np.ndarray,
              max_distance: float, max_neighbours: int, do_invert_distance: bool,
-             self_loops: bool, exclusive: bool, overwrite: bool):
+             self_loops: bool, exclusive: bool, overwrite: bool, use_kdtree: bool, use_gpu: bool):
 
         if range_indices is not None and not overwrite:
             # only need to recompute range_attributes.
@@ -293,14 +302,26 @@ class SetRange(GraphPreProcessorBase):
 
         if node_coordinates is None:
             return None, None
+        if use_kdtree:
+            indices, dist_masked = range_neighbour_kdtree(
+                node_coordinates, max_distance=max_distance, max_neighbours=max_neighbours, exclusive=exclusive,
+                self_loops=self_loops)
+            if do_invert_distance:
+                dist_masked = invert_distance(dist_masked, copy=False)
+            return indices, np.expand_dims(dist_masked, axis=-1)
         # Compute distance matrix here. May be problematic for too large graphs.
-        dist = coordinates_to_distancematrix(node_coordinates)
+        if use_gpu and cupy is not None:
+            dist = cupy.asnumpy(coordinates_to_distancematrix(node_coordinates, array_module=cupy))
+        else:
+            if use_gpu:
+                module_logger.warning("Can not compute distance matrix on GPU, since `cupy` is not installed.")
+            dist = coordinates_to_distancematrix(node_coordinates)
         cons, indices = define_adjacency_from_distance(
             dist, max_distance=max_distance, max_neighbours=max_neighbours, exclusive=exclusive, self_loops=self_loops)
-        mask = np.array(cons, dtype="bool")
-        dist_masked = dist[mask]
+        # Boolean mask makes a copy of selected distances, which can be inverted in place.
+        dist_masked = dist[cons]
         if do_invert_distance:
-            dist_masked = invert_distance(dist_masked)
+            dist_masked = invert_distance(dist_masked, copy=False)
         # Need one feature dimension.
         if len(dist_masked.shape) <= 1:
             dist_masked = np.expand_dims(dist_masked, axis=-1)
@@ -29,8 +29,11 @@ def tf_dataset_disjoint_generator(
         batch_size=32,
         epochs=None,
         padded_disjoint=False,
+        padded_buckets: int = None,
         shuffle=True,
-        seed=42
+        seed=42,
+        prefetch=True,
+        prefetch_device: str = None
 ):
     r"""Make a tensorflow dataset for disjoint graph loading.
 
@@ -46,6 +49,9 @@ def tf_dataset_disjoint_generator(
     Therefore, one batch ID for edges is enough. One could however assign as many as IDs as there are disjoint
     graph properties in `graph` .
 
+    Disjoint properties are flattened into a contiguous array when the dataset is created, so that changes to `graphs`
+    afterwards are not seen by the dataset.
+
     Args:
         graphs: List of dictionaries with named graph properties.
         inputs: List or dict of keras input layer configs.
@@ -57,8 +63,14 @@ def tf_dataset_disjoint_generator(
         batch_size: Batch size.
         epochs: Expected number of epochs. Only required for padded disjoint.
         padded_disjoint: If padded disjoint tensors should be generated.
+        padded_buckets: Number of fixed padded sizes per disjoint input for `padded_disjoint=True` . A batch is padded
+            to the smallest size that fits it, which wastes less padding than the maximum size for all batches but
+            still yields only a few distinct shapes to compile. Default is None, which pads to the maximum size.
         shuffle: Whether to shuffle each epoch.
         seed: Seed for shuffle.
+        prefetch: Whether to prefetch batches, so that the python generator runs ahead of the training step.
+        prefetch_device: Device to prefetch batches to, e.g. '/gpu:0'. Copies to the device then overlap with the
+            training step. Only used with `prefetch=True` . Default is None.
 
     Returns:
         tf.data.Dataset: Tensorflow dataset to load disjoint graphs.
@@ -166,6 +178,36 @@ def tf_dataset_disjoint_generator(
         module_logger.info("Padded max of disjoint: %s." % [
             x/batch_size if x is not None else None for x in max_size.values()])
 
+    # Padded sizes are equally spaced up to the maximum size, which is always the last bucket.
+    padded_sizes = {i: None for i in inputs.keys()}
+    if padded_disjoint:
+        num_buckets = padded_buckets if padded_buckets is not None else 1
+        if num_buckets < 1:
+            raise ValueError("Number of padded buckets must be positive but got '%s'." % padded_buckets)
+        for i, x in max_size.items():
+            if x is not None:
+                padded_sizes[i] = np.unique(np.ceil(np.linspace(0, x, num_buckets + 1)[1:]).astype("int64"))
+
+    # Disjoint properties are flattened once into a contiguous buffer with row splits. A batch is then gathered with
+    # a single index array instead of concatenating the arrays of each graph in every batch.
+    flat_values = {i: None for i in inputs.keys()}
+    row_splits = {i: None for i in inputs.keys()}
+    for i in inputs.keys():
+        if dataset_size == 0 or not is_attributes[i] or assignment_to_id[i] is None:
+            continue
+        array_list = [x[inputs[i]["name"]] for x in graphs]
+        flat_values[i] = np.concatenate(array_list, axis=0)
+        row_splits[i] = np.zeros(dataset_size + 1, dtype="int64")
+        row_splits[i][1:] = np.cumsum([len(x) for x in array_list])
+
+    # Resolve once which inputs are graph-level, disjoint or indices and where their IDs are placed in the output.
+    graph_inputs = [i for i in inputs.keys() if is_attributes[i] and assignment_to_id[i] is None]
+    disjoint_inputs = [i for i in inputs.keys() if is_attributes[i] and assignment_to_id[i] is not None]
+    index_inputs = [i for i in inputs.keys() if assignment_of_indices[i] is not None]
+    where_count = {i: pos_count.get(assignment_to_id[i]) for i in disjoint_inputs}
+    where_batch = {i: pos_batch_id.get(assignment_to_id[i]) for i in disjoint_inputs}
+    where_subgraph = {i: pos_subgraph_id.get(assignment_to_id[i]) for i in disjoint_inputs}
+
     data_index = np.arange(dataset_size)
     rng = Generator(PCG64(seed=seed))
 
@@ -176,60 +218,64 @@ def tf_dataset_disjoint_generator(
 
         for batch_index in range(0, dataset_size, batch_size):
             idx = data_index[batch_index:batch_index + batch_size]
-            graphs_batch = [graphs[i] for i in idx]
 
             out = {i: None for i in inputs.keys()}
             out_counts = {i: None for i in inputs.keys()}
 
-            for i in inputs.keys():
-                if not is_attributes[i]:
-                    continue
-
-                array_list = [x[inputs[i]["name"]] for x in graphs_batch]
-                if assignment_to_id[i] is None:
-                    values = np.array(array_list, dtype=inputs[i]["dtype"])
-                    if padded_disjoint:
-                        values = pad_at_axis(values, (1, 0), axis=0)
-                    out[i] = values
+            for i in graph_inputs:
+                # Fill a preallocated array, which already contains the padded graph, without an intermediate list.
+                name = inputs[i]["name"]
+                num_pad = 1 if padded_disjoint else 0
+                values = np.empty((len(idx) + num_pad,) + np.shape(graphs[idx[0]][name]), dtype=inputs[i]["dtype"])
+                if padded_disjoint:
+                    values[0] = 0
+                for k, j in enumerate(idx):
+                    values[k + num_pad] = graphs[j][name]
+                out[i] = values
+
+            for i in disjoint_inputs:
+                starts = row_splits[i][idx]
+                counts = row_splits[i][idx + 1] - starts
+                batch_starts = np.cumsum(counts) - counts
+                positions = np.arange(np.sum(counts), dtype="int64") + np.repeat(starts - batch_starts, counts)
+
+                if not padded_disjoint:
+                    out[i] = flat_values[i][positions]
+                    out_counts[i] = counts
                 else:
-                    values = np.concatenate(array_list, axis=0)
-                    counts = np.array([len(x) for x in array_list], dtype="int64")
-                    ids = assignment_to_id[i]
-
-                    if not padded_disjoint:
-                        out[i] = values
-                        out_counts[i] = counts
-                    else:
-                        len_values = len(values)
-                        num_pad_required = max_size[i] - len_values + 1
-                        values = pad_at_axis(values, (num_pad_required, 0), axis=0)
-                        out[i] = values
-                        counts = np.concatenate([np.array([num_pad_required], dtype=counts.dtype), counts], axis=0)
-                        out_counts[i] = counts
-
-                    if ids in pos_count:
-                        if out[pos_count[ids]] is None:
-                            out[pos_count[ids]] = counts
-                    if ids in pos_batch_id:
-                        if out[pos_batch_id[ids]] is None:
-                            out[pos_batch_id[ids]] = np.repeat(
-                                np.arange(len(counts), dtype="int64"), repeats=counts)
-                    if ids in pos_subgraph_id:
-                        if out[pos_subgraph_id[ids]] is None:
-                            out[pos_subgraph_id[ids]] = np.concatenate(
-                                [np.arange(x, dtype="int64") for x in counts], axis=0)
+                    # Gather directly behind the padding of a preallocated array instead of padding a copy.
+                    padded_size = padded_sizes[i][np.searchsorted(padded_sizes[i], len(positions))]
+                    num_pad_required = padded_size - len(positions) + 1
+                    values = np.zeros((padded_size + 1,) + flat_values[i].shape[1:], dtype=flat_values[i].dtype)
+                    np.take(flat_values[i], positions, axis=0, out=values[num_pad_required:])
+                    out[i] = values
+                    counts = np.concatenate([np.array([num_pad_required], dtype=counts.dtype), counts], axis=0)
+                    out_counts[i] = counts
+
+                if where_count[i] is not None and out[where_count[i]] is None:
+                    out[where_count[i]] = counts
+                if where_batch[i] is not None and out[where_batch[i]] is None:
+                    out[where_batch[i]] = np.repeat(np.arange(len(counts), dtype="int64"), repeats=counts)
+                if where_subgraph[i] is not None and out[where_subgraph[i]] is None:
+                    # Ragged arange without a python loop over the graphs of the batch.
+                    out[where_subgraph[i]] = np.arange(np.sum(counts), dtype="int64") - np.repeat(
+                        np.cumsum(counts) - counts, counts)
 
             # Indices
-            for i in inputs.keys():
-                if assignment_of_indices[i] is not None:
-                    edge_indices_flatten = out[i]
-                    count_nodes = out_counts[assignment_of_indices[i]]
-                    count_edges = out_counts[i]
-                    node_splits = np.pad(np.cumsum(count_nodes), [[1, 0]])
-                    offset_edge_indices = np.expand_dims(np.repeat(node_splits[:-1], count_edges), axis=-1)
-                    disjoint_indices = edge_indices_flatten + offset_edge_indices
-                    disjoint_indices = np.transpose(disjoint_indices)
-                    out[i] = disjoint_indices
+            # Start of each graph in the disjoint nodes, computed once per referenced input.
+            node_offsets = {}
+            for i in index_inputs:
+                edge_indices_flatten = out[i]
+                ref = assignment_of_indices[i]
+                if ref not in node_offsets:
+                    count_nodes = out_counts[ref]
+                    node_offsets[ref] = np.cumsum(count_nodes) - count_nodes
+                offset_edge_indices = np.repeat(node_offsets[ref], out_counts[i]).astype(
+                    edge_indices_flatten.dtype, copy=False)
+                # Add offsets and transpose in one pass, which writes a contiguous `(2, E)` array directly.
+                disjoint_indices = np.empty(edge_indices_flatten.shape[::-1], dtype=edge_indices_flatten.dtype)
+                np.add(np.transpose(edge_indices_flatten), offset_edge_indices, out=disjoint_indices)
+                out[i] = disjoint_indices
 
             # Match output container
             if is_list_input:
@@ -243,5 +289,10 @@ def tf_dataset_disjoint_generator(
         generator,
         output_signature=output_spec
     )
+    if prefetch and prefetch_device is not None:
+        # Must be the final transformation of the dataset.
+        data_loader = data_loader.apply(tf.data.experimental.prefetch_to_device(prefetch_device))
+    elif prefetch:
+        data_loader = data_loader.prefetch(tf.data.AUTOTUNE)
 
     return data_loader
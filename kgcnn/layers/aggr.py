@@ -15,7 +15,8 @@ class Aggregate(Layer):  # noqa
     The class essentially uses a reduce function by name to aggregate a feature list given indices to group by.
     Possible supported permutation invariant aggregations are 'sum', 'mean', 'max' or 'min'.
     For aggregation either scatter or segment operation can be used from the backend, if available.
-    Note that you have to specify which to use with e.g. 'scatter_sum'.
+    Note that you have to specify which to use with e.g. 'scatter_sum'. Segment operations, e.g. 'segment_sum',
+    require the indices to be sorted, which is the case for batch IDs of disjoint graphs.
     This layer further requires a reference tensor to either statically infer the output shape or even directly
     aggregate the values into.
     """
@@ -46,13 +47,14 @@ class Aggregate(Layer):  # noqa
             "scatter_mean": scatter_reduce_mean,
             "scatter_max": scatter_reduce_max,
             "scatter_min": scatter_reduce_min,
-            "segment_sum": None,
-            "segment_mean": None,
-            "segment_max": None,
-            "segment_min": None
+            "segment_sum": scatter_reduce_sum,
+            "segment_mean": scatter_reduce_mean,
+            "segment_max": scatter_reduce_max,
+            "segment_min": scatter_reduce_min
         }
         self._pool_method = pooling_by_name[pooling_method]
         self._use_scatter = "scatter" in pooling_method
+        self._use_segment = "segment" in pooling_method
         self._use_reference_for_aggregation = "update" in pooling_method
 
     def build(self, input_shape):
@@ -81,8 +83,8 @@ class Aggregate(Layer):  # noqa
         """
         x, index, reference = inputs
         shape = ops.shape(reference)[:1] + ops.shape(x)[1:]
-        if self._use_scatter:
-            return self._pool_method(index, x, shape=shape)
+        if self._use_scatter or self._use_segment:
+            return self._pool_method(index, x, shape=shape, indices_are_sorted=self._use_segment)
         else:
             raise NotImplementedError()
 
@@ -323,7 +325,8 @@ class AggregateLocalEdgesAttention(Layer):
         reference, x, attention, edge_index = inputs
         receive_indices = ops.take(edge_index, self.pooling_index, axis=self.axis_indices)
         shape_attention = ops.shape(reference)[:1] + ops.shape(attention)[1:]
-        a = scatter_reduce_softmax(receive_indices, attention, shape=shape_attention, normalize=self.normalize_softmax)
+        a = scatter_reduce_softmax(receive_indices, attention, shape=shape_attention, normalize=self.normalize_softmax,
+                                   indices_are_sorted=self.is_sorted)
         x = x * ops.broadcast_to(a, ops.shape(x))
         return self.to_aggregate([x, receive_indices, reference])
 
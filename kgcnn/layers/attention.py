@@ -2,10 +2,133 @@
 from kgcnn.layers.gather import GatherNodesIngoing, GatherNodesOutgoing
 from keras.layers import Dense, Concatenate, Activation, Average, Layer
 from kgcnn.layers.aggr import AggregateLocalEdgesAttention
-from keras import ops
+from keras import ops, activations
 import kgcnn.ops.activ
 
 
+class AverageActivation(Layer):  # noqa
+    r"""Average a list of attention heads and apply an activation within the same layer.
+
+    Equivalent to :obj:`Average` followed by :obj:`Activation` but without an intermediate layer call.
+    """
+
+    def __init__(self, activation="linear", **kwargs):
+        """Initialize layer.
+
+        Args:
+            activation (str): Activation applied to the average of the heads. Default is "linear".
+        """
+        super(AverageActivation, self).__init__(**kwargs)
+        if activation in ["kgcnn>leaky_relu", "kgcnn>leaky_relu2"]:
+            activation = {"class_name": "function", "config": "kgcnn>leaky_relu2"}
+        self._activation_config = activation
+        self.activation = activations.get(activation)
+
+    def build(self, input_shape):
+        """Build layer."""
+        super(AverageActivation, self).build(input_shape)
+
+    def compute_output_shape(self, input_shape):
+        """Compute output shape."""
+        return input_shape[0]
+
+    def call(self, inputs, **kwargs):
+        """Forward pass.
+
+        Args:
+            inputs (list): List of head embeddings of same shape ([N], F)
+
+        Returns:
+            Tensor: Activation of averaged heads of shape ([N], F)
+        """
+        x = inputs[0]
+        for h in inputs[1:]:
+            x = ops.add(x, h)
+        return self.activation(x / len(inputs))
+
+    def get_config(self):
+        """Update layer config."""
+        config = super(AverageActivation, self).get_config()
+        config.update({"activation": self._activation_config})
+        return config
+
+
+class DenseHeads(Layer):  # noqa
+    r"""Linear transformation of nodes for multiple attention heads with a single dense kernel.
+
+    Equivalent to one :obj:`Dense` layer per head, but the projection is computed for all heads at once and split
+    into a list of heads afterwards. Can be passed to :obj:`AttentionHeadGATV2` with `use_projected_nodes` .
+    """
+
+    def __init__(self,
+                 units: int,
+                 num_heads: int,
+                 use_bias: bool = True,
+                 kernel_regularizer=None,
+                 bias_regularizer=None,
+                 activity_regularizer=None,
+                 kernel_constraint=None,
+                 bias_constraint=None,
+                 kernel_initializer='glorot_uniform',
+                 bias_initializer='zeros',
+                 **kwargs):
+        """Initialize layer.
+
+        Args:
+            units (int): Units for the linear trafo of each head.
+            num_heads (int): Number of heads.
+            use_bias (bool): Use bias. Default is True.
+            kernel_regularizer: Kernel regularization. Default is None.
+            bias_regularizer: Bias regularization. Default is None.
+            activity_regularizer: Activity regularization of the fused projection. Default is None.
+            kernel_constraint: Kernel constrains. Default is None.
+            bias_constraint: Bias constrains. Default is None.
+            kernel_initializer: Initializer for kernels. Default is 'glorot_uniform'.
+            bias_initializer: Initializer for bias. Default is 'zeros'.
+        """
+        super(DenseHeads, self).__init__(**kwargs)
+        self.units = int(units)
+        self.num_heads = int(num_heads)
+        self.use_bias = use_bias
+        self.lay_dense = Dense(
+            self.units * self.num_heads, activation="linear", use_bias=use_bias,
+            kernel_regularizer=kernel_regularizer, bias_regularizer=bias_regularizer,
+            activity_regularizer=activity_regularizer, kernel_constraint=kernel_constraint,
+            bias_constraint=bias_constraint, kernel_initializer=kernel_initializer, bias_initializer=bias_initializer)
+
+    def build(self, input_shape):
+        """Build layer."""
+        self.lay_dense.build(input_shape)
+        self.built = True
+
+    def compute_output_shape(self, input_shape):
+        """Compute output shape."""
+        return [tuple(input_shape[:-1]) + (self.units,) for _ in range(self.num_heads)]
+
+    def call(self, inputs, **kwargs):
+        """Forward pass.
+
+        Args:
+            inputs (Tensor): Node embeddings of shape ([N], F)
+
+        Returns:
+            list: List of projected nodes of shape ([N], units) for each head.
+        """
+        x = self.lay_dense(inputs, **kwargs)
+        return ops.split(x, self.num_heads, axis=-1)
+
+    def get_config(self):
+        """Update layer config."""
+        config = super(DenseHeads, self).get_config()
+        config.update({"units": self.units, "num_heads": self.num_heads, "use_bias": self.use_bias})
+        conf_sub = self.lay_dense.get_config()
+        for x in ["kernel_regularizer", "activity_regularizer", "bias_regularizer", "kernel_constraint",
+                  "bias_constraint", "kernel_initializer", "bias_initializer"]:
+            if x in conf_sub:
+                config.update({x: conf_sub[x]})
+        return config
+
+
 class AttentionHeadGAT(Layer):  # noqa
     r"""Computes the attention head according to `GAT <https://arxiv.org/abs/1710.10903>`__ .
 
@@ -136,6 +259,11 @@ class AttentionHeadGATV2(Layer):  # noqa
     And optionally passed through an activation :math:`h_i = \sigma(\sum_j \alpha_{ij} e_{ij})`.
 
     An edge is defined by index tuple :math:`(i, j)` with the direction of the connection from :math:`j` to :math:`i`.
+
+    With `use_projected_nodes` the linear transformation :math:`W n_j` of the messages is not computed by the layer
+    but passed as additional input. This allows to project the nodes for multiple heads with a single dense layer.
+    With `attention_dtype` , e.g. 'mixed_bfloat16', the per-edge attention logits can be computed in lower precision,
+    while the softmax is computed in the dtype of the layer.
     """
 
     def __init__(self,
@@ -153,6 +281,8 @@ class AttentionHeadGATV2(Layer):  # noqa
                  kernel_initializer='glorot_uniform',
                  bias_initializer='zeros',
                  normalize_softmax: bool = False,
+                 use_projected_nodes: bool = False,
+                 attention_dtype=None,
                  **kwargs):
         """Initialize layer.
 
@@ -170,6 +300,10 @@ class AttentionHeadGATV2(Layer):  # noqa
             bias_constraint: Bias constrains. Default is None.
             kernel_initializer: Initializer for kernels. Default is 'glorot_uniform'.
             bias_initializer: Initializer for bias. Default is 'zeros'.
+            normalize_softmax (bool): Whether to normalize the attention softmax. Default is False.
+            use_projected_nodes (bool): Whether the linear transformed nodes are passed as fourth input instead of
+                being computed by the layer. Default is False.
+            attention_dtype: Dtype or policy of the dense layers for the attention logits. Default is None.
         """
         super(AttentionHeadGATV2, self).__init__(**kwargs)
         # Changes in keras serialization behaviour for activations in 3.0.2.
@@ -181,15 +315,19 @@ class AttentionHeadGATV2(Layer):  # noqa
         self.has_self_loops = has_self_loops
         self.units = int(units)
         self.normalize_softmax = normalize_softmax
+        self.use_projected_nodes = use_projected_nodes
+        self.attention_dtype = attention_dtype
         self.use_bias = use_bias
         kernel_args = {"kernel_regularizer": kernel_regularizer,
                        "activity_regularizer": activity_regularizer, "bias_regularizer": bias_regularizer,
                        "kernel_constraint": kernel_constraint, "bias_constraint": bias_constraint,
                        "kernel_initializer": kernel_initializer, "bias_initializer": bias_initializer}
 
-        self.lay_linear_trafo = Dense(units, activation="linear", use_bias=use_bias, **kernel_args)
-        self.lay_alpha_activation = Dense(units, activation=activation, use_bias=use_bias, **kernel_args)
-        self.lay_alpha = Dense(1, activation="linear", use_bias=False, **kernel_args)
+        if not self.use_projected_nodes:
+            self.lay_linear_trafo = Dense(units, activation="linear", use_bias=use_bias, **kernel_args)
+        alpha_args = {"dtype": attention_dtype} if attention_dtype is not None else {}
+        self.lay_alpha_activation = Dense(units, activation=activation, use_bias=use_bias, **kernel_args, **alpha_args)
+        self.lay_alpha = Dense(1, activation="linear", use_bias=False, **kernel_args, **alpha_args)
         self.lay_gather_in = GatherNodesIngoing()
         self.lay_gather_out = GatherNodesOutgoing()
         self.lay_concat = Concatenate(axis=-1)
@@ -205,18 +343,22 @@ class AttentionHeadGATV2(Layer):  # noqa
         """Forward pass.
 
         Args:
-            inputs (list): of [node, edges, edge_indices]
+            inputs (list): of [node, edges, edge_indices] or [node, edges, edge_indices, projected_nodes]
 
                 - nodes (Tensor): Node embeddings of shape ([N], F)
                 - edges (Tensor): Edge or message embeddings of shape ([M], F)
                 - edge_indices (Tensor): Edge indices referring to nodes of shape (2, [M])
+                - projected_nodes (Tensor): Linear transformed nodes of shape ([N], units), if `use_projected_nodes` .
 
         Returns:
             Tensor: Embedding tensor of pooled edge attentions for each node.
         """
-        node, edge, edge_index = inputs
+        if self.use_projected_nodes:
+            node, edge, edge_index, w_n = inputs
+        else:
+            node, edge, edge_index = inputs
+            w_n = self.lay_linear_trafo(node, **kwargs)
 
-        w_n = self.lay_linear_trafo(node, **kwargs)
         n_in = self.lay_gather_in([node, edge_index], **kwargs)
         n_out = self.lay_gather_out([node, edge_index], **kwargs)
         wn_out = self.lay_gather_out([w_n, edge_index], **kwargs)
@@ -226,6 +368,9 @@ class AttentionHeadGATV2(Layer):  # noqa
             e_ij = self.lay_concat([n_in, n_out], **kwargs)
         a_ij = self.lay_alpha_activation(e_ij, **kwargs)
         a_ij = self.lay_alpha(a_ij, **kwargs)
+        if self.attention_dtype is not None:
+            # Softmax and its sum over edges in precision of the messages.
+            a_ij = ops.cast(a_ij, dtype=wn_out.dtype)
         h_i = self.lay_pool_attention([node, wn_out, a_ij, edge_index], **kwargs)
 
         if self.use_final_activation:
@@ -238,6 +383,8 @@ class AttentionHeadGATV2(Layer):  # noqa
         config.update({"use_edge_features": self.use_edge_features, "use_bias": self.use_bias,
                        "units": self.units, "has_self_loops": self.has_self_loops,
                        "normalize_softmax": self.normalize_softmax,
+                       "use_projected_nodes": self.use_projected_nodes,
+                       "attention_dtype": self.attention_dtype,
                        "use_final_activation": self.use_final_activation})
         conf_sub = self.lay_alpha_activation.get_config()
         for x in ["kernel_regularizer", "activity_regularizer", "bias_regularizer", "kernel_constraint",
@@ -346,17 +493,20 @@ class MultiHeadGATV2Layer(Layer):  # noqa
         # these tensors for each attention head.
         a_ijs = []
         h_is = []
+
+        # The edge input to the attention is the same for all heads and is gathered only once.
+        n_in = self.lay_gather_in([node, edge_index], **kwargs)
+        n_out = self.lay_gather_out([node, edge_index], **kwargs)
+        if self.use_edge_features:
+            e_ij = self.lay_concat([n_in, n_out, edge], **kwargs)
+        else:
+            e_ij = self.lay_concat([n_in, n_out], **kwargs)
+
         for k, (lay_linear, lay_alpha_activation, lay_alpha) in enumerate(self.head_layers):
 
             # Copied from the original class
             w_n = lay_linear(node, **kwargs)
-            n_in = self.lay_gather_in([node, edge_index], **kwargs)
-            n_out = self.lay_gather_out([node, edge_index], **kwargs)
             wn_out = self.lay_gather_out([w_n, edge_index], **kwargs)
-            if self.use_edge_features:
-                e_ij = self.lay_concat([n_in, n_out, edge], **kwargs)
-            else:
-                e_ij = self.lay_concat([n_in, n_out], **kwargs)
 
             # a_ij: ([batch], [M], 1)
             a_ij = lay_alpha_activation(e_ij, **kwargs)
@@ -27,7 +27,9 @@ class _CastBatchedDisjointBase(Layer):
         Args:
             reverse_indices (bool): Whether to reverse index order. Default is False.
             dtype_batch (str): Dtype for batch ID tensor. Default is 'int64'.
-            dtype_index (str): Dtype for index tensor. Default is None.
+            dtype_index (str): Dtype for index tensor. Default is None. With 'int32' the disjoint indices need half
+                the memory in gather and scatter operations, which is safe as long as the total number of nodes
+                in a batch is below 2**31. Note that scatter operations of the torch backend require 'int64'.
             padded_disjoint (bool): Whether to keep padding in disjoint representation. Default is False.
             uses_mask (bool): Whether the padding is marked by a boolean mask or by a length tensor, counting the
                 non-padded nodes from index 0. Default is False.
@@ -544,7 +546,9 @@ class _CastRaggedToDisjointBase(Layer):
         Args:
             reverse_indices (bool): Whether to reverse index order. Default is False.
             dtype_batch (str): Dtype for batch ID tensor. Default is 'int64'.
-            dtype_index (str): Dtype for index tensor. Default is None.
+            dtype_index (str): Dtype for index tensor. Default is None. With 'int32' the disjoint indices need half
+                the memory in gather and scatter operations, which is safe as long as the total number of nodes
+                in a batch is below 2**31. Note that scatter operations of the torch backend require 'int64'.
         """
         super(_CastRaggedToDisjointBase, self).__init__(**kwargs)
         self.reverse_indices = reverse_indices
@@ -763,7 +763,7 @@ class BesselBasisLayer(Layer):
         # Layer variables
         self.num_radial = num_radial
         self.cutoff = cutoff
-        self.inv_cutoff = ops.convert_to_tensor(1 / cutoff, dtype=self.dtype)
+        self.inv_cutoff = ops.convert_to_tensor(1 / cutoff, dtype=self.compute_dtype)
         self.envelope_exponent = envelope_exponent
         self.envelope_type = str(envelope_type)
 
@@ -1145,12 +1145,19 @@ class SphericalBasisLayer(Layer):
         self.num_radial = int(num_radial)
         self.num_spherical = num_spherical
         self.cutoff = cutoff
-        self.inv_cutoff = ops.convert_to_tensor(1.0 / cutoff, dtype=self.dtype)
+        self.inv_cutoff = ops.convert_to_tensor(1.0 / cutoff, dtype=self.compute_dtype)
         self.envelope_exponent = envelope_exponent
 
         # retrieve formulas
         self.bessel_n_zeros = spherical_bessel_jn_zeros(num_spherical, num_radial)
         self.bessel_norm = spherical_bessel_jn_normalization_prefactor(num_spherical, num_radial)
+        # Constant zeros and prefactors per order n, to evaluate all radial components of one order at once.
+        self._bessel_n_zeros_tensor = [ops.convert_to_tensor(
+            [self.bessel_n_zeros[n][k] for k in range(self.num_radial)], dtype=self.compute_dtype)
+            for n in range(self.num_spherical)]
+        self._bessel_norm_tensor = [ops.convert_to_tensor(
+            [self.bessel_norm[n, k] for k in range(self.num_radial)], dtype=self.compute_dtype)
+            for n in range(self.num_spherical)]
 
         self.layer_gather_out = GatherNodesOutgoing()
         # non-explicit spherical bessel function seems faster.
@@ -1184,10 +1191,11 @@ class SphericalBasisLayer(Layer):
         d_scaled = d[:, 0] * self.inv_cutoff
         rbf = []
         for n in range(self.num_spherical):
-            for k in range(self.num_radial):
-                # rbf += [self.bessel_norm[n, k] * self.layers_spherical_jn[n](d_scaled * self.bessel_n_zeros[n][k])]
-                rbf += [self.bessel_norm[n, k] * tf_spherical_bessel_jn(d_scaled * self.bessel_n_zeros[n][k], n)]
-        rbf = ops.stack(rbf, axis=1)
+            # rbf += [self.bessel_norm[n, k] * self.layers_spherical_jn[n](d_scaled * self.bessel_n_zeros[n][k])]
+            # All radial components of order n in one call with shape ([M], num_radial).
+            rbf += [self._bessel_norm_tensor[n] * tf_spherical_bessel_jn(
+                ops.expand_dims(d_scaled, axis=-1) * self._bessel_n_zeros_tensor[n], n)]
+        rbf = ops.concatenate(rbf, axis=1)
 
         d_cutoff = self.envelope(d_scaled)
         rbf_env = d_cutoff[:, None] * rbf
@@ -159,10 +159,10 @@ class SphericalBesselJnExplicit(Layer):
                 self._powers_cos.append(pow_cos)
 
         if self.fused:
-            self._pre_factor_sin = ops.convert_to_tensor(self._pre_factor_sin, dtype=self.dtype)
-            self._pre_factor_cos = ops.convert_to_tensor(self._pre_factor_cos, dtype=self.dtype)
-            self._powers_sin = ops.convert_to_tensor(self._powers_sin, dtype=self.dtype)
-            self._powers_cos = ops.convert_to_tensor(self._powers_cos, dtype=self.dtype)
+            self._pre_factor_sin = ops.convert_to_tensor(self._pre_factor_sin, dtype=self.compute_dtype)
+            self._pre_factor_cos = ops.convert_to_tensor(self._pre_factor_cos, dtype=self.compute_dtype)
+            self._powers_sin = ops.convert_to_tensor(self._powers_sin, dtype=self.compute_dtype)
+            self._powers_cos = ops.convert_to_tensor(self._powers_cos, dtype=self.compute_dtype)
 
     def build(self, input_shape):
         """Build layer."""
@@ -292,8 +292,8 @@ class LegendrePolynomialPn(Layer):
         self._powers = [float(n - 2 * k) for k in range(0, int(np.floor(n / 2)) + 1)]
         if self.fused:
             # Or maybe also as weight.
-            self._powers = ops.convert_to_tensor(self._powers, dtype=self.dtype)
-            self._pre_factors = ops.convert_to_tensor(self._pre_factors, dtype=self.dtype)
+            self._powers = ops.convert_to_tensor(self._powers, dtype=self.compute_dtype)
+            self._pre_factors = ops.convert_to_tensor(self._pre_factors, dtype=self.compute_dtype)
 
     def build(self, input_shape):
         """Build layer."""
@@ -387,8 +387,8 @@ class SphericalHarmonicsYl(Layer):
         self._scale = float(np.sqrt((2 * l + 1) / 4 / np.pi))
         if self.fused:
             # Or maybe also as weight.
-            self._powers = ops.convert_to_tensor(self._powers, dtype=self.dtype)
-            self._pre_factors = ops.convert_to_tensor(self._pre_factors, dtype=self.dtype)
+            self._powers = ops.convert_to_tensor(self._powers, dtype=self.compute_dtype)
+            self._pre_factors = ops.convert_to_tensor(self._pre_factors, dtype=self.compute_dtype)
 
     def build(self, input_shape):
         """Build layer."""
@@ -500,8 +500,8 @@ class AssociatedLegendrePolynomialPlm(Layer):
 
         if self.fused:
             # Or maybe also as weight.
-            self._powers = ops.convert_to_tensor(self._powers, dtype=self.dtype)
-            self._pre_factors = ops.convert_to_tensor(self._pre_factors, dtype=self.dtype)
+            self._powers = ops.convert_to_tensor(self._powers, dtype=self.compute_dtype)
+            self._pre_factors = ops.convert_to_tensor(self._pre_factors, dtype=self.compute_dtype)
 
     def build(self, input_shape):
         """Build layer."""
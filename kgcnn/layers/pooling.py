@@ -8,7 +8,11 @@ from kgcnn.layers.aggr import Aggregate
 
 
 class PoolingNodes(Layer):
-    r"""Main layer to pool node or edge attributes. Uses :obj:`Aggregate` layer."""
+    r"""Main layer to pool node or edge attributes. Uses :obj:`Aggregate` layer.
+
+    Since batch IDs of disjoint graphs are sorted, a segment reduction like 'segment_mean' can be used instead
+    of the corresponding scatter reduction like 'scatter_mean' .
+    """
 
     def __init__(self, pooling_method="scatter_sum", **kwargs):
         """Initialize layer.
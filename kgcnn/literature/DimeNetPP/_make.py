@@ -88,6 +88,15 @@ def make_model(inputs: list = None,
     """Make `DimeNetPP <https://arxiv.org/abs/2011.14115>`_ graph network via functional API.
     Default parameters can be found in :obj:`kgcnn.literature.DimeNetPP.model_default`.
 
+    .. note::
+
+        The geometric basis and interaction blocks consist of many small element-wise and gather operations, which
+        benefit from XLA fusion. With padded input and `cast_disjoint_kwargs={"padded_disjoint": True}` all tensor
+        shapes are static and the model supports XLA, so that `model.compile(jit_compile="auto")` compiles it with XLA
+        for tensorflow and jax backend. The basis layers also compute in the dtype of a mixed precision policy, e.g.
+        `keras.mixed_precision.set_global_policy("mixed_bfloat16")` before making the model. The final output should
+        then be kept in float32 via `output_mlp={..., "dtype": "float32"}` .
+
     **Model inputs**:
     Model uses the list template of inputs and standard output template.
     The supported inputs are  :obj:`[nodes, coordinates, edge_indices, angle_indices...]`
@@ -1,5 +1,5 @@
-from keras.layers import Dense, Concatenate, Average, Activation
-from kgcnn.layers.attention import AttentionHeadGAT
+from keras.layers import Dense, Concatenate
+from kgcnn.layers.attention import AttentionHeadGAT, AverageActivation
 from kgcnn.layers.mlp import MLP, GraphMLP
 from kgcnn.layers.modules import Embedding
 from kgcnn.layers.pooling import PoolingNodes
@@ -23,7 +23,8 @@ def model_disjoint(inputs,
     # Embedding, if no feature dimension
     if use_node_embedding:
         n = Embedding(**input_node_embedding)(n)
-    if use_edge_embedding:
+    # Edges are only used for attention with `use_edge_features`, otherwise the embedding can be skipped.
+    if use_edge_embedding and attention_args.get("use_edge_features", False):
         ed = Embedding(**input_edge_embedding)(ed)
 
     # Model
@@ -33,8 +34,7 @@ def model_disjoint(inputs,
         if attention_heads_concat:
             nk = Concatenate(axis=-1)(heads)
         else:
-            nk = Average()(heads)
-            nk = Activation(activation=attention_args["activation"])(nk)
+            nk = AverageActivation(activation=attention_args["activation"])(heads)
     n = nk
 
     # Output embedding choice
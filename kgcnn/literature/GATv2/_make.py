@@ -47,7 +47,7 @@ model_default = {
     },
     "pooling_nodes_args": {"pooling_method": "scatter_mean"},
     'depth': 3, 'attention_heads_num': 5,
-    'attention_heads_concat': False, 'verbose': 10,
+    'attention_heads_concat': False, "use_fused_heads": False, 'verbose': 10,
     'output_embedding': 'graph',
     "output_to_tensor": None,  # deprecated
     "output_tensor_type": "padded",
@@ -69,6 +69,7 @@ def make_model(inputs: list = None,
                depth: int = None,
                attention_heads_num: int = None,
                attention_heads_concat: bool = None,
+               use_fused_heads: bool = None,
                name: str = None,
                verbose: int = None,
                output_embedding: str = None,
@@ -80,6 +81,13 @@ def make_model(inputs: list = None,
     r"""Make `GATv2 <https://arxiv.org/abs/2105.14491>`__ graph network via functional API.
     Default parameters can be found in :obj:`kgcnn.literature.GATv2.model_default`.
 
+    .. note::
+
+        The attention heads are many small gather, scatter-softmax and dense operations per layer, for which python
+        dispatch can dominate for small graphs. With `cast_disjoint_kwargs={"padded_disjoint": True}` and a loader
+        that pads to a fixed number of nodes and edges, all shapes are static and the whole train or predict step is
+        traced once by `model.compile(jit_compile=True)` , e.g. with XLA for tensorflow and jax backend.
+
     **Model inputs**:
     Model uses the list template of inputs and standard output template.
     The supported inputs are  :obj:`[nodes, edges, edge_indices, ...]`
@@ -104,6 +112,9 @@ def make_model(inputs: list = None,
         depth (int): Number of graph embedding units or depth of the network.
         attention_heads_num (int): Number of attention heads to use.
         attention_heads_concat (bool): Whether to concat attention heads, or simply average heads.
+        use_fused_heads (bool): Whether to compute the linear transformation of the nodes for all heads with a single
+            :obj:`DenseHeads` layer. Faster but not weight-compatible with models using one dense per head.
+            Activity regularization then applies to the fused projection. Default is False.
         name (str): Name of the model.
         verbose (int): Level of print output.
         output_embedding (str): Main embedding task for graph network. Either "node", "edge" or "graph".
@@ -137,6 +148,7 @@ def make_model(inputs: list = None,
         input_node_embedding=input_node_embedding, input_edge_embedding=input_edge_embedding,
         attention_args=attention_args, pooling_nodes_args=pooling_nodes_args, depth=depth,
         attention_heads_num=attention_heads_num, attention_heads_concat=attention_heads_concat,
+        use_fused_heads=use_fused_heads,
         output_embedding=output_embedding, output_mlp=output_mlp
     )
 
@@ -1,5 +1,5 @@
-from keras.layers import Dense, Concatenate, Average, Activation
-from kgcnn.layers.attention import AttentionHeadGATV2
+from keras.layers import Dense, Concatenate
+from kgcnn.layers.attention import AttentionHeadGATV2, AverageActivation, DenseHeads
 from kgcnn.layers.mlp import MLP, GraphMLP
 from kgcnn.layers.modules import Embedding
 from kgcnn.layers.pooling import PoolingNodes
@@ -15,6 +15,7 @@ def model_disjoint(inputs,
                    depth: int = None,
                    attention_heads_num: int = None,
                    attention_heads_concat: bool = None,
+                   use_fused_heads: bool = None,
                    output_embedding: str = None,
                    output_mlp: dict = None,
                    ):
@@ -23,18 +24,29 @@ def model_disjoint(inputs,
     # Embedding, if no feature dimension
     if use_node_embedding:
         n = Embedding(**input_node_embedding)(n)
-    if use_edge_embedding:
+    # Edges are only used for attention with `use_edge_features`, otherwise the embedding can be skipped.
+    if use_edge_embedding and attention_args.get("use_edge_features", False):
         ed = Embedding(**input_edge_embedding)(ed)
 
     # Model
     nk = Dense(units=attention_args["units"], activation="linear")(n)
+    if use_fused_heads:
+        # The linear transformation of the nodes is done for all heads at once and split afterwards.
+        projection_args = {key: value for key, value in attention_args.items() if key in [
+            "units", "use_bias", "kernel_regularizer", "bias_regularizer", "activity_regularizer",
+            "kernel_constraint", "bias_constraint", "kernel_initializer", "bias_initializer"]}
+        head_args = {**attention_args, "use_projected_nodes": True}
     for i in range(0, depth):
-        heads = [AttentionHeadGATV2(**attention_args)([nk, ed, disjoint_indices]) for _ in range(attention_heads_num)]
+        if use_fused_heads:
+            wn_heads = DenseHeads(num_heads=attention_heads_num, **projection_args)(nk)
+            heads = [AttentionHeadGATV2(**head_args)([nk, ed, disjoint_indices, wn_k]) for wn_k in wn_heads]
+        else:
+            heads = [AttentionHeadGATV2(**attention_args)([nk, ed, disjoint_indices]) for _ in
+                     range(attention_heads_num)]
         if attention_heads_concat:
             nk = Concatenate(axis=-1)(heads)
         else:
-            nk = Average()(heads)
-            nk = Activation(activation=attention_args["activation"])(nk)
+            nk = AverageActivation(activation=attention_args["activation"])(heads)
     n = nk
 
     # Output embedding choice
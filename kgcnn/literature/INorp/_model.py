@@ -58,9 +58,10 @@ def model_disjoint(
             # output
             n = Dense(set2set_args["channels"], activation="linear")(n)
             out = PoolingSet2SetEncoder(**set2set_args)([count_nodes, n, batch_id_node])
+            out = Flatten()(out)  # Set2Set output is (batch, 1, 2*channels).
         else:
+            # Already rank-2 (batch, features), no flatten required.
             out = PoolingNodes(**pooling_args)([count_nodes, n, batch_id_node])
-        out = Flatten()(out)
         out = MLP(**output_mlp)(out)
     elif output_embedding == 'node':
         out = GraphMLP(**output_mlp)([n, batch_id_node, count_nodes])
@@ -46,7 +46,7 @@ class ScaledMeanAbsoluteError(ks.metrics.MeanAbsoluteError):
 
     def set_scale(self, scale):
         """Set the scale from numpy array. Usually used with broadcasting."""
-        self.scale.assign(ops.cast(scale, dtype=scale.dtype))
+        self.scale.assign(ops.cast(scale, dtype=self.scale.dtype))
 
 
 @ks.saving.register_keras_serializable(package='kgcnn', name='ScaledRootMeanSquaredError')
@@ -88,7 +88,7 @@ class ScaledRootMeanSquaredError(ks.metrics.RootMeanSquaredError):
 
     def set_scale(self, scale):
         """Set the scale from numpy array. Usually used with broadcasting."""
-        self.scale.assign(ops.cast(scale, dtype=scale.dtype))
+        self.scale.assign(ops.cast(scale, dtype=self.scale.dtype))
 
 
 @ks.saving.register_keras_serializable(package='kgcnn', name='ScaledMeanAbsoluteError')
@@ -155,7 +155,7 @@ class ScaledForceMeanAbsoluteError(ks.metrics.MeanMetricWrapper):
         if scaling_shape[-1] == 1 and self.squeeze_states and len(scaling_shape) > 1:
             scale = np.squeeze(scale, axis=-1)
         scale = np.expand_dims(np.expand_dims(scale, axis=1), axis=2)
-        self.scale.assign(ops.cast(scale, dtype=scale.dtype))
+        self.scale.assign(ops.cast(scale, dtype=self.scale.dtype))
 
 
 @ks.saving.register_keras_serializable(package='kgcnn', name='BinaryAccuracyNoNaN')
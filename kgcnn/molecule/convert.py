@@ -1,9 +1,11 @@
 import os
 import logging
+import sqlite3
+from contextlib import closing
 from typing import Callable
 from kgcnn.molecule.io import read_mol_list_from_sdf_file, read_xyz_file, read_smiles_file, write_mol_block_list_to_sdf, \
     parse_list_to_xyz_str
-from concurrent.futures import ThreadPoolExecutor  # , ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from kgcnn.molecule.external.ballloon import BalloonInterface
 from typing import Union
 
@@ -20,15 +22,26 @@ try:
     from rdkit import RDLogger
 
     def rdkit_smile_to_mol(smile: str, sanitize: bool = True, add_hydrogen: bool = True, make_conformers: bool = True,
-                           optimize_conformer: bool = True, random_seed: int = 42, stop_logging: bool = False):
+                           optimize_conformer: bool = True, random_seed: int = 42, stop_logging: bool = False,
+                           num_threads: int = 1, fast_sanitize: bool = False):
         # Order of parameters is important here.
+        # Setting `num_threads=0` lets RDKit embed on all available cores.
+        # With `fast_sanitize` chirality cleanup, which scales quadratically with chain length, is skipped in
+        # sanitization and stereochemistry is assigned explicitly afterwards.
         if stop_logging:
             RDLogger.DisableLog('rdApp.*')
 
         try:
-            m = rdkit.Chem.MolFromSmiles(smile)
-            if sanitize:
-                rdkit.Chem.SanitizeMol(m)
+            if fast_sanitize:
+                m = rdkit.Chem.MolFromSmiles(smile, sanitize=False)
+                if sanitize:
+                    rdkit.Chem.SanitizeMol(m, sanitizeOps=(
+                        rdkit.Chem.SanitizeFlags.SANITIZE_ALL ^ rdkit.Chem.SanitizeFlags.SANITIZE_CLEANUPCHIRALITY))
+                    rdkit.Chem.AssignStereochemistry(m, cleanIt=True, force=True)
+            else:
+                m = rdkit.Chem.MolFromSmiles(smile)
+                if sanitize:
+                    rdkit.Chem.SanitizeMol(m)
 
             m = rdkit.Chem.AddHs(m)
             m.SetProp("_Name", smile.strip())
@@ -37,10 +50,16 @@ try:
                 params = rdkit.Chem.AllChem.ETKDGv3()
                 params.useSmallRingTorsions = True
                 params.randomSeed = random_seed
+                params.numThreads = num_threads
                 # params.useRandomCoords = True
-                success = rdkit.Chem.AllChem.EmbedMolecule(m, params=params)
+                # Threaded embedding in RDKit that releases the GIL.
+                conf_ids = rdkit.Chem.AllChem.EmbedMultipleConfs(m, numConfs=1, params=params)
                 if optimize_conformer:
-                    rdkit.Chem.AllChem.MMFFOptimizeMolecule(m)
+                    if len(conf_ids) == 0:
+                        # Embedding failed, which would otherwise raise 'Bad Conformer Id' in the optimizer.
+                        raise ValueError("Can not embed conformer for '%s'." % smile)
+                    # Optimize all embedded conformers in one call, also threaded and without the GIL.
+                    rdkit.Chem.AllChem.MMFFOptimizeMoleculeConfs(m, numThreads=num_threads)
                     rdkit.Chem.AssignAtomChiralTagsFromStructure(m)
                     rdkit.Chem.AssignStereochemistryFrom3D(m)
             if not add_hydrogen:
@@ -204,9 +223,10 @@ class MolConverter:
             raise ValueError("Conversion was not successful")
 
     @staticmethod
-    def _convert_parallel(conversion_method: Callable, smile_list: list, num_workers: int, *args):
-        if num_workers is None:
-            num_workers = os.cpu_count()
+    def _convert_parallel(conversion_method: Callable, smile_list: list, num_workers: int, *args,
+                          use_multiprocessing: bool = False, executor=None):
+        # An `executor` can be passed to reuse the same pool of workers for multiple batches.
+        num_workers = MolConverter._resolve_num_workers(num_workers)
 
         if rdkit_smile_to_mol is None and openbabel_smile_to_mol is None:
             raise ModuleNotFoundError("Can not convert smiles. Missing `RDkit` or `OpenBabel` packages.")
@@ -214,22 +234,53 @@ class MolConverter:
         if num_workers == 1:
             mol_list = [conversion_method(x, *args) for x in smile_list]
             return mol_list
+
+        if executor is None:
+            with MolConverter._make_executor(num_workers, use_multiprocessing) as executor:
+                return MolConverter._convert_parallel(
+                    conversion_method, smile_list, num_workers, *args, use_multiprocessing=use_multiprocessing,
+                    executor=executor)
+
+        arg_list = [(x,) + args for x in smile_list]
+        if len(arg_list) == 0:
+            return []
+        if use_multiprocessing:
+            # Embedding and optimization release the GIL, but parsing and the remaining steps of the conversion do
+            # not. Processes also run those in parallel, at the cost of pickling the molecules.
+            chunk_size = max(int(len(smile_list) / (4 * num_workers)), 1)
+            result = executor.map(conversion_method, *zip(*arg_list), chunksize=chunk_size)
         else:
-            arg_list = [(x,) + args for x in smile_list]
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                result = executor.map(conversion_method, *zip(*arg_list))
-            mol_list = list(result)
-            return mol_list
+            result = executor.map(conversion_method, *zip(*arg_list))
+        mol_list = list(result)
+        return mol_list
+
+    @staticmethod
+    def _resolve_num_workers(num_workers: Union[int, None]) -> int:
+        # Like joblib, `None` or -1 means all cores and -2 all cores but one.
+        if num_workers is None:
+            return os.cpu_count()
+        if num_workers < 0:
+            return max(os.cpu_count() + 1 + num_workers, 1)
+        return max(num_workers, 1)
+
+    @staticmethod
+    def _make_executor(num_workers: int, use_multiprocessing: bool = False):
+        if use_multiprocessing:
+            return ProcessPoolExecutor(max_workers=num_workers)
+        return ThreadPoolExecutor(max_workers=num_workers)
 
     @staticmethod
     def _single_smile_to_mol(smile: str,
                              sanitize: bool = True,
                              add_hydrogen: bool = True,
                              make_conformers: bool = True,
-                             optimize_conformer: bool = True):
+                             optimize_conformer: bool = True,
+                             num_threads: int = 1,
+                             fast_sanitize: bool = False):
         if rdkit_smile_to_mol is not None:
             mol = rdkit_smile_to_mol(smile=smile, sanitize=sanitize, add_hydrogen=add_hydrogen,
-                                     make_conformers=make_conformers, optimize_conformer=optimize_conformer)
+                                     make_conformers=make_conformers, optimize_conformer=optimize_conformer,
+                                     num_threads=num_threads, fast_sanitize=fast_sanitize)
             if mol is not None:
                 return mol
 
@@ -242,22 +293,67 @@ class MolConverter:
         module_logger.warning("Failed conversion for smile '%s'." % smile)
         return None
 
+    @staticmethod
+    def _smile_cache_key(smile: str, conversion_args: tuple):
+        # Keyed by the exact smiles and not its canonical form, since the atom order of the mol-block follows the
+        # input smiles and per-atom properties of the dataset rely on it.
+        return "%s|%s" % (smile.strip(), ",".join([str(x) for x in conversion_args]))
+
+    @staticmethod
+    def _rename_mol_block(mol_block: str, name: str):
+        if mol_block is None:
+            return None
+        return name.strip() + mol_block[mol_block.find("\n"):] if "\n" in mol_block else mol_block
+
+    @staticmethod
+    def _read_mol_cache(cache_path: str, keys: list, query_size: int = 500):
+        found = {}
+        with closing(sqlite3.connect(cache_path)) as con:
+            con.execute("CREATE TABLE IF NOT EXISTS smiles_mol_blocks (key TEXT PRIMARY KEY, mol_block TEXT)")
+            for i in range(0, len(keys), query_size):
+                batch = keys[i:i + query_size]
+                rows = con.execute(
+                    "SELECT key, mol_block FROM smiles_mol_blocks WHERE key IN (%s)" % ",".join(["?"] * len(batch)), batch)
+                found.update({key: value for key, value in rows})
+        return found
+
+    @staticmethod
+    def _write_mol_cache(cache_path: str, entries: dict):
+        with closing(sqlite3.connect(cache_path)) as con:
+            with con:
+                con.execute("CREATE TABLE IF NOT EXISTS smiles_mol_blocks (key TEXT PRIMARY KEY, mol_block TEXT)")
+                con.executemany("INSERT OR REPLACE INTO smiles_mol_blocks VALUES (?, ?)", list(entries.items()))
+
     def smile_to_mol(self, smiles_path: str, sdf_path: str, external_program: dict = None, num_workers: int = None,
                      sanitize: bool = True, add_hydrogen: bool = True, make_conformers: bool = True,
-                     optimize_conformer: bool = True, logger=None, batch_size: int = 5000):
+                     optimize_conformer: bool = True, logger=None, batch_size: int = 5000,
+                     use_multiprocessing: bool = False, num_threads: int = 1, cache_path: str = None,
+                     fast_sanitize: bool = False):
         """Convert a smiles file to SDF structure file.
 
         Args:
             smiles_path:
             sdf_path:
             external_program:
-            num_workers:
+            num_workers: Number of parallel workers. If None or -1, all cores are used and -2 uses all but one.
             sanitize:
             add_hydrogen:
             make_conformers:
             optimize_conformer:
             logger:
             batch_size:
+            use_multiprocessing (bool): Whether to convert smiles in a pool of processes instead of threads.
+                Threads suffice for conformer embedding and optimization, which release the GIL, whereas processes
+                also parallelize parsing and the remaining steps of the conversion that hold the GIL.
+                Default is False.
+            num_threads (int): Number of threads RDKit uses for embedding conformers of a single molecule.
+                Use `num_threads=0` for all available cores. Default is 1, which avoids oversubscription if
+                `num_workers` is larger than 1.
+            cache_path (str): File path of a sqlite database that stores mol-strings by smiles and
+                conversion settings, e.g. '~/.kgcnn/mol_cache.sqlite'. Smiles found in the cache are not converted
+                again and new conversions are added to the cache. Default is None.
+            fast_sanitize (bool): Whether to skip the chirality cleanup in RDKit sanitization, which can be very slow
+                for long chains, and assign stereochemistry afterwards. Only used for RDKit. Default is False.
 
         Returns:
             list: List of mol-strings.
@@ -265,16 +361,54 @@ class MolConverter:
         # Default via python packages RDkit and OpenBabel.
         if external_program is None:
             smiles_list = read_smiles_file(smiles_path)
-            mol_list = []
-            for i in range(0, len(smiles_list), batch_size):
-                mg = self._convert_parallel(
-                    self._single_smile_to_mol, smiles_list[i:i + batch_size], num_workers,
-                    # All args for _single_smile_to_mol.
-                    sanitize, add_hydrogen, make_conformers, optimize_conformer
-                )
-                mol_list = mol_list + mg
+
+            num_workers = self._resolve_num_workers(num_workers)
+            # The pool of workers is started once and shared by all batches of conversion.
+            executor = self._make_executor(num_workers, use_multiprocessing) if num_workers > 1 else None
+            try:
+                # Every smiles is only converted once and only if not found in cache.
+                conversion_args = (sanitize, add_hydrogen, make_conformers, optimize_conformer, fast_sanitize)
+                keys = [self._smile_cache_key(x, conversion_args) for x in smiles_list]
+                known = {}
+                if cache_path is not None:
+                    cache_path = os.path.expanduser(cache_path)
+                    if os.path.dirname(cache_path):
+                        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                    known = self._read_mol_cache(cache_path, list(set(keys)))
+                unique_smiles = {}
+                for k, x in zip(keys, smiles_list):
+                    if k not in known and k not in unique_smiles:
+                        unique_smiles[k] = x
                 if logger is not None:
-                    logger.info(" ... converted molecules {0} from {1}".format(i + len(mg), len(smiles_list)))
+                    num_unique = len(set(keys))
+                    logger.info("Found %s unique of %s smiles (%.1f%% duplicates)." % (
+                        num_unique, len(smiles_list), 100.0 * (1.0 - num_unique / max(len(smiles_list), 1))))
+                    logger.info("Converting %s unique smiles, %s found in cache." % (len(unique_smiles), len(known)))
+
+                todo_smiles = list(unique_smiles.values())
+                converted = [None] * len(todo_smiles)
+                for i in range(0, len(todo_smiles), batch_size):
+                    mg = self._convert_parallel(
+                        self._single_smile_to_mol, todo_smiles[i:i + batch_size], num_workers,
+                        # All args for _single_smile_to_mol.
+                        sanitize, add_hydrogen, make_conformers, optimize_conformer, num_threads, fast_sanitize,
+                        use_multiprocessing=use_multiprocessing, executor=executor
+                    )
+                    converted[i:i + len(mg)] = mg
+                    if logger is not None:
+                        logger.info(" ... converted molecules %s from %s", i + len(mg), len(todo_smiles))
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            new_entries = dict(zip(unique_smiles.keys(), converted))
+            if cache_path is not None:
+                self._write_mol_cache(cache_path, {k: v for k, v in new_entries.items() if v is not None})
+            known.update(new_entries)
+
+            mol_list = [
+                known[k] if unique_smiles.get(k) is x else self._rename_mol_block(known[k], x)
+                for k, x in zip(keys, smiles_list)
+            ]
             # Check success
             self._check_is_same_length(smiles_list, mol_list)
             if sdf_path is not None:
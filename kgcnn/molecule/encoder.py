@@ -1,4 +1,5 @@
 import logging
+import numpy as np
 
 # Module logger
 logging.basicConfig()
@@ -33,7 +34,38 @@ class OneHotEncoder:
         self.dtype = self._dtype_translate[dtype]
         self.categories = [self.dtype(x) for x in categories]
         self.found_values = []
+        # Set of found values for fast membership tests, the list keeps the order for report.
+        self._found_set = set()
         self.add_unknown = add_unknown
+        # Lookup table of category to position, first occurrence wins.
+        self._lookup = {}
+        for i, x in enumerate(self.categories):
+            self._lookup.setdefault(x, i)
+
+    def _index_of(self, value):
+        r"""Position of the value, cast to dtype, in the categories or `None` if it is unknown."""
+        value = self.dtype(value)
+        try:
+            # Position of the category from the lookup table instead of comparing to all categories.
+            return self._lookup.get(value)
+        except TypeError:
+            # Values that can not be hashed are compared to all categories.
+            for i, x in enumerate(self.categories):
+                if x == value:
+                    return i
+            return None
+
+    def _add_found_value(self, value):
+        r"""Add value to the found values, if it has not been found before."""
+        try:
+            if value in self._found_set:
+                return
+            self._found_set.add(value)
+        except TypeError:
+            # Values that can not be hashed are compared to all found values.
+            if value in self.found_values:
+                return
+        self.found_values += [value]
 
     def __call__(self, value):
         r"""Encode a single feature or value, mapping it to a one-hot python list. E.g. `[0, 0, 1, 0]`
@@ -44,16 +76,39 @@ class OneHotEncoder:
         Returns:
             list: Python List with 1 at value match. E.g. `[0, 0, 1, 0]`
         """
-        encoded_list = [1 if x == self.dtype(value) else 0 for x in self.categories]
+        encoded_list = [0] * len(self.categories)
+        index = self._index_of(value)
+        if index is not None:
+            encoded_list[index] = 1
         if self.add_unknown:
-            if value not in self.categories:
-                encoded_list += [1]
-            else:
-                encoded_list += [0]
-        if value not in self.found_values:
-            self.found_values += [value]
+            encoded_list += [1] if index is None else [0]
+        self._add_found_value(value)
         return encoded_list
 
+    def encode_many(self, values, dtype="float32"):
+        r"""Encode a sequence of values at once, mapping them to a one-hot array of shape `(len(values), dim)`.
+
+        Args:
+            values: List or array of values that can be compared to items in ``self.categories``.
+            dtype: Data type of the returned array. Default is "float32".
+
+        Returns:
+            np.ndarray: One-hot array with one row per value.
+        """
+        num_categories = len(self.categories)
+        num_values = len(values)
+        indices = np.fromiter(
+            (num_categories if i is None else i for i in map(self._index_of, values)), dtype="int64",
+            count=num_values)
+        # Scatter ones into a preallocated matrix. Unknown values only set the last bit if it is requested.
+        encoded = np.zeros((num_values, num_categories + 1), dtype=dtype)
+        encoded[np.arange(num_values), indices] = 1
+        if not self.add_unknown:
+            encoded = encoded[:, :num_categories]
+        for v in values:
+            self._add_found_value(v)
+        return encoded
+
     def get_config(self):
         config = {"categories": self.categories, "add_unknown": self.add_unknown, "dtype": self.dtype_identifier}
         return config
@@ -1,3 +1,4 @@
+import gzip
 import numpy as np
 import rdkit
 import rdkit.Chem
@@ -180,6 +181,13 @@ class MolecularGraphRDKit(MolGraphInterface):
         "fr_alkyl_halide": lambda m: rdkit.Chem.Fragments.fr_alkyl_halide(m),
     }
 
+    # Sanitization steps for mol-blocks that stem from already sanitized RDKit molecules.
+    _partial_sanitize_ops = (
+        rdkit.Chem.SanitizeFlags.SANITIZE_PROPERTIES | rdkit.Chem.SanitizeFlags.SANITIZE_SYMMRINGS |
+        rdkit.Chem.SanitizeFlags.SANITIZE_SETAROMATICITY | rdkit.Chem.SanitizeFlags.SANITIZE_SETCONJUGATION |
+        rdkit.Chem.SanitizeFlags.SANITIZE_SETHYBRIDIZATION
+    )
+
     def __init__(self, mol=None, make_directed: bool = False):
         r"""Initialize :obj:`MolecularGraphRDKit` with mol object.
 
@@ -314,12 +322,16 @@ class MolecularGraphRDKit(MolGraphInterface):
         return self
 
     # noinspection PyPep8Naming
-    def from_mol_block(self, mol_block, sanitize: bool = True, keep_hs: bool = True, strictParsing: bool = True):
+    def from_mol_block(self, mol_block, sanitize: Union[bool, str] = True, keep_hs: bool = True,
+                       strictParsing: bool = True):
         r"""Set mol-instance from a mol-block string.
 
         Args:
             mol_block (str): Mol-block representation of a molecule.
-            sanitize (bool): Whether to sanitize the mol-object.
+            sanitize (bool, str): Whether to sanitize the mol-object. With 'partial' only property cache, rings,
+                aromaticity, conjugation and hybridization are set up, which skips the expensive clean-up and
+                kekulization steps. This is meant for mol-blocks that have been written by RDKit from an already
+                sanitized molecule. Default is True.
             keep_hs (bool): Whether to keep hydrogen.
             strictParsing (bool): If this is false, the parser is more lax about. correctness of the content.
                 Defaults to true.
@@ -330,11 +342,70 @@ class MolecularGraphRDKit(MolGraphInterface):
         if mol_block is None or len(mol_block) == 0:
             module_logger.error("Can not make mol-object for mol string '%s'." % mol_block)
             return self
+        if sanitize == "partial":
+            m = rdkit.Chem.MolFromMolBlock(mol_block, removeHs=False, sanitize=False, strictParsing=strictParsing)
+            if m is not None:
+                try:
+                    if not keep_hs:
+                        m = rdkit.Chem.RemoveHs(m, sanitize=False)
+                    rdkit.Chem.SanitizeMol(m, sanitizeOps=self._partial_sanitize_ops)
+                except Exception:
+                    m = None
+            self.mol = m
+            return self
         self.mol = rdkit.Chem.MolFromMolBlock(mol_block, removeHs=(not keep_hs), sanitize=sanitize,
                                               strictParsing=strictParsing)
 
         return self
 
+    def from_rdkit_mol(self, mol, sanitize: Union[bool, str] = True, keep_hs: bool = True):
+        r"""Set mol-instance from an already parsed, e.g. by a :obj:`SDMolSupplier` , but not sanitized `RDkit`
+        mol-object. Sanitization and hydrogen removal are the same as for :obj:`from_mol_block` .
+        Note that the mol-object is sanitized in place.
+
+        Args:
+            mol (rdkit.Chem.Mol): Mol-object of a molecule.
+            sanitize (bool, str): Whether to sanitize the mol-object or only partially with 'partial'. Default is True.
+            keep_hs (bool): Whether to keep hydrogen.
+
+        Returns:
+            self
+        """
+        if mol is None:
+            module_logger.error("Can not make mol-object for mol '%s'." % mol)
+            self.mol = None
+            return self
+        try:
+            if sanitize == "partial":
+                if not keep_hs:
+                    mol = rdkit.Chem.RemoveHs(mol, sanitize=False)
+                rdkit.Chem.SanitizeMol(mol, sanitizeOps=self._partial_sanitize_ops)
+            else:
+                if sanitize:
+                    rdkit.Chem.SanitizeMol(mol)
+                if not keep_hs:
+                    mol = rdkit.Chem.RemoveHs(mol, sanitize=bool(sanitize))
+        except Exception:
+            mol = None
+        self.mol = mol
+        return self
+
+    @staticmethod
+    def iter_mol_from_sdf_file(filepath: str):
+        r"""Iterate over the molecules of a SDF file with the `RDkit` supplier, without sanitization and keeping
+        hydrogen. Invalid entries yield `None` , so that the index matches the entry in the file.
+        Use with :obj:`from_rdkit_mol` , which skips the parsing of an intermediate mol-block string.
+
+        Args:
+            filepath (str): File path of the SDF file. Files ending with '.gz' are decompressed.
+
+        Returns:
+            Generator of mol-objects.
+        """
+        with (gzip.open(filepath, "rb") if str(filepath).endswith(".gz") else open(filepath, "rb")) as file:
+            for mol in rdkit.Chem.ForwardSDMolSupplier(file, sanitize=False, removeHs=False):
+                yield mol
+
     def from_xyz(self, xyz_string: str, charge: Union[list, int, None] = None):
         """Setting mol-instance from an external xyz-string. Does not add hydrogen or makes conformers.
 
@@ -430,8 +501,9 @@ class MolecularGraphRDKit(MolGraphInterface):
     def node_coordinates(self):
         """Return a list or array of atomic coordinates of the molecule."""
         m = self.mol
-        if len(m.GetConformers()) > 0:
-            return np.array(self.mol.GetConformers()[0].GetPositions())
+        if m.GetNumConformers() > 0:
+            # RDKit already returns a new numpy array.
+            return m.GetConformer().GetPositions()
         return None
 
     @property
@@ -442,23 +514,51 @@ class MolecularGraphRDKit(MolGraphInterface):
     @property
     def node_number(self):
         """Return list of node number which is the atomic number of each atom in the molecule"""
-        return np.array([x.GetAtomicNum() for x in self.mol.GetAtoms()])
+        m = self.mol
+        return np.fromiter((x.GetAtomicNum() for x in m.GetAtoms()), dtype="int64", count=m.GetNumAtoms())
 
     @property
-    def edge_number(self):
-        """Make list of the bond order or type of each bond in the molecule."""
+    def node_symbol_and_number(self):
+        """Return list of atomic symbols and array of atomic numbers of the molecule in a single pass over atoms."""
         m = self.mol
-        bond_idx = []
-        bond_info = []
-        for i, x in enumerate(m.GetBonds()):
-            bond_idx.append([x.GetEndAtomIdx(), x.GetBeginAtomIdx()])
-            bond_info.append(int(x.GetBondType()))
-            if not self._make_directed:
-                # Add a bond with opposite direction but same properties
-                bond_idx.append([x.GetBeginAtomIdx(), x.GetEndAtomIdx()])
-                bond_info.append(int(x.GetBondType()))
-        # Sort directed bonds
-        bond_idx, bond_info = self._sort_bonds(bond_idx, bond_info)
+        info = [(x.GetSymbol(), x.GetAtomicNum()) for x in m.GetAtoms()]
+        symbols = [x[0] for x in info]
+        return symbols, np.fromiter((x[1] for x in info), dtype="int64", count=len(info))
+
+    def _bond_index_arrays(self, with_bond_type: bool = False, bond_values: np.ndarray = None):
+        # Gather bond information in a single pass over the bonds and pack with numpy.
+        # Optional `bond_values` with one row per RDKit bond are duplicated and sorted along with the indices.
+        m = self.mol
+        num_bonds = m.GetNumBonds()
+        # Begin, end and optionally type of all bonds in one traversal.
+        if with_bond_type:
+            info = np.array([(x.GetBeginAtomIdx(), x.GetEndAtomIdx(), int(x.GetBondType())) for x in m.GetBonds()],
+                            dtype="int64").reshape((num_bonds, 3))
+            bond_values = info[:, 2]
+        else:
+            info = np.array([(x.GetBeginAtomIdx(), x.GetEndAtomIdx()) for x in m.GetBonds()],
+                            dtype="int64").reshape((num_bonds, 2))
+        begin, end = info[:, 0], info[:, 1]
+        if num_bonds == 0:
+            bond_idx, _ = self._sort_bonds([])
+            return bond_idx, bond_values
+        if self._make_directed:
+            bond_idx = np.stack([end, begin], axis=-1)
+        else:
+            # Add a bond with opposite direction but same properties
+            bond_idx = np.empty((2 * num_bonds, 2), dtype="int64")
+            bond_idx[0::2, 0], bond_idx[0::2, 1] = end, begin
+            bond_idx[1::2, 0], bond_idx[1::2, 1] = begin, end
+            if bond_values is not None:
+                bond_values = np.repeat(bond_values, 2, axis=0)
+        # Sort directed bonds, same order as stable sort of second and then first index.
+        order = np.lexsort((bond_idx[:, 1], bond_idx[:, 0]))
+        return bond_idx[order], bond_values[order] if bond_values is not None else None
+
+    @property
+    def edge_number(self):
+        """Make array of the bond order or type of each bond in the molecule together with bond indices."""
+        bond_idx, bond_info = self._bond_index_arrays(with_bond_type=True)
         return bond_idx, bond_info
 
     @property
@@ -469,18 +569,52 @@ class MolecularGraphRDKit(MolGraphInterface):
         Returns:
             np.ndarray: Array of bond indices.
         """
-        m = self.mol
-        bond_idx = []
-        for i, x in enumerate(m.GetBonds()):
-            bond_idx.append([x.GetEndAtomIdx(), x.GetBeginAtomIdx()])
-            if not self._make_directed:
-                # Add a bond with opposite direction but same properties
-                bond_idx.append([x.GetBeginAtomIdx(), x.GetEndAtomIdx()])
-        # Sort directed bonds
-        bond_idx, _ = self._sort_bonds(bond_idx)
+        bond_idx, _ = self._bond_index_arrays(with_bond_type=False)
         return bond_idx
 
-    def edge_attributes(self, properties: list, encoder: dict):
+    @staticmethod
+    def _property_columns(items: list, properties: list, encoder: dict, fun_dict: dict, dtype: str = None) -> list:
+        # Property function and encoder are resolved once per property and not for every atom or bond.
+        # If `dtype` is given, each column is returned as a 2D array of shape `(len(items), dim)`.
+        columns = []
+        for k in properties:
+            is_encoded = False
+            if isinstance(k, str):
+                values = [fun_dict[k](x) for x in items]
+                if k in encoder:
+                    if hasattr(encoder[k], "encode_many"):
+                        values = encoder[k].encode_many(values, dtype="int" if dtype is None else dtype)
+                        values = values.tolist() if dtype is None else values
+                        is_encoded = dtype is not None
+                    else:
+                        values = [encoder[k](v) for v in values]
+            else:
+                values = [k(x) for x in items]
+            if dtype is not None and not is_encoded:
+                # Raises ValueError for ragged properties, which is handled by the caller.
+                values = np.asarray(values, dtype=dtype).reshape((len(items), -1))
+            columns.append(values)
+        return columns
+
+    @staticmethod
+    def _concatenate_property_columns(columns: list, num_items: int, dtype: str) -> np.ndarray:
+        if len(columns) == 0:
+            return np.zeros((num_items, 0), dtype=dtype)
+        return np.concatenate(columns, axis=1)
+
+    @staticmethod
+    def _flatten_property_row(row) -> list:
+        attr = []
+        for temp in row:
+            if isinstance(temp, np.ndarray):
+                temp = temp.tolist()
+            if isinstance(temp, (list, tuple)):
+                attr += list(temp)
+            else:
+                attr.append(temp)
+        return attr
+
+    def edge_attributes(self, properties: list, encoder: dict, dtype: str = None, check_properties: bool = True):
         r"""Return edge or bond attributes together with bond indices of the molecule.
         If flag :obj:`_make_directed` is set to true, then only the bonds as defined by `RDkit` are returned,
         otherwise a table of sorted undirected bond indices is returned.
@@ -489,30 +623,35 @@ class MolecularGraphRDKit(MolGraphInterface):
             properties (list): List of identifiers for properties to retrieve from bonds, or
                 a callable object that receives `RDkit` bond class and returns list or value.
             encoder (dict): A dictionary of optional encoders for each string identifier.
+            dtype (str): If not `None`, attributes are returned as a single array of this dtype, which is stacked
+                from the per-property arrays. Falls back to a list if properties have different lengths per bond.
+            check_properties (bool): Whether to verify properties and encoder. Can be set to `False` if they have
+                already been checked once for a whole dataset. Default is True.
 
         Returns:
             tuple: Indices, Attributes.
         """
         m = self.mol
-        edges = self._check_properties_list(properties, sorted(self.bond_fun_dict.keys()), "Bond")
-        encoder = self._check_encoder(encoder, sorted(self.bond_fun_dict.keys()))
+        edges, encoder = properties, encoder
+        if check_properties:
+            edges = self._check_properties_list(properties, sorted(self.bond_fun_dict.keys()), "Bond")
+            encoder = self._check_encoder(encoder, sorted(self.bond_fun_dict.keys()))
+        bonds = list(m.GetBonds())
+        if dtype is not None:
+            try:
+                columns = self._property_columns(bonds, edges, encoder, self.bond_fun_dict, dtype=dtype)
+            except ValueError:
+                columns = None
+            if columns is not None:
+                bond_info = self._concatenate_property_columns(columns, len(bonds), dtype)
+                return self._bond_index_arrays(bond_values=bond_info)
+        columns = self._property_columns(bonds, edges, encoder, self.bond_fun_dict)
 
         # Collect info about bonds
         bond_info = []
         bond_idx = []
-        for i, x in enumerate(m.GetBonds()):
-            attr = []
-            for k in edges:
-                if isinstance(k, str):
-                    temp = encoder[k](self.bond_fun_dict[k](x)) if k in encoder else self.bond_fun_dict[k](x)
-                else:
-                    temp = k(x)
-                if isinstance(temp, np.ndarray):
-                    temp = temp.tolist()
-                if isinstance(temp, (list, tuple)):
-                    attr += list(temp)
-                else:
-                    attr.append(temp)
+        for x, row in zip(bonds, zip(*columns) if len(columns) > 0 else [()] * len(bonds)):
+            attr = self._flatten_property_row(row)
             bond_info.append(attr)
             bond_idx.append([x.GetEndAtomIdx(), x.GetBeginAtomIdx()])
             # Add a bond with opposite direction but same properties
@@ -524,36 +663,39 @@ class MolecularGraphRDKit(MolGraphInterface):
         bond_idx, bond_info = self._sort_bonds(bond_idx, bond_info)
         return bond_idx, bond_info
 
-    def node_attributes(self, properties: list, encoder: dict):
+    def node_attributes(self, properties: list, encoder: dict, dtype: str = None, check_properties: bool = True):
         r"""Return node or atom attributes.
 
         Args:
             properties (list): List of string identifiers for properties to retrieve from atoms, or
                 a callable object that receives `RDkit` atom class and returns list or value.
             encoder (dict): A dictionary of optional encoders for each string identifier.
+            dtype (str): If not `None`, attributes are returned as a single array of this dtype, which is stacked
+                from the per-property arrays. Falls back to a list if properties have different lengths per atom.
+            check_properties (bool): Whether to verify properties and encoder. Can be set to `False` if they have
+                already been checked once for a whole dataset. Default is True.
 
         Returns:
             list: List of atomic properties.
         """
         m = self.mol
-        nodes = self._check_properties_list(properties, sorted(self.atom_fun_dict.keys()), "Atom")
-        encoder = self._check_encoder(encoder, sorted(self.atom_fun_dict.keys()))
+        nodes, encoder = properties, encoder
+        if check_properties:
+            nodes = self._check_properties_list(properties, sorted(self.atom_fun_dict.keys()), "Atom")
+            encoder = self._check_encoder(encoder, sorted(self.atom_fun_dict.keys()))
+        atoms = list(m.GetAtoms())
+        if dtype is not None:
+            try:
+                columns = self._property_columns(atoms, nodes, encoder, self.atom_fun_dict, dtype=dtype)
+                return self._concatenate_property_columns(columns, len(atoms), dtype)
+            except ValueError:
+                pass
+        # Properties are collected column-wise, with a vectorized encoder where available.
+        columns = self._property_columns(atoms, nodes, encoder, self.atom_fun_dict)
+        if len(columns) == 0:
+            return [[] for _ in atoms]
         # Collect info about atoms
-        atom_info = []
-        for i, atm in enumerate(m.GetAtoms()):
-            attr = []
-            for k in nodes:
-                if isinstance(k, str):
-                    temp = encoder[k](self.atom_fun_dict[k](atm)) if k in encoder else self.atom_fun_dict[k](atm)
-                else:
-                    temp = k(atm)
-                if isinstance(temp, np.ndarray):
-                    temp = temp.tolist()
-                if isinstance(temp, (list, tuple)):
-                    attr += list(temp)
-                else:
-                    attr.append(temp)
-            atom_info.append(attr)
+        atom_info = [self._flatten_property_row(row) for row in zip(*columns)]
         return atom_info
 
     def graph_attributes(self, properties: list, encoder: dict):
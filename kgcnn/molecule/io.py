@@ -1,6 +1,14 @@
+import gzip
 import logging
 
 
+def _open_text_file(filepath: str, mode: str = "r"):
+    """Open a text file, which is transparently (de)compressed with gzip for a '.gz' file extension."""
+    if str(filepath).endswith(".gz"):
+        return gzip.open(filepath, mode.replace("+", "") + "t")
+    return open(filepath, mode)
+
+
 def parse_list_to_xyz_str(mol: list, comment: str = "", number_coordinates: int = None):
     """Convert list of atom and coordinates list into xyz-string.
 
@@ -164,12 +172,13 @@ def write_mol_block_list_to_sdf(mol_block_list, filepath):
 
     Args:
         mol_block_list (list): List of mol blocks as string.
-        filepath (str): File path for SDF file.
+        filepath (str): File path for SDF file. A file name ending with '.gz', e.g. 'file.sdf.gz', is written as
+            gzip compressed SDF file.
 
     Returns:
         None.
     """
-    with open(filepath, "w+") as file:
+    with _open_text_file(filepath, "w+") as file:
         for i, mol_block in enumerate(mol_block_list):
             if mol_block is not None:
                 file.write(mol_block)
@@ -189,27 +198,27 @@ def read_mol_list_from_sdf_file(filepath, line_by_line=False):
     """Simple loader to load an SDF file by only splitting.
 
     Args:
-        filepath (str): File path for SDF file.
+        filepath (str): File path for SDF file. Files ending with '.gz' are read as gzip compressed SDF file.
         line_by_line (bool): Whether to read SDF file line by line.
 
     Returns:
         list: List of mol blocks as string.
     """
     mol_list = []
-    with open(filepath, "r") as f:
+    with _open_text_file(filepath, "r") as f:
         if not line_by_line:
             all_sting = f.read()
             mol_list = all_sting.split("$$$$\n")
         else:
-            iter_mol = ""
+            iter_mol = []
             for line in f:
                 if line == "$$$$\n":
-                    mol_list.append(iter_mol)
-                    iter_mol = ""
+                    mol_list.append("".join(iter_mol))
+                    iter_mol = []
                 else:
-                    iter_mol = iter_mol + line
-            if iter_mol != "":
-                mol_list.append(iter_mol)
+                    iter_mol.append(line)
+            if len(iter_mol) > 0:
+                mol_list.append("".join(iter_mol))
     # Check if there was tailing $$$$ with nothing to follow.
     # Split will make empty string at the end, which does not match actual number of mol blocks.
     if len(mol_list[-1]) == 0:
@@ -217,6 +226,28 @@ def read_mol_list_from_sdf_file(filepath, line_by_line=False):
     return mol_list
 
 
+def iter_mol_list_from_sdf_file(filepath):
+    """Lazily iterate over the mol blocks of an SDF file by reading it line by line. Only a single mol block
+    is held in memory at a time, which allows to process SDF files that do not fit into memory.
+
+    Args:
+        filepath (str): File path for SDF file. Files ending with '.gz' are read as gzip compressed SDF file.
+
+    Returns:
+        Generator: Generator of mol blocks as string.
+    """
+    with _open_text_file(filepath, "r") as f:
+        iter_mol = []
+        for line in f:
+            if line == "$$$$\n":
+                yield "".join(iter_mol)
+                iter_mol = []
+            else:
+                iter_mol.append(line)
+        if len(iter_mol) > 0:
+            yield "".join(iter_mol)
+
+
 def read_smiles_file(file_path):
     """Simply python function to read smiles from file.
 
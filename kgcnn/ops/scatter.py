@@ -4,126 +4,101 @@ from kgcnn.backend import any_symbolic_tensors
 from keras.ops.operation import Operation
 
 
-class _ScatterMax(Operation):
+class _ScatterReduce(Operation):
+    r"""Symbolic operation for all scatter reductions. The backend function is picked by name, e.g. 'sum' for
+    :obj:`scatter_reduce_sum` , and is called with fixed keyword arguments."""
+
+    def __init__(self, reduce: str, **kwargs_reduce):
+        super().__init__()
+        self.reduce = reduce
+        self.kwargs_reduce = kwargs_reduce
+        self._backend_fn = getattr(kgcnn_backend, "scatter_reduce_%s" % reduce)
+
     def call(self, indices, values, shape):
-        return kgcnn_backend.scatter_reduce_max(indices, values, shape)
+        return self._backend_fn(indices, values, shape, **self.kwargs_reduce)
 
     def compute_output_spec(self, indices, values, shape):
         return KerasTensor(shape, dtype=values.dtype)
 
 
-def scatter_reduce_max(indices, values, shape):
+def _scatter_reduce(reduce: str, indices, values, shape, **kwargs_reduce):
+    if any_symbolic_tensors((indices, values, shape)):
+        return _ScatterReduce(reduce, **kwargs_reduce).symbolic_call(indices, values, shape)
+    return getattr(kgcnn_backend, "scatter_reduce_%s" % reduce)(indices, values, shape, **kwargs_reduce)
+
+
+def scatter_reduce_max(indices, values, shape, indices_are_sorted: bool = False):
     r"""Scatter values at indices into new tensor of shape.
 
     Args:
         indices (Tensor): 1D Indices of shape `(M, )` .
         values (Tensor): Vales of shape `(M, ...)` .
         shape (tuple): Target shape.
+        indices_are_sorted (bool): Whether indices are sorted, which allows segment operations. Default is False.
 
     Returns:
         Tensor: Scattered values of `shape` .
     """
-    if any_symbolic_tensors((indices, values, shape)):
-        return _ScatterMax().symbolic_call(indices, values, shape)
-    return kgcnn_backend.scatter_reduce_max(indices, values, shape)
+    return _scatter_reduce("max", indices, values, shape, indices_are_sorted=indices_are_sorted)
 
 
-class _ScatterMin(Operation):
-    def call(self, indices, values, shape):
-        return kgcnn_backend.scatter_reduce_min(indices, values, shape)
-
-    def compute_output_spec(self, indices, values, shape):
-        return KerasTensor(shape, dtype=values.dtype)
-
-
-def scatter_reduce_min(indices, values, shape):
+def scatter_reduce_min(indices, values, shape, indices_are_sorted: bool = False):
     r"""Scatter values at indices into new tensor of shape.
 
     Args:
         indices (Tensor): 1D Indices of shape `(M, )` .
         values (Tensor): Vales of shape `(M, ...)` .
         shape (tuple): Target shape.
+        indices_are_sorted (bool): Whether indices are sorted, which allows segment operations. Default is False.
 
     Returns:
         Tensor: Scattered values of `shape` .
     """
-    if any_symbolic_tensors((indices, values, shape)):
-        return _ScatterMin().symbolic_call(indices, values, shape)
-    return kgcnn_backend.scatter_reduce_min(indices, values, shape)
-
-
-class _ScatterMean(Operation):
-    def call(self, indices, values, shape):
-        return kgcnn_backend.scatter_reduce_mean(indices, values, shape)
-
-    def compute_output_spec(self, indices, values, shape):
-        return KerasTensor(shape, dtype=values.dtype)
+    return _scatter_reduce("min", indices, values, shape, indices_are_sorted=indices_are_sorted)
 
 
-def scatter_reduce_mean(indices, values, shape):
+def scatter_reduce_mean(indices, values, shape, indices_are_sorted: bool = False):
     r"""Scatter values at indices into new tensor of shape.
 
     Args:
         indices (Tensor): 1D Indices of shape `(M, )` .
         values (Tensor): Vales of shape `(M, ...)` .
         shape (tuple): Target shape.
+        indices_are_sorted (bool): Whether indices are sorted, which allows segment operations. Default is False.
 
     Returns:
         Tensor: Scattered values of `shape` .
     """
-    if any_symbolic_tensors((indices, values, shape)):
-        return _ScatterMean().symbolic_call(indices, values, shape)
-    return kgcnn_backend.scatter_reduce_mean(indices, values, shape)
-
-
-class _ScatterSum(Operation):
-    def call(self, indices, values, shape):
-        return kgcnn_backend.scatter_reduce_sum(indices, values, shape)
-
-    def compute_output_spec(self, indices, values, shape):
-        return KerasTensor(shape, dtype=values.dtype)
+    return _scatter_reduce("mean", indices, values, shape, indices_are_sorted=indices_are_sorted)
 
 
-def scatter_reduce_sum(indices, values, shape):
+def scatter_reduce_sum(indices, values, shape, indices_are_sorted: bool = False):
     r"""Scatter values at indices into new tensor of shape.
 
     Args:
         indices (Tensor): 1D Indices of shape `(M, )` .
         values (Tensor): Vales of shape `(M, ...)` .
         shape (tuple): Target shape.
+        indices_are_sorted (bool): Whether indices are sorted, which allows segment operations. Default is False.
 
     Returns:
         Tensor: Scattered values of `shape` .
     """
-    if any_symbolic_tensors((indices, values, shape)):
-        return _ScatterSum().symbolic_call(indices, values, shape)
-    return kgcnn_backend.scatter_reduce_sum(indices, values, shape)
-
+    return _scatter_reduce("sum", indices, values, shape, indices_are_sorted=indices_are_sorted)
 
-class _ScatterSoftmax(Operation):
 
-    def __init__(self, normalize: bool = False):
-        super().__init__()
-        self.normalize = normalize
-
-    def call(self, indices, values, shape):
-        return kgcnn_backend.scatter_reduce_softmax(indices, values, shape, normalize=self.normalize)
-
-    def compute_output_spec(self, indices, values, shape):
-        return KerasTensor(shape, dtype=values.dtype)
-
-
-def scatter_reduce_softmax(indices, values, shape, normalize: bool = False):
+def scatter_reduce_softmax(indices, values, shape, normalize: bool = False, indices_are_sorted: bool = False):
     r"""Scatter values at indices to normalize values via softmax.
 
     Args:
         indices (Tensor): 1D Indices of shape `(M, )` .
         values (Tensor): Vales of shape `(M, ...)` .
         shape (tuple): Target shape of scattered tensor.
+        normalize (bool): Whether to subtract the maximum of each group before the exponential. Default is False.
+        indices_are_sorted (bool): Whether indices are sorted, which allows segment operations. Default is False.
 
     Returns:
         Tensor: Values with softmax computed by grouping at indices.
     """
-    if any_symbolic_tensors((indices, values, shape)):
-        return _ScatterSoftmax(normalize=normalize).symbolic_call(indices, values, shape)
-    return kgcnn_backend.scatter_reduce_softmax(indices, values, shape, normalize=normalize)
\ No newline at end of file
+    return _scatter_reduce(
+        "softmax", indices, values, shape, normalize=normalize, indices_are_sorted=indices_are_sorted)
@@ -151,7 +151,9 @@ class HyperParameter:
         This function should handle deserialization of hyperparameter and, if not specified, fill them from default.
         Loss, optimizer are overwritten from hyperparameter, if available. Metrics in hyperparameter are added from
         function arguments. Note that otherwise metrics can not be deserialized, since `metrics` can include nested
-        lists and a dictionary of model output names.
+        lists and a dictionary of model output names. Additional keys like `jit_compile` or `steps_per_execution` are
+        passed to compile as they are. Keras compiles the train and predict step to a graph for each backend, with
+        `jit_compile=True` also with XLA.
 
         .. warning::
 
@@ -47,14 +47,9 @@ def plot_train_test_loss(histories: list, loss_name: str = None,
     if len(data_unit) < len(val_loss_name):
         data_unit = data_unit + [str(data_unit[-1])]*(len(val_loss_name)-len(data_unit))
 
-    train_loss = []
-    for x in loss_name:
-        loss = np.array([np.array(hist[x]) for hist in histories])
-        train_loss.append(loss)
-    val_loss = []
-    for x in val_loss_name:
-        loss = np.array([hist[x] for hist in histories])
-        val_loss.append(loss)
+    # Stack all folds into arrays of shape `(folds, epochs)` for each loss. Single precision is enough for plotting.
+    train_loss = [np.stack([np.asarray(hist[x], dtype="float32") for hist in histories]) for x in loss_name]
+    val_loss = [np.stack([np.asarray(hist[x], dtype="float32") for hist in histories]) for x in val_loss_name]
 
     if figsize is None:
         figsize = [6.4, 4.8]
@@ -62,23 +57,19 @@ def plot_train_test_loss(histories: list, loss_name: str = None,
         dpi = 100.0
     fig = plt.figure(figsize=figsize, dpi=dpi)
     for i, x in enumerate(train_loss):
-        vp = plt.plot(np.arange(len(np.mean(x, axis=0))), np.mean(x, axis=0), alpha=0.85, label=loss_name[i])
-        plt.fill_between(np.arange(len(np.mean(x, axis=0))),
-                         np.mean(x, axis=0) - np.std(x, axis=0),
-                         np.mean(x, axis=0) + np.std(x, axis=0), color=vp[0].get_color(), alpha=0.2
-                         )
+        x_mean, x_std = np.mean(x, axis=0), np.std(x, axis=0)
+        epochs = np.arange(x.shape[1])
+        vp = plt.plot(epochs, x_mean, alpha=0.85, linewidth=0.8, label=loss_name[i])
+        plt.fill_between(epochs, x_mean - x_std, x_mean + x_std, color=vp[0].get_color(), alpha=0.2)
     for i, y in enumerate(val_loss):
-        val_step = len(train_loss[i][0]) / len(val_loss[i][0])
-        vp = plt.plot(np.arange(len(np.mean(y, axis=0))) * val_step + val_step, np.mean(y, axis=0), alpha=0.85,
-                      label=val_loss_name[i])
-        plt.fill_between(np.arange(len(np.mean(y, axis=0))) * val_step + val_step,
-                         np.mean(y, axis=0) - np.std(y, axis=0),
-                         np.mean(y, axis=0) + np.std(y, axis=0), color=vp[0].get_color(), alpha=0.2
-                         )
-        plt.scatter([len(train_loss[i][0])], [np.mean(y, axis=0)[-1]],
+        y_mean, y_std = np.mean(y, axis=0), np.std(y, axis=0)
+        val_step = train_loss[i].shape[1] / y.shape[1]
+        val_epochs = np.arange(y.shape[1]) * val_step + val_step
+        vp = plt.plot(val_epochs, y_mean, alpha=0.85, linewidth=0.8, label=val_loss_name[i])
+        plt.fill_between(val_epochs, y_mean - y_std, y_mean + y_std, color=vp[0].get_color(), alpha=0.2)
+        plt.scatter([train_loss[i].shape[1]], [y_mean[-1]],
                     label=r"{0}: {1:0.4f} $\pm$ {2:0.4f} ".format(
-                        val_loss_name[i], np.mean(y, axis=0)[-1],
-                        np.std(y, axis=0)[-1]) + data_unit[i], color=vp[0].get_color()
+                        val_loss_name[i], y_mean[-1], y_std[-1]) + data_unit[i], color=vp[0].get_color()
                     )
     plt.xlabel('Epochs')
     plt.ylabel('Loss')
@@ -138,13 +129,14 @@ def plot_predict_true(y_predict, y_true, data_unit: list = None, model_name: str
     if dpi is None:
         dpi = 100.0
     fig = plt.figure(figsize=figsize, dpi=dpi)
+    # MAE of all targets at once, ignoring missing values.
+    mae_valid = np.nanmean(np.abs(y_true - y_predict), axis=0)
     for i in range(num_targets):
-        delta_valid = y_true[:, i] - y_predict[:, i]
-        mae_valid = np.mean(np.abs(delta_valid[~np.isnan(delta_valid)]))
         plt.scatter(y_predict[:, i], y_true[:, i], alpha=0.3,
-                    label=target_names[i] + " MAE: {0:0.4f} ".format(mae_valid) + "[" + data_unit[i] + "]")
-    min_max = np.amin(y_true[~np.isnan(y_true)]).astype("float"), np.amax(y_true[~np.isnan(y_true)]).astype("float")
-    plt.plot(np.arange(*min_max, 0.05), np.arange(*min_max, 0.05), color='red')
+                    label=target_names[i] + " MAE: {0:0.4f} ".format(mae_valid[i]) + "[" + data_unit[i] + "]")
+    # The diagonal only requires its end points.
+    min_max = [float(np.nanmin(y_true)), float(np.nanmax(y_true))]
+    plt.plot(min_max, min_max, color='red')
     plt.xlabel('Predicted')
     plt.ylabel('Actual')
     plot_title = "Prediction of %s for %s " % (model_name, dataset_name)
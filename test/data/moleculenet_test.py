@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+import unittest
+from kgcnn.data.moleculenet import MoleculeNetDataset, _attributes_cache_key, _save_value_lists, _load_value_lists
+
+# Includes a duplicate molecule and invalid smiles, which are kept as rows without molecule.
+TABLE = """index,name,label,smiles
+1,Propanolol,1,[Cl].CC(C)NCC(O)COc1cccc2ccccc12
+2,Terbutylchlorambucil,1,C(=O)(OC(C)(C)C)CCCc1ccc(cc1)N(CCCl)CCCl
+3,40730,1,c12c3c(N4CCN(C)CC4)c(F)cc1c(c(C(O)=O)cn2C(C)CO3)=O
+4,invalid,0,C1CC(
+5,24,1,C1CCN(CC1)Cc1cccc(c1)OCCCNC(=O)C
+6,Propanolol,1,[Cl].CC(C)NCC(O)COc1cccc2ccccc12
+7,15,1,O=N([O-])C1=C(CN=C1NCCSCc2ncccc2)Cc3ccccc3
+8,Y-G 14,1,n(ccc1)c(c1)CCNC
+"""
+
+
+class TestMoleculeNetDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.data_directory = tempfile.mkdtemp()
+        with open(os.path.join(self.data_directory, "molecules.csv"), "w") as f:
+            f.write(TABLE)
+        self._make_dataset().prepare_data(
+            overwrite=True, smiles_column_name="smiles", make_conformers=False, optimize_conformer=False,
+            num_workers=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_directory, ignore_errors=True)
+
+    def _make_dataset(self):
+        return MoleculeNetDataset(data_directory=self.data_directory, dataset_name="molecules",
+                                  file_name="molecules.csv", verbose=30)
+
+    def _assert_same_graphs(self, dataset, reference):
+        self.assertEqual(len(dataset), len(reference))
+        for graph, graph_ref in zip(dataset, reference):
+            self.assertEqual(sorted(graph.keys()), sorted(graph_ref.keys()))
+            for key in graph_ref.keys():
+                self.assertTrue(np.array_equal(graph[key], graph_ref[key]), msg=key)
+
+    def test_parallel_read_in_memory(self):
+        serial = self._make_dataset().read_in_memory(label_column_name="label", has_conformers=False, num_workers=1)
+        self.assertEqual(len(serial), 8)
+        self.assertTrue(serial[3].obtain_property("node_attributes") is None)
+        # Small batches to submit molecules and hand off duplicates in more than one batch.
+        parallel = self._make_dataset()
+        parallel._default_loop_update_info = 3
+        parallel.read_in_memory(label_column_name="label", has_conformers=False, num_workers=2)
+        self._assert_same_graphs(parallel, serial)
+
+    def test_attributes_cache(self):
+        reference = self._make_dataset().read_in_memory(label_column_name="label", has_conformers=False)
+        dataset = self._make_dataset()
+        stored = dataset.read_in_memory(label_column_name="label", has_conformers=False, use_attributes_cache=True)
+        self.assertTrue(os.path.exists(os.path.splitext(dataset.file_path_mol)[0] + ".attributes.npz"))
+        loaded = self._make_dataset().read_in_memory(
+            label_column_name="label", has_conformers=False, use_attributes_cache=True)
+        self._assert_same_graphs(stored, reference)
+        self._assert_same_graphs(loaded, reference)
+        # Different settings must not load the stored attributes.
+        reference = self._make_dataset().read_in_memory(
+            label_column_name="label", has_conformers=False, add_hydrogen=True)
+        loaded = self._make_dataset().read_in_memory(
+            label_column_name="label", has_conformers=False, add_hydrogen=True, use_attributes_cache=True)
+        self._assert_same_graphs(loaded, reference)
+
+    def test_attributes_cache_key(self):
+        file_path_mol = self._make_dataset().file_path_mol
+        settings = {"nodes": ["Symbol"], "add_hydrogen": False, "use_mol_supplier": False}
+        cache_key = _attributes_cache_key(file_path_mol, settings)
+        self.assertEqual(cache_key, _attributes_cache_key(file_path_mol, dict(settings)))
+        self.assertNotEqual(cache_key, _attributes_cache_key(file_path_mol, dict(settings, add_hydrogen=True)))
+        self.assertNotEqual(cache_key, _attributes_cache_key(file_path_mol, dict(settings, use_mol_supplier=True)))
+
+        value_lists = {
+            "graph_size": [np.array(3), None, np.array(2)],
+            "node_number": [np.array([6, 8, 1]), None, np.array([7, 1])],
+            "node_attributes": [np.ones((3, 2), dtype="float32"), None, np.zeros((2, 2), dtype="float32")]}
+        cache_path = os.path.join(self.data_directory, "molecules.attributes.npz")
+        self.assertTrue(_save_value_lists(cache_path, value_lists, cache_key))
+        loaded = _load_value_lists(cache_path, cache_key)
+        self.assertEqual(sorted(loaded.keys()), sorted(value_lists.keys()))
+        for name, values in value_lists.items():
+            self.assertEqual(len(loaded[name]), len(values))
+            for x, y in zip(loaded[name], values):
+                self.assertEqual(x is None, y is None, msg=name)
+                if y is not None:
+                    self.assertTrue(np.array_equal(x, y), msg=name)
+                    self.assertEqual(x.dtype, y.dtype, msg=name)
+
+        # Any change of the SDF file invalidates the cache.
+        with open(file_path_mol, "a") as f:
+            f.write("\n")
+        changed_key = _attributes_cache_key(file_path_mol, settings)
+        self.assertNotEqual(cache_key, changed_key)
+        self.assertTrue(_load_value_lists(cache_path, changed_key) is None)
+
+
+if __name__ == "__main__":
+
+    for test_name in ["test_parallel_read_in_memory", "test_attributes_cache", "test_attributes_cache_key"]:
+        test_case = TestMoleculeNetDataset(test_name)
+        test_case.setUp()
+        try:
+            getattr(test_case, test_name)()
+        finally:
+            test_case.tearDown()
+    print("Tests passed.")
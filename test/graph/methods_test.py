@@ -0,0 +1,143 @@
+import itertools
+import numpy as np
+import unittest
+from kgcnn.graph.methods import get_angle_indices, coordinates_to_distancematrix, define_adjacency_from_distance, \
+    range_neighbour_kdtree
+
+
+def get_angle_indices_loop(idx, check_sorted: bool = True, allow_multi_edges: bool = False,
+                           allow_self_edges: bool = False, allow_reverse_edges: bool = False,
+                           edge_pairing: str = "jk"):
+    # Reference of the previous implementation with a loop over all edges.
+    label_ij = np.expand_dims(np.arange(len(idx)), axis=-1)
+    pos_k = 0 if edge_pairing[0] == "k" else 1
+    pos_fix = 0 if edge_pairing[0] != "k" else 1
+    pos_ij = 0 if "i" in edge_pairing else 1
+
+    idx_ijk = []
+    idx_ij_k = []
+    for n, ij in enumerate(idx):
+        matching_edges = idx
+        matching_labels = label_ij
+        mask = matching_edges[:, pos_fix] == ij[pos_ij]
+        if not allow_multi_edges:
+            mask = np.logical_and(mask, np.logical_or(matching_edges[:, 0] != ij[0], matching_edges[:, 1] != ij[1]))
+        if not allow_reverse_edges:
+            mask = np.logical_and(mask, np.logical_or(matching_edges[:, 0] != ij[1], matching_edges[:, 1] != ij[0]))
+        if allow_self_edges:
+            mask[n] = True
+        else:
+            mask[n] = False
+        matching_edges, matching_labels = matching_edges[mask], matching_labels[mask]
+        if len(matching_edges) == 0:
+            idx_ijk.append(np.empty((0, 3), dtype=idx.dtype))
+            idx_ij_k.append(np.empty((0, 2), dtype=idx.dtype))
+            continue
+        combos_ik = np.concatenate(
+            [np.repeat([ij], len(matching_edges), axis=0), np.expand_dims(matching_edges[:, pos_k], axis=-1)], axis=-1)
+        combos_label = np.concatenate(
+            [np.repeat([[n]], len(matching_labels), axis=0), matching_labels], axis=-1)
+        idx_ijk.append(combos_ik)
+        idx_ij_k.append(combos_label)
+
+    idx_ijk = np.concatenate(idx_ijk, axis=0)
+    idx_ij_k = np.concatenate(idx_ij_k, axis=0)
+    if check_sorted:
+        order1 = np.argsort(idx_ij_k[:, 1], axis=0, kind='mergesort')
+        idx_ij_k = idx_ij_k[order1]
+        idx_ijk = idx_ijk[order1]
+        order2 = np.argsort(idx_ij_k[:, 0], axis=0, kind='mergesort')
+        idx_ijk = idx_ijk[order2]
+        idx_ij_k = idx_ij_k[order2]
+    return idx, idx_ijk, idx_ij_k
+
+
+class TestGetAngleIndices(unittest.TestCase):
+
+    # Includes self-loops, a multi-edge, reverse edges and node 5 without any edges.
+    edge_indices = np.array([[0, 0], [0, 1], [1, 0], [1, 2], [1, 2], [2, 1], [2, 3], [3, 3], [3, 4], [4, 3], [6, 4]],
+                            dtype="int64")
+
+    def _assert_same_as_loop(self, idx):
+        for edge_pairing, flags in itertools.product(
+                ["jk", "ik", "kj", "ki"], itertools.product([False, True], repeat=3)):
+            kwargs = dict(edge_pairing=edge_pairing, allow_multi_edges=flags[0], allow_self_edges=flags[1],
+                          allow_reverse_edges=flags[2])
+            for check_sorted in [True, False]:
+                _, idx_ijk, idx_ij_k = get_angle_indices(idx, check_sorted=check_sorted, **kwargs)
+                _, idx_ijk_ref, idx_ij_k_ref = get_angle_indices_loop(idx, check_sorted=check_sorted, **kwargs)
+                self.assertTrue(np.array_equal(idx_ijk, idx_ijk_ref), msg=str(kwargs))
+                self.assertTrue(np.array_equal(idx_ij_k, idx_ij_k_ref), msg=str(kwargs))
+
+    def test_correctness(self):
+        self._assert_same_as_loop(self.edge_indices)
+
+    def test_correctness_unsorted(self):
+        self._assert_same_as_loop(self.edge_indices[np.random.default_rng(0).permutation(len(self.edge_indices))])
+
+    def test_correctness_random(self):
+        rng = np.random.default_rng(42)
+        # Few nodes for many self-loops and multi-edges and some nodes without edges.
+        self._assert_same_as_loop(rng.integers(0, 15, size=(60, 2)).astype("int64"))
+
+    def test_empty(self):
+        _, idx_ijk, idx_ij_k = get_angle_indices(np.zeros((0, 2), dtype="int64"))
+        self.assertEqual(len(idx_ijk), 0)
+        self.assertEqual(len(idx_ij_k), 0)
+
+
+class TestCoordinatesToDistanceMatrix(unittest.TestCase):
+
+    def _assert_same_as_difference(self, coord, atol):
+        d = coordinates_to_distancematrix(coord)
+        diff = np.expand_dims(coord.astype("float64"), axis=-2) - np.expand_dims(coord.astype("float64"), axis=-3)
+        d_ref = np.sqrt(np.sum(np.square(diff), axis=-1))
+        self.assertEqual(d.shape, d_ref.shape)
+        self.assertTrue(np.allclose(d, d_ref, rtol=0.0, atol=atol), msg=str(np.max(np.abs(d - d_ref))))
+
+    def test_correctness(self):
+        coord = np.random.default_rng(0).normal(size=(2, 20, 3)) * 3.0
+        self._assert_same_as_difference(coord, atol=1e-10)
+
+    def test_correctness_off_origin_float32(self):
+        coord = (np.random.default_rng(1).normal(size=(20, 3)) * 3.0).astype("float32")
+        for offset in [100.0, 1000.0]:
+            self._assert_same_as_difference(coord + np.float32(offset), atol=1e-4)
+
+
+class TestRangeNeighbourKDTree(unittest.TestCase):
+
+    def _assert_same_as_dense(self, coord, **kwargs):
+        indices, dist = range_neighbour_kdtree(coord, **kwargs)
+        d = coordinates_to_distancematrix(coord)
+        _, indices_ref = define_adjacency_from_distance(d, **kwargs)
+        self.assertTrue(np.array_equal(indices, indices_ref), msg=str(kwargs))
+        self.assertTrue(np.allclose(dist, d[indices_ref[:, 0], indices_ref[:, 1]]), msg=str(kwargs))
+
+    def test_correctness(self):
+        rng = np.random.default_rng(7)
+        for _ in range(50):
+            coord = rng.uniform(0.0, 6.0, size=(int(rng.integers(1, 30)), 3))
+            for exclusive, self_loops in itertools.product([True, False], repeat=2):
+                for max_distance, max_neighbours in itertools.product(
+                        [None, np.inf, 2.0], [None, np.inf, 0, 4, 100]):
+                    self._assert_same_as_dense(coord, max_distance=max_distance, max_neighbours=max_neighbours,
+                                               exclusive=exclusive, self_loops=self_loops)
+
+    def test_empty(self):
+        indices, dist = range_neighbour_kdtree(np.zeros((0, 3)))
+        self.assertEqual(indices.shape, (0, 2))
+        self.assertEqual(len(dist), 0)
+
+
+if __name__ == "__main__":
+
+    TestGetAngleIndices().test_correctness()
+    TestGetAngleIndices().test_correctness_unsorted()
+    TestGetAngleIndices().test_correctness_random()
+    TestGetAngleIndices().test_empty()
+    TestCoordinatesToDistanceMatrix().test_correctness()
+    TestCoordinatesToDistanceMatrix().test_correctness_off_origin_float32()
+    TestRangeNeighbourKDTree().test_correctness()
+    TestRangeNeighbourKDTree().test_empty()
+    print("Tests passed.")
@@ -0,0 +1,116 @@
+import numpy as np
+import unittest
+from kgcnn.io.loader import tf_dataset_disjoint_generator
+
+
+def make_graphs(num_graphs: int = 23, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    graphs = []
+    for k in range(num_graphs):
+        num_nodes = int(rng.integers(1, 8))
+        # Also graphs without edges.
+        num_edges = int(rng.integers(0, 12)) if k % 5 != 0 else 0
+        graphs.append({
+            "node_attributes": rng.normal(size=(num_nodes, 3)).astype("float32"),
+            "edge_attributes": rng.normal(size=(num_edges, 2)).astype("float32"),
+            "edge_indices": rng.integers(0, num_nodes, size=(num_edges, 2)).astype("int64"),
+            "graph_attributes": rng.normal(size=(2,)).astype("float32"),
+        })
+    return graphs
+
+
+def reference_batch(graphs_batch, padded_sizes=None):
+    # Reference of the previous generator, which concatenated the arrays of each graph for every batch.
+    nodes = [g["node_attributes"] for g in graphs_batch]
+    edges = [g["edge_attributes"] for g in graphs_batch]
+    count_nodes = np.array([len(x) for x in nodes], dtype="int64")
+    count_edges = np.array([len(x) for x in edges], dtype="int64")
+    node_values = np.concatenate(nodes, axis=0)
+    edge_values = np.concatenate(edges, axis=0)
+    index_values = np.concatenate([g["edge_indices"] for g in graphs_batch], axis=0)
+    graph_values = np.array([g["graph_attributes"] for g in graphs_batch], dtype="float32")
+    if padded_sizes is not None:
+        pad_nodes = padded_sizes[0] - len(node_values) + 1
+        pad_edges = padded_sizes[1] - len(edge_values) + 1
+        node_values = np.pad(node_values, [(pad_nodes, 0), (0, 0)])
+        edge_values = np.pad(edge_values, [(pad_edges, 0), (0, 0)])
+        index_values = np.pad(index_values, [(pad_edges, 0), (0, 0)])
+        graph_values = np.pad(graph_values, [(1, 0), (0, 0)])
+        count_nodes = np.concatenate([[pad_nodes], count_nodes], axis=0)
+        count_edges = np.concatenate([[pad_edges], count_edges], axis=0)
+    batch_id_node = np.repeat(np.arange(len(count_nodes)), count_nodes)
+    batch_id_edge = np.repeat(np.arange(len(count_edges)), count_edges)
+    node_id = np.concatenate([np.arange(x) for x in count_nodes], axis=0)
+    edge_id = np.concatenate([np.arange(x) for x in count_edges], axis=0)
+    offsets = np.repeat(np.cumsum(count_nodes) - count_nodes, count_edges)
+    disjoint_indices = np.transpose(index_values + np.expand_dims(offsets, axis=-1))
+    return [node_values, edge_values, disjoint_indices, batch_id_node, batch_id_edge, node_id, edge_id, count_nodes,
+            count_edges, graph_values]
+
+
+class TestDisjointGenerator(unittest.TestCase):
+
+    inputs = [
+        {"shape": (3,), "name": "node_attributes", "dtype": "float32"},
+        {"shape": (2,), "name": "edge_attributes", "dtype": "float32"},
+        {"shape": (None,), "name": "edge_indices", "dtype": "int64"},
+        {"shape": (), "name": "batch_id_node", "dtype": "int64"},
+        {"shape": (), "name": "batch_id_edge", "dtype": "int64"},
+        {"shape": (), "name": "node_id", "dtype": "int64"},
+        {"shape": (), "name": "edge_id", "dtype": "int64"},
+        {"shape": (), "name": "count_nodes", "dtype": "int64"},
+        {"shape": (), "name": "count_edges", "dtype": "int64"},
+        {"shape": (2,), "name": "graph_attributes", "dtype": "float32"},
+    ]
+    batch_size = 5
+
+    def _make_loader(self, graphs, **kwargs):
+        return tf_dataset_disjoint_generator(
+            graphs, inputs=self.inputs, batch_size=self.batch_size, shuffle=False, epochs=1,
+            assignment_to_id=[0, 1, 1], assignment_of_indices=[None, None, 0],
+            pos_batch_id=[3, 4], pos_subgraph_id=[5, 6], pos_count=[7, 8], **kwargs)
+
+    def _assert_batches_equal(self, loader, expected_batches):
+        found_batches = [[np.asarray(x) for x in batch] for batch in loader]
+        self.assertEqual(len(found_batches), len(expected_batches))
+        for found, expected in zip(found_batches, expected_batches):
+            self.assertEqual(len(found), len(expected))
+            for x, y in zip(found, expected):
+                self.assertEqual(x.shape, y.shape)
+                self.assertTrue(np.allclose(x, y))
+
+    def _batches(self, graphs):
+        return [graphs[i:i + self.batch_size] for i in range(0, len(graphs), self.batch_size)]
+
+    def test_correctness(self):
+        graphs = make_graphs()
+        expected = [reference_batch(x) for x in self._batches(graphs)]
+        self._assert_batches_equal(self._make_loader(graphs), expected)
+
+    def test_correctness_padded(self):
+        graphs = make_graphs()
+        batches = self._batches(graphs)
+        max_nodes = max([sum([len(g["node_attributes"]) for g in x]) for x in batches])
+        max_edges = max([sum([len(g["edge_attributes"]) for g in x]) for x in batches])
+        expected = [reference_batch(x, padded_sizes=(max_nodes, max_edges)) for x in batches]
+        self._assert_batches_equal(self._make_loader(graphs, padded_disjoint=True), expected)
+
+    def test_correctness_padded_buckets(self):
+        graphs = make_graphs()
+        batches = self._batches(graphs)
+        num_nodes = [sum([len(g["node_attributes"]) for g in x]) for x in batches]
+        num_edges = [sum([len(g["edge_attributes"]) for g in x]) for x in batches]
+        buckets_nodes = np.unique(np.ceil(np.linspace(0, max(num_nodes), 4)[1:]).astype("int64"))
+        buckets_edges = np.unique(np.ceil(np.linspace(0, max(num_edges), 4)[1:]).astype("int64"))
+        expected = [reference_batch(x, padded_sizes=(
+            buckets_nodes[np.searchsorted(buckets_nodes, n)], buckets_edges[np.searchsorted(buckets_edges, m)]))
+            for x, n, m in zip(batches, num_nodes, num_edges)]
+        self._assert_batches_equal(self._make_loader(graphs, padded_disjoint=True, padded_buckets=3), expected)
+
+
+if __name__ == "__main__":
+
+    TestDisjointGenerator().test_correctness()
+    TestDisjointGenerator().test_correctness_padded()
+    TestDisjointGenerator().test_correctness_padded_buckets()
+    print("Tests passed.")
@@ -17,6 +17,22 @@ class TestAggregateLocalEdges(TestCase):
         nodes_aggr = layer([self.node_attr, self.edge_attr, ops.cast(self.edge_index, dtype="int64")])
         expected_output = np.array([[0., 1., 0.], [1., 1., 2.], [2., 1., 0.], [2., 1., 2.]])
         self.assertAllClose(nodes_aggr, expected_output)
+        # Numpy reference.
+        expected_reference = np.zeros((4, 3))
+        np.add.at(expected_reference, self.edge_index[1], self.edge_attr)
+        self.assertAllClose(nodes_aggr, expected_reference)
+
+    def test_correctness_random(self):
+        rng = np.random.default_rng(seed=42)
+        num_nodes, num_edges = 100, 1000
+        node_attr = rng.normal(size=(num_nodes, 2))
+        edge_attr = rng.normal(size=(num_edges, 3))
+        edge_index = rng.integers(0, num_nodes, size=(2, num_edges), dtype="int64")
+        layer = AggregateLocalEdges(pooling_index=0)
+        nodes_aggr = layer([node_attr, edge_attr, ops.cast(edge_index, dtype="int64")])
+        expected_reference = np.zeros((num_nodes, 3))
+        np.add.at(expected_reference, edge_index[0], edge_attr)
+        self.assertAllClose(nodes_aggr, expected_reference)
 
     def test_correctness_mean(self):
         layer = AggregateLocalEdges(pooling_method="mean", pooling_index=0)
@@ -24,6 +40,14 @@ class TestAggregateLocalEdges(TestCase):
         expected_output = np.array([[0., 0., 0.5], [0.5, 1., 0.5], [1., 0., 0.5], [1., 1., 0.5]])
         self.assertAllClose(nodes_aggr, expected_output)
 
+    def test_correctness_sorted(self):
+        # First index is sorted, so that segment reductions must match the scatter reductions.
+        for method in ["sum", "mean", "max", "min"]:
+            layer = AggregateLocalEdges(pooling_method="scatter_%s" % method, pooling_index=0)
+            layer_sorted = AggregateLocalEdges(pooling_method="segment_%s" % method, pooling_index=0)
+            inputs = [self.node_attr, self.edge_attr, ops.cast(self.edge_index, dtype="int64")]
+            self.assertAllClose(layer_sorted(inputs), layer(inputs))
+
 
 class TestAggregateLocalEdgesAttention(TestCase):
     node_attr = np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]])
@@ -44,9 +68,18 @@ class TestAggregateLocalEdgesAttention(TestCase):
 
         self.assertAllClose(nodes_aggr, expected_output)
 
+    def test_correctness_sorted(self):
+        layer = AggregateLocalEdgesAttention(pooling_index=1)
+        layer_sorted = AggregateLocalEdgesAttention(pooling_index=1, is_sorted=True)
+        inputs = [self.node_attr, self.edge_attr, self.edge_att, ops.cast(self.edge_index, dtype="int64")]
+        self.assertAllClose(layer_sorted(inputs), layer(inputs))
+
 
 if __name__ == "__main__":
     TestAggregateLocalEdges().test_correctness()
+    TestAggregateLocalEdges().test_correctness_random()
     TestAggregateLocalEdges().test_correctness_mean()
+    TestAggregateLocalEdges().test_correctness_sorted()
     TestAggregateLocalEdgesAttention().test_correctness()
+    TestAggregateLocalEdgesAttention().test_correctness_sorted()
     print("Tests passed.")
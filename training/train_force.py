@@ -84,8 +84,8 @@ postfix_file = hyper["info"]["postfix_file"]
 if "cross_validation" in hyper["training"]:
     from sklearn.model_selection import KFold
     splitter = KFold(**hyper["training"]["cross_validation"]["config"])
-    train_test_indices = [
-        (train_index, test_index) for train_index, test_index in splitter.split(X=np.zeros((data_length, 1)))]
+    # KFold only requires the number of samples, which is given by an empty array without columns.
+    train_test_indices = list(splitter.split(X=np.empty((data_length, 0), dtype="int8")))
 else:
     train_test_indices_kwargs = hyper[
         "training"]["train_test_indices"] if "train_test_indices" in hyper["training"] else {}
@@ -221,8 +221,10 @@ for current_split, (train_index, test_index) in enumerate(train_test_indices):
     splits_done = splits_done + 1
 
 # Save original data indices of the splits.
-np.savez(os.path.join(filepath, f"{hyper.model_name}_test_indices_{postfix_file}.npz"), *test_indices_all)
-np.savez(os.path.join(filepath, f"{hyper.model_name}_train_indices_{postfix_file}.npz"), *train_indices_all)
+np.savez_compressed(
+    os.path.join(filepath, f"{hyper.model_name}_test_indices_{postfix_file}.npz"), *test_indices_all)
+np.savez_compressed(
+    os.path.join(filepath, f"{hyper.model_name}_train_indices_{postfix_file}.npz"), *train_indices_all)
 
 # Plot training- and test-loss vs epochs for all splits.
 data_unit = hyper["data"]["data_unit"] if "data_unit" in hyper["data"] else ""
@@ -1,4 +1,9 @@
 import os
+import gc
+import json
+import hashlib
+import matplotlib as mpl
+mpl.use("Agg")  # Plots are only saved to file, also on headless machines.
 import keras as ks
 import numpy as np
 import argparse
@@ -14,9 +19,10 @@ from kgcnn.data.transform.scaler.serial import deserialize as deserialize_scaler
 from kgcnn.utils.plots import plot_train_test_loss, plot_predict_true
 from kgcnn.models.serial import deserialize as deserialize_model
 from kgcnn.data.serial import deserialize as deserialize_dataset
+from kgcnn.data.base import MemoryGraphDataset
 from kgcnn.training.hyper import HyperParameter
 from kgcnn.utils.devices import check_device, set_cuda_device
-from kgcnn.data.utils import save_pickle_file
+from kgcnn.data.utils import save_pickle_file, save_json_file, load_json_file
 
 # Input arguments from command line with default values from example.
 # From command line, one can specify the model, dataset and the hyperparameter which contain all configuration
@@ -31,6 +37,8 @@ parser.add_argument("--make", required=False, help="Name of the class for model.
 parser.add_argument("--gpu", required=False, help="GPU index used for training.", default=None, nargs="+", type=int)
 parser.add_argument("--fold", required=False, help="Split or fold indices to run.", default=None, nargs="+", type=int)
 parser.add_argument("--seed", required=False, help="Set random seed.", default=42, type=int)
+parser.add_argument("--cache", required=False, help="Directory to cache the cleaned dataset.", default=None,
+                    nargs="?", const=os.path.join(os.path.expanduser("~"), ".kgcnn", "cache"))
 args = vars(parser.parse_args())
 print("Input of argparse:", args)
 
@@ -52,16 +60,59 @@ hyper.verify()
 
 # Loading a specific per-defined dataset from a module in kgcnn.data.datasets.
 # Those sub-classed classes are named after the dataset like e.g. `ESOLDataset`
-dataset = deserialize_dataset(hyper["dataset"])
+# With `--cache` the cleaned dataset is stored in the cache directory, keyed by a hash of the dataset and input
+# config. Later runs with the same config load the cleaned graphs without creating the dataset class, as long as
+# the source files of the dataset have not changed.
+def source_file_stats(ds):
+    """Modification time and size of the files a dataset is read from."""
+    paths = []
+    if getattr(ds, "file_name", None) is not None:
+        paths.append(ds.file_path)
+        if hasattr(ds, "file_path_mol"):
+            paths.append(ds.file_path_mol)
+    if getattr(ds, "file_directory", None) is not None:
+        paths.append(ds.file_directory_path)
+    return {p: [os.stat(p).st_mtime_ns, os.stat(p).st_size] for p in paths if p is not None and os.path.exists(p)}
 
-# Check if dataset has the required properties for model input. This includes a quick shape comparison.
-# The name of the keras `Input` layer of the model is directly connected to property of the dataset.
-# Example 'edge_indices' or 'node_attributes'. This couples the keras model to the dataset.
-dataset.assert_valid_model_input(hyper["model"]["config"]["inputs"])
 
-# Filter the dataset for invalid graphs. At the moment invalid graphs are graphs which do not have the property set,
-# which is required by the model's input layers, or if a tensor-like property has zero length.
-dataset.clean(hyper["model"]["config"]["inputs"])
+# Attributes of the dataset that are used by this script besides the graphs.
+cached_attributes = ["data_directory", "dataset_name", "file_name", "file_directory", "label_names", "label_units",
+                     "data_unit", "data_keys"]
+dataset, cache_file = None, None
+if args["cache"] is not None:
+    cache_key = hashlib.sha1(json.dumps(
+        [hyper["dataset"], hyper["model"]["config"]["inputs"]], sort_keys=True, default=str).encode()).hexdigest()
+    cache_file = os.path.join(args["cache"], "%s_%s" % (hyper.dataset_class, cache_key[:16]))
+    if os.path.exists(cache_file + ".npz") and os.path.exists(cache_file + ".json"):
+        cache_info = load_json_file(cache_file + ".json")
+        if all([os.path.exists(p) and [os.stat(p).st_mtime_ns, os.stat(p).st_size] == stats
+                for p, stats in cache_info["source_files"].items()]):
+            print("Load cleaned dataset from cache '%s'." % cache_file)
+            dataset = MemoryGraphDataset(**{key: cache_info["attributes"].get(key) for key in [
+                "data_directory", "dataset_name", "file_name", "file_directory"]})
+            dataset.load(cache_file + ".npz")
+            for key, value in cache_info["attributes"].items():
+                setattr(dataset, key, value)
+
+if dataset is None:
+    dataset = deserialize_dataset(hyper["dataset"])
+
+    # Check if dataset has the required properties for model input. This includes a quick shape comparison.
+    # The name of the keras `Input` layer of the model is directly connected to property of the dataset.
+    # Example 'edge_indices' or 'node_attributes'. This couples the keras model to the dataset.
+    dataset.assert_valid_model_input(hyper["model"]["config"]["inputs"])
+
+    # Filter the dataset for invalid graphs. At the moment invalid graphs are graphs which do not have the property
+    # set, which is required by the model's input layers, or if a tensor-like property has zero length.
+    dataset.clean(hyper["model"]["config"]["inputs"])
+
+    if cache_file is not None:
+        os.makedirs(args["cache"], exist_ok=True)
+        dataset.save(cache_file + ".npz", file_format="npz")
+        save_json_file({
+            "source_files": source_file_stats(dataset),
+            "attributes": {key: getattr(dataset, key) for key in cached_attributes if hasattr(dataset, key)}
+        }, cache_file + ".json", default=str)
 data_length = len(dataset)  # Length of the cleaned dataset.
 
 # Make output directory. This can further be adapted in hyperparameter.
@@ -81,15 +132,31 @@ label_names, label_units = dataset.set_multi_target_labels(
 if "cross_validation" in hyper["training"]:
     from sklearn.model_selection import KFold
     splitter = KFold(**hyper["training"]["cross_validation"]["config"])
-    train_test_indices = [
-        (train_index, test_index) for train_index, test_index in splitter.split(X=np.zeros((data_length, 1)))]
+    # KFold only requires the number of samples, which is given by an empty array without columns.
+    train_test_indices = list(splitter.split(X=np.empty((data_length, 0), dtype="int8")))
 else:
     train_test_indices = dataset.get_train_test_indices(train="train", test="test")
 train_indices_all, test_indices_all = [], []
 
+# Input tensors of the full dataset are made only once and then indexed for each split.
+# A dataset transformed by a scaler still requires to make the tensors for each split.
+model_inputs = hyper["model"]["config"]["inputs"]
+use_full_tensor = isinstance(model_inputs, (list, tuple))
+x_all, y_all = None, None
+
+
+def take_split(x, index):
+    """Pick samples of a split from padded numpy array or ragged tensor (tensorflow only)."""
+    if isinstance(x, np.ndarray):
+        return x[index]
+    import tensorflow as tf
+    return tf.gather(x, np.asarray(index, dtype="int32"), axis=0)
+
+
 # Run splits.
 execute_folds = args["fold"] if "execute_folds" not in hyper["training"] else hyper["training"]["execute_folds"]
 model, current_split, scaled_predictions = None, None, False
+initial_weights = None
 for current_split, (train_index, test_index) in enumerate(train_test_indices):
 
     # Keep list of train/test indices.
@@ -104,8 +171,12 @@ for current_split, (train_index, test_index) in enumerate(train_test_indices):
 
     dataset_train, dataset_test = dataset[train_index], dataset[test_index]
 
-    # Make the model for current split using model kwargs from hyperparameter.
-    model = deserialize_model(hyper["model"])
+    # Make the model once using model kwargs from hyperparameter. For further splits, the model is reset to its
+    # initial weights instead of being rebuilt. The optimizer is newly created when compiling.
+    if model is None:
+        model = deserialize_model(hyper["model"])
+    else:
+        model.set_weights(initial_weights)
 
     # Adapt output-scale via a transform.
     # Scaler is applied to target if 'scaler' appears in hyperparameter. Only use for regression.
@@ -123,10 +194,13 @@ for current_split, (train_index, test_index) in enumerate(train_test_indices):
             dataset_test = scaler.transform_dataset(dataset_test, copy_dataset=True, copy=True)
             # If scaler was used we add rescaled standard metrics to compile, since otherwise the keras history will not
             # directly log the original target values, but the scaled ones.
+            # Scale of shape (1, n_properties) is converted once and shared by both metrics.
             scaler_scale = scaler.get_scaling()
-            mae_metric = ScaledMeanAbsoluteError(scaler_scale.shape, name="scaled_mean_absolute_error")
-            rms_metric = ScaledRootMeanSquaredError(scaler_scale.shape, name="scaled_root_mean_squared_error")
+            scaling_shape = scaler_scale.shape if scaler_scale is not None else ()
+            mae_metric = ScaledMeanAbsoluteError(scaling_shape, name="scaled_mean_absolute_error")
+            rms_metric = ScaledRootMeanSquaredError(scaling_shape, name="scaled_root_mean_squared_error")
             if scaler_scale is not None:
+                scaler_scale = ks.ops.convert_to_tensor(scaler_scale, dtype=mae_metric.scale.dtype)
                 mae_metric.set_scale(scaler_scale)
                 rms_metric.set_scale(scaler_scale)
             scaled_metrics = [mae_metric, rms_metric]
@@ -136,10 +210,22 @@ for current_split, (train_index, test_index) in enumerate(train_test_indices):
         scaler.save(os.path.join(filepath, f"scaler{postfix_file}_fold_{current_split}"))
 
     # Pick train/test data.
-    x_train = dataset_train.tensor(hyper["model"]["config"]["inputs"])
-    y_train = np.array(dataset_train.get("graph_labels"))
-    x_test = dataset_test.tensor(hyper["model"]["config"]["inputs"])
-    y_test = np.array(dataset_test.get("graph_labels"))
+    if use_full_tensor and not scaled_predictions:
+        if x_all is None:
+            x_all = dataset.tensor(model_inputs)
+            y_all = np.array(dataset.get("graph_labels"))
+            if np.issubdtype(y_all.dtype, np.floating):
+                y_all = y_all.astype("float32")
+        x_train, y_train = [take_split(x, train_index) for x in x_all], y_all[train_index]
+        x_test, y_test = [take_split(x, test_index) for x in x_all], y_all[test_index]
+    else:
+        x_train = dataset_train.tensor(model_inputs)
+        y_train = np.array(dataset_train.get("graph_labels"))
+        x_test = dataset_test.tensor(model_inputs)
+        y_test = np.array(dataset_test.get("graph_labels"))
+        # Single precision labels as for model output, if labels are not given as integer classes.
+        if np.issubdtype(y_train.dtype, np.floating):
+            y_train, y_test = y_train.astype("float32"), y_test.astype("float32")
 
     # Compile model with optimizer and loss from hyperparameter.
     # The metrics from this script is added to the hyperparameter entry for metrics.
@@ -149,23 +235,39 @@ for current_split, (train_index, test_index) in enumerate(train_test_indices):
     model.predict(x_test, batch_size=2, steps=2)
     model._compile_metrics.build(y_test, y_test)
     model._compile_loss.build(y_test, y_test)
+    if initial_weights is None:
+        initial_weights = model.get_weights()
 
-    # Model summary
-    model.summary()
-    print(" Compiled with jit: %s" % model._jit_compile)  # noqa
-    print(" Model is built: %s, with unbuilt: %s" % (
-        all([layer.built for layer in model._flatten_layers()]),  # noqa
-        [layer.name for layer in model._flatten_layers() if not layer.built]
-    ))
+        # Model summary, only once since the model is reused for all splits.
+        model.summary()
+        print(" Compiled with jit: %s" % model._jit_compile)  # noqa
+        print(" Model is built: %s, with unbuilt: %s" % (
+            all([layer.built for layer in model._flatten_layers()]),  # noqa
+            [layer.name for layer in model._flatten_layers() if not layer.built]
+        ))
 
     # Run keras model-fit and take time for training.
-    start = time.time()
+    # With 'profile' in hyper info, a trace of each fold is written for tensorboard (tensorflow backend only).
+    use_profiler = hyper["info"].get("profile", False) and ks.backend.backend() == "tensorflow"
+    if use_profiler:
+        import tensorflow as tf
+        tf.profiler.experimental.start(os.path.join(filepath, f"profile{postfix_file}_fold_{current_split}"))
+    # Epoch logs are streamed to a csv file, so that a fold can be monitored while training.
+    # With 'backup' in hyper info, the training state is backed up each epoch, so that an interrupted fold resumes
+    # from the last epoch when the script is restarted. The backup is deleted after the fold has finished.
+    fit_callbacks = [ks.callbacks.CSVLogger(os.path.join(filepath, f"log{postfix_file}_fold_{current_split}.csv"))]
+    if hyper["info"].get("backup", False):
+        fit_callbacks.append(ks.callbacks.BackupAndRestore(
+            backup_dir=os.path.join(filepath, f"backup{postfix_file}_fold_{current_split}")))
+    start = time.perf_counter()
     hist = model.fit(
         x_train, y_train,
         validation_data=(x_test, y_test),
-        **hyper.fit()
+        **hyper.fit(callbacks=fit_callbacks)
     )
-    stop = time.time()
+    stop = time.perf_counter()
+    if use_profiler:
+        tf.profiler.experimental.stop()
     print("Print Time for training: '%s'." % str(timedelta(seconds=stop - start)))
 
     # Save history for this fold.
@@ -175,7 +277,7 @@ for current_split, (train_index, test_index) in enumerate(train_test_indices):
 
     # Plot prediction for the last split.
     # Note that predicted values will not be rescaled.
-    predicted_y = model.predict(x_test)
+    predicted_y = model.predict(x_test, batch_size=hyper["training"]["fit"].get("batch_size"), verbose=0)
     true_y = y_test
 
     # Plotting the prediction vs. true test targets for last split. Note for classification this is also done but
@@ -192,6 +294,10 @@ for current_split, (train_index, test_index) in enumerate(train_test_indices):
     # Save last keras-model to output-folder.
     model.save_weights(os.path.join(filepath, f"model{postfix_file}_fold_{current_split}.weights.h5"))
 
+    # Release data of this split before the next one. The model is kept and reset to its initial weights.
+    del dataset_train, dataset_test, x_train, y_train, x_test, y_test, hist, predicted_y, true_y
+    gc.collect()
+
 # Plot training- and test-loss vs epochs for all splits.
 history_list = load_history_list(os.path.join(filepath, f"history{postfix_file}_fold_(i).pickle"), current_split + 1)
 plot_train_test_loss(history_list, loss_name=None, val_loss_name=None,
@@ -199,8 +305,10 @@ plot_train_test_loss(history_list, loss_name=None, val_loss_name=None,
                      filepath=filepath, file_name=f"loss{postfix_file}.png")
 
 # Save original data indices of the splits.
-np.savez(os.path.join(filepath, f"{hyper.model_name}_test_indices_{postfix_file}.npz"), *test_indices_all)
-np.savez(os.path.join(filepath, f"{hyper.model_name}_train_indices_{postfix_file}.npz"), *train_indices_all)
+np.savez_compressed(
+    os.path.join(filepath, f"{hyper.model_name}_test_indices_{postfix_file}.npz"), *test_indices_all)
+np.savez_compressed(
+    os.path.join(filepath, f"{hyper.model_name}_train_indices_{postfix_file}.npz"), *train_indices_all)
 
 # Save hyperparameter again, which were used for this fit. Format is '.json'
 # If non-serialized parameters were in the hyperparameter config file, this operation may fail.
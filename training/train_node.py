@@ -137,8 +137,10 @@ model.save(os.path.join(filepath, f"model{postfix_file}.keras"))
 model.save_weights(os.path.join(filepath, f"model{postfix_file}.weights.h5"))
 
 # Save original data indices of the splits.
-np.savez(os.path.join(filepath, f"{hyper.model_name}_test_indices_{postfix_file}.npz"), *test_indices_all)
-np.savez(os.path.join(filepath, f"{hyper.model_name}_train_indices_{postfix_file}.npz"), *train_indices_all)
+np.savez_compressed(
+    os.path.join(filepath, f"{hyper.model_name}_test_indices_{postfix_file}.npz"), *test_indices_all)
+np.savez_compressed(
+    os.path.join(filepath, f"{hyper.model_name}_train_indices_{postfix_file}.npz"), *train_indices_all)
 
 # Save hyperparameter again, which were used for this fit.
 hyper.save(os.path.join(filepath, f"{hyper.model_name}_hyper{postfix_file}.json"))